@@ -0,0 +1,100 @@
+"""
+Benchmark for the sprint assignment engine on synthetic backlogs.
+
+Usage:
+    python -m benchmarks.assignment_benchmark --issues 50000 --users 500
+    python -m benchmarks.assignment_benchmark --issues 100 1000 10000 --users 50 --strategies greedy optimal
+
+Reports wall time, makespan (the busiest user's estimated days), the spread of story points per user, the total
+points assigned, how many issues had their points clamped to the assignee's STORY_POINT_LIMITS and how many went
+to a user whose skill_category does not match the skill inferred from the title.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.schemas.jira_schema import JiraIssueResponse
+from src.schemas.sprint_schema import UserSkillAnalysis
+from src.services.assignment_engine import AssignmentEngine
+from src.services.sprint_config import SprintConfig
+
+ROLES = ["frontend developer", "backend developer", "fullstack developer", "qa engineer"]
+SKILLS = {"frontend developer": "frontend", "backend developer": "backend",
+          "fullstack developer": "fullstack", "qa engineer": "testing"}
+TITLES = ["Build login UI", "Add API endpoint", "Write integration tests", "Fix dashboard layout",
+          "Migrate backend service", "Refactor frontend state"]
+
+
+def synthetic_users(count: int, rng: random.Random):
+    users = []
+    for n in range(count):
+        tickets = rng.choice([rng.randint(0, 14), rng.randint(15, 39), rng.randint(40, 80)])
+        level = "senior" if tickets >= 40 else "junior" if tickets >= 15 else "intern"
+        role = rng.choice(ROLES)
+        users.append(UserSkillAnalysis(
+            user_id=n, username=f"user{n}", role=role, team="bench", tickets_solved=tickets,
+            skill_category=SKILLS[role], experience_level=level,
+            capacity_score=min(tickets * 2 + 10, 100.0)
+        ))
+    return users
+
+
+def synthetic_issues(count: int, rng: random.Random):
+    return [
+        JiraIssueResponse(
+            key=f"BENCH-{n}", title=rng.choice(TITLES), description="", status="To Do", due_date=None,
+            story_points=rng.choice(SprintConfig.FIBONACCI_POINTS)
+        ) for n in range(count)
+    ]
+
+
+def evaluate(assignments, users, issues):
+    days, points = defaultdict(int), defaultdict(int)
+    original = {issue.key: issue.story_points for issue in issues}
+    skills = {u.username: u.skill_category for u in users}
+    clamped = mismatched = 0
+    for a in assignments:
+        days[a.assignee_name] += a.estimated_days
+        points[a.assignee_name] += a.story_points
+        clamped += a.story_points != original[a.issue_key]
+        skill = AssignmentEngine.infer_skill(a.title)
+        mismatched += bool(skill) and skills[a.assignee_name] not in (skill, "fullstack")
+    per_user = [points.get(u.username, 0) for u in users]
+    return max(days.values(), default=0), min(per_user), max(per_user), sum(per_user), clamped, mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--issues", type=int, nargs="+", default=[50000])
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--strategies", nargs="+", choices=["greedy", "optimal"], default=["greedy"])
+    parser.add_argument("--time-budget", type=float, default=30.0, help="optimal solver budget in seconds")
+    args = parser.parse_args()
+
+    print(f"{'issues':>8} {'users':>6} {'strategy':>9} {'seconds':>9} {'makespan':>9} {'min pts':>8} {'max pts':>8} "
+          f"{'total pts':>10} {'clamped':>8} {'skill mismatches':>17}")
+    for issue_count in args.issues:
+        rng = random.Random(args.seed)
+        users = synthetic_users(args.users, rng)
+        issues = synthetic_issues(issue_count, rng)
+
+        for strategy in args.strategies:
+            started = time.perf_counter()
+            if strategy == "optimal":
+                assignments = AssignmentEngine.assign_optimal(issues, users, "Bench Sprint", args.time_budget)
+            else:
+                assignments = AssignmentEngine.assign(issues, users, "Bench Sprint")
+            elapsed = time.perf_counter() - started
+            makespan, min_pts, max_pts, total_pts, clamped, mismatched = evaluate(assignments, users, issues)
+            print(f"{issue_count:>8} {args.users:>6} {strategy:>9} {elapsed:>9.3f} {makespan:>9} {min_pts:>8} {max_pts:>8} "
+                  f"{total_pts:>10} {clamped:>8} {mismatched:>17}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark for the Monte Carlo sprint forecast's simulation core.
+
+Usage:
+    python -m benchmarks.forecast_benchmark
+    python -m benchmarks.forecast_benchmark --trials 10000 100000 --tasks 1000 --users 50
+
+Reports wall time of simulating every trial and reducing it to completion probabilities and per-user overrun risk.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The simulation never touches the database or OpenAI, but importing the services builds both clients
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("OPENAI_API_KEY", "unused")
+
+from src.services.forecast_service import ForecastService
+from src.services.sprint_config import SprintConfig
+
+
+def synthetic_sprint(tasks: int, users: int, rng: np.random.Generator):
+    levels = rng.choice(list(SprintConfig.FORECAST_DURATION_SIGMA), size=users)
+    task_users = np.sort(rng.integers(0, users, size=tasks))
+    points = rng.choice(list(SprintConfig.DAYS_MAPPING), size=tasks)
+    median_days = np.array([
+        SprintConfig.DAYS_MAPPING[p] * SprintConfig.EXPERIENCE_MULTIPLIERS[levels[u]] for p, u in zip(points, task_users)
+    ])
+    sigma = np.array([SprintConfig.FORECAST_DURATION_SIGMA[levels[u]] for u in task_users], dtype=np.float32)
+    user_starts = np.flatnonzero(np.r_[True, task_users[1:] != task_users[:-1]])
+    return np.log(median_days).astype(np.float32), sigma, user_starts
+
+
+def run(trials: int, tasks: int, users: int, seed: int) -> float:
+    rng = np.random.default_rng(seed)
+    mu, sigma, user_starts = synthetic_sprint(tasks, users, rng)
+
+    start = time.perf_counter()
+    user_days = ForecastService._simulate_user_days(mu, sigma, user_starts, trials, rng)
+    finish_days = np.sort(user_days.max(axis=1))
+    np.searchsorted(finish_days, np.arange(1, 61), side="right")
+    (user_days > SprintConfig.SPRINT_WORKING_DAYS).mean(axis=0)
+    np.quantile(user_days, [0.5, 0.9], axis=0)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, nargs="+", default=[10000])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'trials':>8} {'tasks':>7} {'users':>6} {'seconds':>9}")
+    for trials in args.trials:
+        for tasks in args.tasks:
+            elapsed = run(trials, tasks, args.users, args.seed)
+            print(f"{trials:>8} {tasks:>7} {args.users:>6} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
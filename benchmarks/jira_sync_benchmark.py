@@ -0,0 +1,109 @@
+"""
+Throughput benchmark for JiraService.sync_all_issues against a local stand-in Jira server.
+
+Usage:
+    python -m benchmarks.jira_sync_benchmark --issues 20000 --latency-ms 80 --concurrency 1 4 8 16
+
+The stand-in server implements just enough of /rest/api/3/search (startAt, maxResults, total)
+and adds a fixed per-request latency to mimic the WAN round trip to Jira Cloud.
+Issues are synced into a throwaway SQLite database.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI
+
+
+def build_stand_in_jira(total_issues: int, latency_ms: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/rest/api/3/search")
+    async def search(jql: str, startAt: int = 0, maxResults: int = 50, fields: str = ""):
+        await asyncio.sleep(latency_ms / 1000)
+        project_key = jql.split("=", 1)[1].split()[0]
+        end = min(startAt + maxResults, total_issues)
+        issues = [
+            {
+                "key": f"{project_key}-{n}",
+                "fields": {
+                    "summary": f"Benchmark issue {n}",
+                    "description": {
+                        "type": "doc",
+                        "content": [{"type": "paragraph", "content": [{"type": "text", "text": "lorem ipsum " * 20}]}]
+                    },
+                    "priority": {"name": "Medium"},
+                    "customfield_10016": None,
+                    "assignee": None,
+                    "status": {"name": "To Do"},
+                    "duedate": None,
+                    "updated": "2024-01-15T10:23:45.123+0000"
+                }
+            } for n in range(startAt + 1, end + 1)
+        ]
+        return {"startAt": startAt, "maxResults": maxResults, "total": total_issues, "issues": issues}
+
+    return app
+
+
+def start_server(app: FastAPI) -> str:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--issues", type=int, default=20000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency-ms", type=int, default=80)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--rate-limit", type=float, default=1000, help="client-side requests/second")
+    args = parser.parse_args()
+
+    db_dir = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(db_dir, 'bench.db')}"
+    os.environ["JIRA_URL"] = start_server(build_stand_in_jira(args.issues, args.latency_ms))
+    os.environ["JIRA_PAGE_SIZE"] = str(args.page_size)
+    os.environ["JIRA_RATE_LIMIT_PER_SECOND"] = str(args.rate_limit)
+    os.environ["JIRA_RATE_LIMIT_BURST"] = str(max(1, int(args.rate_limit)))
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from src.database.db import SessionLocal, create_tables
+    from src.models.jira_issue import JiraIssue
+    from src.services.jira_service import JiraService
+    from src.utils.config import settings
+
+    create_tables()
+
+    print(f"{args.issues} issues, page size {args.page_size}, {args.latency_ms} ms per request")
+    print(f"{'concurrency':>12} {'seconds':>10} {'issues/s':>10} {'changed':>10}")
+    for concurrency in args.concurrency:
+        settings.JIRA_SYNC_CONCURRENCY = concurrency
+        db = SessionLocal()
+        try:
+            db.query(JiraIssue).delete()
+            db.commit()
+            started = time.perf_counter()
+            summary = asyncio.run(JiraService.sync_all_issues("BENCH", db))
+            elapsed = time.perf_counter() - started
+        finally:
+            db.close()
+        print(f"{concurrency:>12} {elapsed:>10.2f} {summary.fetched / elapsed:>10.0f} {summary.changed:>10}")
+
+
+if __name__ == "__main__":
+    main()
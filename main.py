@@ -1,4 +1,5 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from src.api.routes import auth
 from src.database.db import create_tables
@@ -7,9 +8,34 @@ from src.api.routes import team
 from src.api.routes import jira
 from src.api.routes import sprints
 from src.api.routes import ai  
+from src.services.jira_webhook_queue import jira_webhook_queue
+from src.services.jira_client import jira_client
+from src.services.jira_sync_scheduler import jira_sync_scheduler
+from src.services.planning_jobs import planning_job_queue
+from src.services.planning_pool import planning_pool
+from src.services.workload_ledger import ledger_rebuilder
+from src.utils.logger import correlation_id, new_correlation_id, setup_logging, shutdown_logging
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    create_tables()
+    await jira_webhook_queue.start()
+    await jira_sync_scheduler.start()
+    await planning_job_queue.start()
+    await ledger_rebuilder.start()
+    yield
+    await ledger_rebuilder.stop()
+    await planning_job_queue.stop()
+    await jira_sync_scheduler.stop()
+    await jira_webhook_queue.stop()
+    await jira_client.aclose()
+    planning_pool.shutdown()
+    shutdown_logging()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -19,6 +45,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def correlation_id_middleware(request: Request, call_next):
+    """Tag every log record of a request with its X-Request-ID (generated when the caller sends none)"""
+    token = correlation_id.set(request.headers.get("X-Request-ID") or new_correlation_id())
+    try:
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = correlation_id.get()
+        return response
+    finally:
+        correlation_id.reset(token)
+
 @app.get("/health")
 def health_check():
     return {"status": "ok"}
@@ -27,10 +64,6 @@ def health_check():
 def root():
     return {"message": "Welcome to the Jira AI Assistant API!"}
 
-@app.on_event("startup")
-def startup_event():
-    create_tables()
-
 app.include_router(auth.router)
 app.include_router(team.router)
 app.include_router(jira.router)
@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+import hmac
+import json
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 from src.api.dependencies import db_dependency, current_user_dependency
 from src.services.jira_service import JiraService
-from src.schemas.jira_schema import JiraIssueResponse, JiraIssueCreate,JiraIssueUpdate
+from src.services.jira_sync_scheduler import jira_sync_scheduler
+from src.services.jira_webhook_queue import JiraWebhookQueue, jira_webhook_queue
+from src.schemas.jira_schema import JiraIssueResponse, JiraIssueCreate,JiraIssueUpdate, JiraWebhookMetrics, JiraSyncStatus, JiraIssuePage
 from src.database.db import get_db
+from src.utils.config import settings
 
 router = APIRouter(prefix="/jira", tags=["jira"])
     
@@ -12,19 +20,80 @@ async def fetch_jira_issues(
     project_key: str,
     db: db_dependency,
     current_user: current_user_dependency,
-    sync: bool = True
+    response: Response,
+    sync: bool = False,
+    full: bool = False
 ):
+    """
+    Serve issues from the local jira_issues table; never waits on Jira.
+    The background scheduler keeps read projects fresh on its own interval, so reads do not trigger syncs;
+    sync=true forces an immediate background refresh (full=true for a full resync).
+    Freshness is reported in the X-Last-Synced-At, X-Stale-After and X-Stale headers.
+    """
     try:
+        jira_sync_scheduler.touch(project_key)
         if sync:
-            # Fetch from Jira Cloud and sync to local DB
-            return JiraService.fetch_and_sync_issues(project_key=project_key, db=db)
-        else:
-            # Only fetch from local DB
-            return JiraService.get_issues_from_db(project_key=project_key, db=db)
+            jira_sync_scheduler.request_refresh(project_key, mode="full" if full else "incremental")
+
+        sync_status = jira_sync_scheduler.status(project_key)
+        if sync_status.last_synced_at:
+            response.headers["X-Last-Synced-At"] = sync_status.last_synced_at.isoformat() + "Z"
+            response.headers["X-Stale-After"] = sync_status.stale_after.isoformat() + "Z"
+        response.headers["X-Stale"] = str(sync_status.stale).lower()
+
+        return JiraService.get_issues_from_db(project_key=project_key, db=db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/issues/page", response_model=JiraIssuePage)
+async def list_jira_issues_page(
+    project_key: str,
+    db: db_dependency,
+    current_user: current_user_dependency,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    status_: Optional[List[str]] = Query(None, alias="status"),
+    assignee: Optional[str] = None,
+    priority: Optional[List[str]] = Query(None),
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated columns, e.g. key,title,status")
+):
+    """
+    Cursor-paginated issue listing from the local table. Pass next_cursor back as `cursor` for the next page.
+    status and priority may be repeated; assignee= (empty) matches unassigned issues.
+    """
+    jira_sync_scheduler.touch(project_key)
+    try:
+        return JiraService.get_issues_page(
+            project_key=project_key, db=db, cursor=cursor, limit=limit,
+            statuses=status_, assignee=assignee, priorities=priority,
+            due_from=due_from, due_to=due_to,
+            fields=[f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/sync/{project_key}", response_model=JiraSyncStatus, status_code=status.HTTP_202_ACCEPTED)
+async def refresh_jira_project(
+    project_key: str,
+    current_user: current_user_dependency,
+    full: bool = False
+):
+    """Trigger an out-of-band background sync of a project"""
+    jira_sync_scheduler.request_refresh(project_key, mode="full" if full else "incremental")
+    return jira_sync_scheduler.status(project_key)
+
+
+@router.get("/sync/{project_key}", response_model=JiraSyncStatus)
+async def get_jira_sync_status(project_key: str, current_user: current_user_dependency):
+    return jira_sync_scheduler.status(project_key)
+
+
 @router.post("/new_issues", response_model=JiraIssueResponse)
 async def create_jira_issue(
     issue: JiraIssueCreate,
@@ -36,6 +105,17 @@ async def create_jira_issue(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/bulk_issues", response_model=list[JiraIssueResponse])
+async def create_jira_issues(
+    issues: list[JiraIssueCreate],
+    db: db_dependency,
+    current_user: current_user_dependency
+):
+    try:
+        return JiraService.create_issues(issues_data=issues, db=db)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.put("/update_issue/{issue_key}", response_model=JiraIssueResponse)
 async def update_jira_issue(
     issue_key: str,
@@ -76,4 +156,54 @@ async def delete_jira_issue(
     except HTTPException as http_exc:
         raise http_exc
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+WEBHOOK_EVENTS = {
+    "jira:issue_created": JiraWebhookQueue.UPSERT,
+    "jira:issue_updated": JiraWebhookQueue.UPSERT,
+    "jira:issue_deleted": JiraWebhookQueue.DELETE,
+}
+
+@router.post("/webhook", status_code=status.HTTP_202_ACCEPTED)
+async def receive_jira_webhook(request: Request):
+    """
+    Accept Jira issue created/updated/deleted webhooks and acknowledge immediately.
+    Events are queued and written to jira_issues in batches by the background writer.
+    """
+    # Fail closed: without a secret there is no way to tell Jira's events from anyone else's
+    if not settings.JIRA_WEBHOOK_SECRET:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Jira webhook secret is not configured")
+
+    body = await request.body()
+    expected = "sha256=" + hmac.new(settings.JIRA_WEBHOOK_SECRET.encode(), body, hashlib.sha256).hexdigest()
+    if not hmac.compare_digest(expected, request.headers.get("X-Hub-Signature", "")):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid webhook signature")
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Webhook body is not valid JSON")
+
+    event_type = WEBHOOK_EVENTS.get(payload.get("webhookEvent"))
+    issue = payload.get("issue") or {}
+    if event_type is None or not issue.get("key"):
+        # Not an issue event we track; acknowledge so Jira does not retry it
+        return {"accepted": False}
+
+    try:
+        accepted = jira_webhook_queue.enqueue(event_type, issue)
+    except (KeyError, TypeError) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Malformed issue payload: {str(e)}")
+
+    if not accepted:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Webhook queue is full",
+            headers={"Retry-After": str(int(settings.JIRA_WEBHOOK_FLUSH_SECONDS) + 1)}
+        )
+    return {"accepted": True}
+
+
+@router.get("/webhook/metrics", response_model=JiraWebhookMetrics)
+async def get_jira_webhook_metrics(current_user: current_user_dependency):
+    return jira_webhook_queue.metrics()
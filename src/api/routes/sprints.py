@@ -1,11 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Optional
 
 from src.api.dependencies import db_dependency, current_user_dependency
-from src.schemas.sprint_schema import SprintAssignmentResponse, SprintCreateRequest
+from src.schemas.sprint_schema import (
+    PlanningJobResponse, SprintAssignmentResponse, SprintBatchRequest, SprintBatchResponse, SprintCreateRequest,
+    SprintForecastResponse, SprintPlanCommitResponse, SprintPlanPreview, SprintReplanResponse, UserWorkloadResponse
+)
+from src.services.forecast_service import ForecastService
+from src.services.planning_jobs import planning_job_queue
+from src.services.sprint_config import SprintConfig
 from src.services.sprint_service import SprintService
+from src.services.workload_ledger import WorkloadLedger
 from src.models.sprint import Sprint
+from src.utils.config import settings
 
 router = APIRouter(prefix="/sprint", tags=["sprint"])
 @router.post("/create-assignments", response_model=List[SprintAssignmentResponse])
@@ -20,7 +31,8 @@ async def create_sprint_assignments(
             project_key=request.project_key,
             sprint_name=request.sprint_name,
             team_name=request.team_name,
-            db=db
+            db=db,
+            strategy=request.strategy
         )
         return assignments
     except Exception as e:
@@ -30,6 +42,159 @@ async def create_sprint_assignments(
         )
 
 
+@router.post("/create-assignments/stream")
+async def stream_sprint_assignments(
+    request: SprintCreateRequest,
+    current_user: current_user_dependency,
+    format: Literal["ndjson", "sse"] = Query("ndjson", description="NDJSON lines or Server-Sent Events")
+):
+    """
+    Create and save sprint assignments, streaming progress events and each assignment as it is decided.
+    The last event is the saved summary, or an error.
+    """
+    events = SprintService.stream_sprint_assignments(
+        project_key=request.project_key,
+        sprint_name=request.sprint_name,
+        team_name=request.team_name,
+        strategy=request.strategy
+    )
+
+    async def body():
+        async for event, data in events:
+            if format == "sse":
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+            else:
+                yield json.dumps({"event": event, **data}) + "\n"
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream" if format == "sse" else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/jobs", response_model=PlanningJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_planning_job(
+    request: SprintCreateRequest,
+    db: db_dependency,
+    current_user: current_user_dependency
+):
+    """Queue create-assignments as a background job; poll GET /sprint/jobs/{job_id} for progress and the result"""
+    try:
+        return planning_job_queue.submit(request, db)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to queue planning job: {str(e)}"
+        )
+
+
+@router.get("/jobs/{job_id}", response_model=PlanningJobResponse)
+async def get_planning_job(
+    job_id: str,
+    db: db_dependency,
+    current_user: current_user_dependency
+):
+    """Status, progress and, once succeeded, the assignments of a planning job"""
+    try:
+        return planning_job_queue.get(job_id, db)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch planning job: {str(e)}"
+        )
+
+
+@router.post("/batch-assignments", response_model=SprintBatchResponse)
+async def create_batch_sprint_assignments(
+    request: SprintBatchRequest,
+    current_user: current_user_dependency
+):
+    """Create and save sprint assignments for several teams concurrently, with a status per team"""
+    if len(request.plans) > settings.PLANNING_BATCH_MAX_TEAMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.PLANNING_BATCH_MAX_TEAMS} teams per batch"
+        )
+    try:
+        return await SprintService.create_batch_assignments(request.plans)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create batch sprint assignments: {str(e)}"
+        )
+
+
+@router.post("/preview", response_model=SprintPlanPreview)
+async def preview_sprint_plan(
+    request: SprintCreateRequest,
+    db: db_dependency,
+    current_user: current_user_dependency
+):
+    """Compute sprint assignments without saving them; commit the returned plan_id to persist it"""
+    try:
+        return await SprintService.preview_sprint_plan(
+            project_key=request.project_key,
+            sprint_name=request.sprint_name,
+            team_name=request.team_name,
+            db=db,
+            strategy=request.strategy
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to preview sprint plan: {str(e)}"
+        )
+
+
+@router.post("/commit/{plan_id}", response_model=SprintPlanCommitResponse)
+async def commit_sprint_plan(
+    plan_id: str,
+    db: db_dependency,
+    current_user: current_user_dependency
+):
+    """Save a previewed plan exactly as it was computed"""
+    try:
+        return await SprintService.commit_sprint_plan(plan_id, db)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to commit sprint plan: {str(e)}"
+        )
+
+
+@router.post("/replan", response_model=SprintReplanResponse)
+async def replan_sprint(
+    request: SprintCreateRequest,
+    db: db_dependency,
+    current_user: current_user_dependency
+):
+    """Re-plan only the issues that changed since the saved plan and return the resulting changes"""
+    try:
+        return await SprintService.replan_sprint(
+            project_key=request.project_key,
+            sprint_name=request.sprint_name,
+            team_name=request.team_name,
+            db=db,
+            strategy=request.strategy
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to re-plan sprint: {str(e)}"
+        )
+
+
 @router.get("/assignments", response_model=List[SprintAssignmentResponse])
 async def get_all_sprint_assignments(
     db: db_dependency,
@@ -56,4 +221,49 @@ async def get_all_sprint_assignments(
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch sprint assignments: {str(e)}"
-        )
\ No newline at end of file
+        )
+
+@router.get("/{sprint_name}/workload", response_model=List[UserWorkloadResponse])
+async def get_sprint_workload(
+    sprint_name: str,
+    db: db_dependency,
+    current_user: current_user_dependency
+):
+    """Open story points, estimated days and issues per assignee in a sprint, most loaded first"""
+    try:
+        return WorkloadLedger.get_sprint(sprint_name, db)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch sprint workload: {str(e)}"
+        )
+
+
+@router.get("/{sprint_name}/forecast", response_model=SprintForecastResponse)
+def forecast_sprint(
+    sprint_name: str,
+    db: db_dependency,
+    current_user: current_user_dependency,
+    trials: int = Query(settings.FORECAST_DEFAULT_TRIALS, ge=100, le=settings.FORECAST_MAX_TRIALS),
+    sprint_days: int = Query(SprintConfig.SPRINT_WORKING_DAYS, ge=1, le=60),
+    start_date: Optional[date] = Query(None, description="First working day of the sprint; defaults to today"),
+    seed: Optional[int] = Query(None, description="Fix the random seed for a reproducible forecast")
+):
+    """Monte Carlo forecast of when a saved sprint completes and which users are likely to overrun"""
+    # A plain def: the simulation is CPU-bound, so FastAPI runs it in its threadpool off the event loop
+    try:
+        return ForecastService.forecast_sprint(
+            sprint_name=sprint_name,
+            db=db,
+            trials=trials,
+            sprint_days=sprint_days,
+            start_date=start_date,
+            seed=seed
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to forecast sprint: {str(e)}"
+        )
@@ -8,7 +8,11 @@ DATABASE_URL = os.getenv(
     "DATABASE_URL"
 )
 
-engine = create_engine(DATABASE_URL)
+# Connections held open per process, plus how many more may be opened under load
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+engine = create_engine(DATABASE_URL, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -20,6 +24,8 @@ def get_db():
         db.close()
 
 def create_tables():
-    """Create all tables in the database"""
-    from src.models.user import Base as UserBase
-    UserBase.metadata.create_all(bind=engine)
\ No newline at end of file
+    """Create all tables in the database and apply pending schema migrations"""
+    import src.models  # registers every model on Base
+    from src.database.migrations import run_migrations
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
@@ -0,0 +1,111 @@
+"""
+Versioned schema migrations.
+
+create_all only creates missing tables, so anything that changes an existing table (indexes, constraints,
+columns) is a numbered migration here. Each migration runs once, in order, inside one transaction,
+and is recorded in schema_migrations. Statements are written to be idempotent so a fresh database
+(where create_all already built the final schema) passes through them harmlessly.
+"""
+from datetime import datetime
+from typing import Callable, List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+
+def _create_index(conn: Connection, name: str, table: str, columns: str, unique: bool = False) -> None:
+    conn.execute(text(f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+def _add_column(conn: Connection, table: str, column: str, ddl_type: str) -> None:
+    if column not in {c["name"] for c in inspect(conn).get_columns(table)}:
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
+
+
+def _001_jira_issue_project_indexes(conn: Connection) -> None:
+    # (project_key, id) serves project listings and keyset pagination; (project_key, status) serves status filters
+    _create_index(conn, "ix_jira_issues_project_key_id", "jira_issues", "project_key, id")
+    _create_index(conn, "ix_jira_issues_project_key_status", "jira_issues", "project_key, status")
+
+
+def _002_unique_sprint_issue_key(conn: Connection) -> None:
+    # Keep the newest row per issue_key, then make the existing index unique
+    conn.execute(text("""
+        DELETE FROM sprints
+        WHERE id NOT IN (SELECT MAX(id) FROM sprints GROUP BY issue_key)
+    """))
+    conn.execute(text("DROP INDEX IF EXISTS ix_sprints_issue_key"))
+    _create_index(conn, "ix_sprints_issue_key", "sprints", "issue_key", unique=True)
+
+
+def _003_sprint_assignee_index(conn: Connection) -> None:
+    _create_index(conn, "ix_sprints_sprint_name_assignee_name", "sprints", "sprint_name, assignee_name")
+
+
+def _004_user_team_index(conn: Connection) -> None:
+    _create_index(conn, "ix_users_team", "users", "team")
+
+
+def _005_jira_issue_text_features(conn: Connection) -> None:
+    # Left NULL on existing rows: planning computes missing features on the fly and the next sync stores them
+    for column in ("word_count", "description_length", "keyword_flags"):
+        _add_column(conn, "jira_issues", column, "INTEGER")
+
+
+def _006_user_workload_backfill(conn: Connection) -> None:
+    # create_all has already built user_workloads; fill it from the existing sprints
+    from src.services.workload_ledger import WorkloadLedger
+    WorkloadLedger.rebuild(conn)
+
+
+def _007_jira_issue_source(conn: Connection) -> None:
+    # Left NULL: rows of unknown origin are never reconciled away; the next sync that writes them marks them 'jira'
+    _add_column(conn, "jira_issues", "source", "VARCHAR")
+
+
+def _008_planning_job_lease(conn: Connection) -> None:
+    # Running jobs without a lease are treated as expired and requeued
+    _add_column(conn, "planning_jobs", "owner", "VARCHAR")
+    _add_column(conn, "planning_jobs", "lease_expires_at", "TIMESTAMP")
+    _create_index(conn, "ix_planning_jobs_lease_expires_at", "planning_jobs", "lease_expires_at")
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "jira_issues project_key indexes", _001_jira_issue_project_indexes),
+    (2, "unique sprints.issue_key", _002_unique_sprint_issue_key),
+    (3, "sprints (sprint_name, assignee_name) index", _003_sprint_assignee_index),
+    (4, "users.team index", _004_user_team_index),
+    (5, "jira_issues text feature columns", _005_jira_issue_text_features),
+    (6, "user_workloads backfill", _006_user_workload_backfill),
+    (7, "jira_issues source column", _007_jira_issue_source),
+    (8, "planning_jobs owner and lease", _008_planning_job_lease),
+]
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """Apply pending migrations and return the versions applied"""
+    applied_now = []
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Serialize concurrent app workers starting at the same time
+            conn.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": 7_305_417_201})
+
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                description VARCHAR NOT NULL,
+                applied_at TIMESTAMP NOT NULL
+            )
+        """))
+        applied = {v for (v,) in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+        for version, description, migrate in MIGRATIONS:
+            if version in applied:
+                continue
+            migrate(conn)
+            conn.execute(
+                text("INSERT INTO schema_migrations (version, description, applied_at) VALUES (:v, :d, :t)"),
+                {"v": version, "d": description, "t": datetime.utcnow()}
+            )
+            applied_now.append(version)
+    return applied_now
@@ -1,2 +1,9 @@
 from .user import User
 from .team import Team
+from .jira_issue import JiraIssue
+from .jira_sync_state import JiraSyncState
+from .jira_key_sequence import JiraKeySequence
+from .sprint import Sprint
+from .story_point_estimate import StoryPointEstimateCache
+from .planning_job import PlanningJob
+from .user_workload import UserWorkload
@@ -1,8 +1,13 @@
-from sqlalchemy import Column, String, Integer, Date,Text, Float, DateTime, func
+from datetime import datetime
+from sqlalchemy import Column, String, Integer, Date,Text, Float, DateTime, Index
 from src.database.db import Base
 
 class JiraIssue(Base):
     __tablename__ = "jira_issues"
+    __table_args__ = (
+        Index("ix_jira_issues_project_key_id", "project_key", "id"),
+        Index("ix_jira_issues_project_key_status", "project_key", "status"),
+    )
 
     id = Column(Integer, primary_key=True,index=True,autoincrement=True) 
     key = Column(String, unique=True, nullable=False)  
@@ -14,6 +19,15 @@ class JiraIssue(Base):
     assignee = Column(String)  
     status = Column(String, nullable=False) 
     due_date = Column(Date, nullable=True)
-    created_at = Column(DateTime, default=func.now())  
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())  
-    last_synced_at = Column(DateTime, default=func.now())  
\ No newline at end of file
+    # Text features for heuristic estimation, written with title/description (see issue_features)
+    word_count = Column(Integer, nullable=True)
+    description_length = Column(Integer, nullable=True)
+    keyword_flags = Column(Integer, nullable=True)
+    # 'jira' for issues written by sync or webhooks, 'local' for issues created through this API.
+    # Only 'jira' issues are removed when they disappear from Jira; NULL (rows older than the column) is kept.
+    source = Column(String, nullable=True)
+    # Naive UTC, written from Python: the database's now() is in the session time zone for a plain
+    # timestamp column, which replan would then compare against the timezone-aware sprints timestamps
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    last_synced_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
@@ -0,0 +1,9 @@
+from sqlalchemy import Column, String, Integer
+from src.database.db import Base
+
+class JiraKeySequence(Base):
+    __tablename__ = "jira_key_sequences"
+
+    project_key = Column(String, primary_key=True)
+    # Highest issue number handed out (or seen from Jira) for the project
+    last_number = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime
+from src.database.db import Base
+
+class JiraSyncState(Base):
+    __tablename__ = "jira_sync_states"
+
+    project_key = Column(String, primary_key=True)
+    # Highest Jira `updated` timestamp (UTC) seen by a completed sync, capped at the time that sync started
+    updated_watermark = Column(DateTime, nullable=True)
+    last_synced_at = Column(DateTime, nullable=True)
+    last_full_sync_at = Column(DateTime, nullable=True)
+    last_reconciled_at = Column(DateTime, nullable=True)
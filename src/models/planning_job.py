@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from src.database.db import Base
+
+class PlanningJob(Base):
+    __tablename__ = "planning_jobs"
+
+    id = Column(String(32), primary_key=True)
+    project_key = Column(String, nullable=False)
+    sprint_name = Column(String, nullable=False)
+    team_name = Column(String, nullable=False)
+    strategy = Column(String, nullable=False)
+    # queued -> running -> succeeded | failed
+    status = Column(String, nullable=False, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    # Queue instance running the job, and when its claim lapses unless heartbeats extend it
+    owner = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True, index=True)
+    issues_estimated = Column(Integer, nullable=False, default=0)
+    issues_assigned = Column(Integer, nullable=False, default=0)
+    issues_saved = Column(Integer, nullable=False, default=0)
+    # List of SprintAssignmentResponse dicts once the job succeeds
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
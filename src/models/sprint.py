@@ -1,14 +1,17 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from src.database.db import Base
 
 class Sprint(Base):
     __tablename__ = "sprints"
+    __table_args__ = (
+        Index("ix_sprints_sprint_name_assignee_name", "sprint_name", "assignee_name"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     sprint_name = Column(String, nullable=False, index=True)
-    issue_key = Column(String, nullable=False, index=True)
+    issue_key = Column(String, nullable=False, unique=True, index=True)
     assignee_name = Column(String, nullable=False)
     title = Column(String, nullable=False)
     estimated_days = Column(Integer, nullable=False)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from src.database.db import Base
+
+class StoryPointEstimateCache(Base):
+    __tablename__ = "story_point_estimates"
+
+    # SHA-256 of (model, prompt version, title, description, basic points)
+    cache_key = Column(String(64), primary_key=True)
+    model = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    story_points = Column(Integer, nullable=False)
+    complexity_reasoning = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    last_used_at = Column(DateTime, nullable=False, index=True)
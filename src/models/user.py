@@ -17,5 +17,5 @@ class User(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Changed from team_name to team to match your database
-    team = Column(String, ForeignKey("teams.name"))
+    team = Column(String, ForeignKey("teams.name"), index=True)
     team_relation = relationship("Team", back_populates="users")
\ No newline at end of file
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from src.database.db import Base
+
+class UserWorkload(Base):
+    __tablename__ = "user_workloads"
+
+    # Open work per assignee per sprint, kept in step with sprints and jira_issues by WorkloadLedger
+    sprint_name = Column(String, primary_key=True)
+    username = Column(String, primary_key=True)
+    story_points = Column(Integer, nullable=False, default=0)
+    estimated_days = Column(Integer, nullable=False, default=0)
+    open_issues = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Literal, Optional
-from datetime import date
+from typing import Any, Dict, List, Literal, Optional
+from datetime import date, datetime
 
 class JiraIssueCreate(BaseModel):
     project_key: str
@@ -22,6 +22,10 @@ class JiraIssueResponse(BaseModel):
     assignee: Optional[str] = None
     status: Optional[str]
     due_date: Optional[date] 
+    # Text features stored on jira_issues (see issue_features); used by planning, never serialized
+    word_count: Optional[int] = Field(None, exclude=True)
+    description_length: Optional[int] = Field(None, exclude=True)
+    keyword_flags: Optional[int] = Field(None, exclude=True)
     
 class JiraIssueUpdate(BaseModel):
     title: Optional[str]
@@ -30,4 +34,45 @@ class JiraIssueUpdate(BaseModel):
     due_date: Optional[str]
     priority: Optional[str]
     status: Optional[str]
-    due_date: Optional[date] = None 
\ No newline at end of file
+    due_date: Optional[date] = None 
+
+class JiraSyncSummary(BaseModel):
+    project_key: str
+    mode: Literal["full", "incremental"] = "full"
+    fetched: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+
+    def add_page(self, changed: int, unchanged: int) -> None:
+        self.changed += changed
+        self.unchanged += unchanged
+        self.fetched += changed + unchanged
+
+
+class JiraWebhookMetrics(BaseModel):
+    pending: int = 0
+    max_pending: int = 0
+    high_water_mark: int = 0
+    received: int = 0
+    coalesced: int = 0
+    rejected: int = 0
+    flushed_batches: int = 0
+    flushed_events: int = 0
+    flush_errors: int = 0
+    dropped: int = 0
+    last_flush_at: Optional[datetime] = None
+
+
+class JiraSyncStatus(BaseModel):
+    project_key: str
+    last_synced_at: Optional[datetime] = None
+    stale_after: Optional[datetime] = None
+    stale: bool = True
+    refresh_pending: bool = False
+
+
+class JiraIssuePage(BaseModel):
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+    limit: int
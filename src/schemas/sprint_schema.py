@@ -1,17 +1,20 @@
 from pydantic import BaseModel, Field
+from datetime import date, datetime
 from typing import Optional, List, Literal
 
 class SprintCreateRequest(BaseModel):
     project_key: str = Field(..., description="Jira project key")
     sprint_name: str = Field(..., description="Name of the sprint")
     team_name: str = Field(..., description="Team name for assignment")
+    strategy: Literal["greedy", "optimal"] = Field("greedy", description="Assignment strategy")
 
     class Config:
         json_schema_extra = {
             "example": {
                 "project_key": "string",
                 "sprint_name": "string",
-                "team_name": "string"
+                "team_name": "string",
+                "strategy": "greedy"
             }
         }
 
@@ -26,6 +29,128 @@ class SprintAssignmentResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class SprintSaveSummary(BaseModel):
+    inserted: int = Field(0, description="Issues assigned for the first time")
+    updated: int = Field(0, description="Existing assignments whose details changed")
+    reassigned: int = Field(0, description="Updated assignments that moved to a different assignee")
+    unchanged: int = Field(0, description="Assignments already saved exactly as planned")
+
+class SprintPlanPreview(BaseModel):
+    plan_id: str = Field(..., description="Id to pass to the commit endpoint")
+    project_key: str
+    sprint_name: str
+    team_name: str
+    strategy: str
+    expires_at: datetime = Field(..., description="When the cached plan can no longer be committed (UTC)")
+    assignments: List[SprintAssignmentResponse]
+
+class SprintPlanCommitResponse(BaseModel):
+    plan_id: str
+    assignments: int = Field(..., description="Assignments in the committed plan")
+    saved: SprintSaveSummary
+
+class SprintAssignmentChange(SprintAssignmentResponse):
+    change: Literal["added", "moved", "updated"] = Field(..., description="How the assignment differs from the saved plan")
+    previous_assignee: Optional[str] = Field(None, description="Assignee in the saved plan, for moved assignments")
+
+class SprintReplanResponse(BaseModel):
+    project_key: str
+    sprint_name: str
+    team_name: str
+    changed_issues: int = Field(..., description="Issues new or updated since the saved plan")
+    completed_issues: int = Field(0, description="Changed issues that are now done and were not re-planned")
+    changes: List[SprintAssignmentChange]
+    saved: SprintSaveSummary
+
+class SprintBatchPlanItem(BaseModel):
+    project_key: str = Field(..., description="Jira project key")
+    sprint_name: str = Field(..., description="Name of the sprint")
+    team_name: str = Field(..., description="Team name for assignment")
+    strategy: Literal["greedy", "optimal"] = Field("greedy", description="Assignment strategy")
+
+class SprintBatchRequest(BaseModel):
+    plans: List[SprintBatchPlanItem] = Field(..., min_length=1, description="One entry per team to plan")
+
+class SprintBatchTeamResult(BaseModel):
+    project_key: str
+    sprint_name: str
+    team_name: str
+    status: Literal["ok", "failed"]
+    assignments: List[SprintAssignmentResponse] = []
+    saved: Optional[SprintSaveSummary] = None
+    error: Optional[str] = None
+
+class SprintBatchResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[SprintBatchTeamResult]
+
+class SprintStreamSummary(BaseModel):
+    project_key: str
+    sprint_name: str
+    team_name: str
+    assignments: int = Field(..., description="Assignments emitted, preserved and new")
+    saved: SprintSaveSummary
+    duration_ms: int
+
+class PlanningJobProgress(BaseModel):
+    estimated: int = Field(0, description="Unassigned issues given story points")
+    assigned: int = Field(0, description="Issues assigned to a team member")
+    saved: int = Field(0, description="Assignments written to the sprints table")
+
+class PlanningJobResponse(BaseModel):
+    job_id: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    project_key: str
+    sprint_name: str
+    team_name: str
+    strategy: str
+    attempts: int = Field(..., description="Times the job has been started, including resumes after a restart")
+    progress: PlanningJobProgress
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    assignments: Optional[List[SprintAssignmentResponse]] = Field(None, description="Set once the job has succeeded")
+
+class UserWorkloadResponse(BaseModel):
+    username: str
+    sprint_name: str
+    story_points: int = Field(..., description="Story points of the user's open assignments in the sprint")
+    estimated_days: int
+    open_issues: int
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class SprintForecastDay(BaseModel):
+    date: date
+    working_day: int = Field(..., description="Working days since the sprint start, counting the start day as 1")
+    probability: float = Field(..., description="Probability that every assignment is done by the end of this day")
+
+class SprintForecastUser(BaseModel):
+    assignee_name: str
+    experience_level: str
+    tasks: int
+    story_points: int
+    planned_days: int = Field(..., description="Sum of the plan's estimated_days")
+    p50_days: float
+    p90_days: float
+    overrun_probability: float = Field(..., description="Probability of needing more than sprint_days")
+
+class SprintForecastResponse(BaseModel):
+    sprint_name: str
+    trials: int
+    tasks: int
+    start_date: date
+    sprint_days: int
+    p50_days: float
+    p90_days: float
+    on_time_probability: float = Field(..., description="Probability the sprint finishes within sprint_days")
+    completion_by_date: List[SprintForecastDay]
+    users: List[SprintForecastUser] = Field(..., description="Most at-risk first")
+
 class StoryPointEstimate(BaseModel):
     issue_key: str = Field(..., description="Jira issue key")
     title: str = Field(..., description="Issue title")
@@ -0,0 +1,432 @@
+import heapq
+import math
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.schemas.jira_schema import JiraIssueResponse
+from src.schemas.sprint_schema import SprintAssignmentResponse, UserSkillAnalysis
+from src.services.sprint_config import SprintConfig
+from src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class AssignmentEngine:
+    """
+    Load-balanced greedy assignment.
+
+    Every user has a capacity in story points (their capacity_score) and a remaining capacity that
+    shrinks as work is assigned. Users are kept in one max-heap of remaining capacity per experience
+    level, so each pick peeks at most three heap tops and costs O(log U).
+
+    Issues are placed largest first. An issue goes to the user with the most remaining capacity among the
+    levels whose STORY_POINT_LIMITS contain its points; if the team has nobody at those levels, it goes to
+    the user with the most remaining capacity overall and (with clamp=True) its points are clamped to that
+    user's limits.
+    """
+
+    LEVELS = ('intern', 'junior', 'senior')
+    LEVEL_RANK = {'senior': 3, 'junior': 2, 'intern': 1}
+
+    @staticmethod
+    def assign(
+        issues: List[JiraIssueResponse],
+        users: List[UserSkillAnalysis],
+        sprint_name: str,
+        initial_loads: Optional[Dict[str, float]] = None,
+        clamp: bool = True
+    ) -> List[SprintAssignmentResponse]:
+        """initial_loads maps username -> story points the user already holds"""
+        if not users or not issues:
+            return []
+
+        initial_loads = initial_loads or {}
+        # Same ordering as the old round-robin so ties still favour experienced, high-capacity users
+        ordered_users = sorted(users, key=lambda u: (AssignmentEngine.LEVEL_RANK[u.experience_level], u.capacity_score), reverse=True)
+
+        heaps: Dict[str, List[Tuple[float, int]]] = {level: [] for level in AssignmentEngine.LEVELS}
+        for order, user in enumerate(ordered_users):
+            remaining = user.capacity_score - initial_loads.get(user.username, 0)
+            heaps[user.experience_level].append((-remaining, order))
+        for heap in heaps.values():
+            heapq.heapify(heap)
+
+        # Levels whose limits contain a point value, computed once per distinct value
+        eligible_levels: Dict[int, List[str]] = {}
+        days: Dict[Tuple[int, str], int] = {}
+
+        assignments = []
+        for issue in sorted(issues, key=lambda i: int(i.story_points or 3), reverse=True):
+            points = int(issue.story_points or 3)
+            if points not in eligible_levels:
+                eligible_levels[points] = [
+                    level for level in AssignmentEngine.LEVELS
+                    if SprintConfig.STORY_POINT_LIMITS[level]['min'] <= points <= SprintConfig.STORY_POINT_LIMITS[level]['max']
+                ]
+            candidates = [level for level in eligible_levels[points] if heaps[level]]
+            ineligible = not candidates
+            if ineligible:
+                candidates = [level for level in AssignmentEngine.LEVELS if heaps[level]]
+
+            # Heap entries are (-remaining, order): the smallest top has the most remaining capacity
+            level = candidates[0] if len(candidates) == 1 else min(candidates, key=lambda lvl: heaps[lvl][0])
+            neg_remaining, order = heapq.heappop(heaps[level])
+            user = ordered_users[order]
+
+            if ineligible and clamp:
+                limits = SprintConfig.STORY_POINT_LIMITS[level]
+                points = max(limits['min'], min(limits['max'], points))
+
+            heapq.heappush(heaps[level], (neg_remaining + points, order))
+            if (points, level) not in days:
+                days[(points, level)] = AssignmentEngine.estimated_days(points, level)
+            assignments.append(SprintAssignmentResponse(
+                sprint_name=sprint_name,
+                issue_key=issue.key,
+                assignee_name=user.username,
+                title=issue.title,
+                estimated_days=days[(points, level)],
+                story_points=points
+            ))
+
+        return assignments
+
+    @staticmethod
+    def assign_optimal(
+        issues: List[JiraIssueResponse],
+        users: List[UserSkillAnalysis],
+        sprint_name: str,
+        time_budget: float,
+        initial_loads: Optional[Dict[str, float]] = None
+    ) -> List[SprintAssignmentResponse]:
+        """
+        Solve issues x users as a min-cost flow (a transportation problem) and fall back to assign()
+        if the solver exceeds `time_budget` seconds.
+
+        Issues are grouped into classes by (story points, inferred skill) and flow is measured in base days
+        (DAYS_MAPPING), so a user's flow times their EXPERIENCE_MULTIPLIERS entry is their estimated days.
+        A class only has arcs to the users whose STORY_POINT_LIMITS contain its points; when nobody in the
+        team is eligible it has arcs to everyone, at INELIGIBLE_PENALTY_DAYS extra. An arc costs the user's
+        estimated days plus SKILL_MISMATCH_PENALTY_DAYS when the inferred skill differs from the user's
+        skill_category.
+        Each user -> sink path is free up to the user's capacity_score (less their initial load) and then priced
+        in steps of estimated days, each BALANCE_PENALTY_DAYS per day dearer than the last, so work past capacity
+        spreads evenly and the busiest user's days (the makespan) stay down; the last step is unbounded, so the
+        problem is always feasible.
+        Flows are rounded down to whole issues; the few issues left over go through assign(), and
+        _shorten_makespan() then exchanges whole issues to take the makespan down to the day.
+        Story points are never clamped on this path.
+        """
+        if not users or not issues:
+            return []
+
+        deadline = time.monotonic() + time_budget
+        initial_loads = dict(initial_loads or {})
+
+        classes: Dict[Tuple[int, Optional[str]], List[JiraIssueResponse]] = {}
+        for issue in issues:
+            points = int(issue.story_points or 3)
+            classes.setdefault((points, AssignmentEngine.infer_skill(issue.title)), []).append(issue)
+        class_keys = list(classes)
+
+        eligible_users: Dict[int, List[int]] = {}
+        for points, _ in class_keys:
+            if points not in eligible_users:
+                eligible = [u for u, user in enumerate(users) if AssignmentEngine._eligible(points, user.experience_level)]
+                eligible_users[points] = eligible or list(range(len(users)))
+
+        source, sink = 0, len(class_keys) + len(users) + 1
+        flow = _MinCostFlow(sink + 1)
+        user_arcs = []
+        total_days = 0
+        for k, (points, skill) in enumerate(class_keys):
+            unit = AssignmentEngine._base_days(points)
+            supply = unit * len(classes[(points, skill)])
+            total_days += supply
+            flow.add_edge(source, 1 + k, supply, 0)
+            for u in eligible_users[points]:
+                cost = AssignmentEngine._arc_cost(points, skill, users[u])
+                user_arcs.append((k, u, flow.add_edge(1 + k, 1 + len(class_keys) + u, supply, cost)))
+        # Capacity and initial loads are in story points; price them in base days at the backlog's average rate
+        days_per_point = total_days / sum(points * len(pool) for (points, _), pool in classes.items())
+        # BALANCE_STEPS steps per even share of the backlog
+        step = max(1, math.ceil(total_days / (len(users) * SprintConfig.BALANCE_STEPS)))
+        for u, user in enumerate(users):
+            spare = (user.capacity_score - initial_loads.get(user.username, 0)) * days_per_point
+            AssignmentEngine._add_load_arcs(flow, 1 + len(class_keys) + u, sink, spare, step, total_days, user)
+
+        try:
+            flow.solve(source, sink, total_days, deadline)
+        except TimeoutError:
+            log.warning("assignment.optimal_timeout", time_budget=time_budget, issues=len(issues), users=len(users))
+            return AssignmentEngine.assign(issues, users, sprint_name, initial_loads, clamp=False)
+
+        assignments = []
+        for k, u, edge in user_arcs:
+            points, skill = class_keys[k]
+            pool = classes[(points, skill)]
+            count = min(flow.flow_on(edge) // AssignmentEngine._base_days(points), len(pool))
+            if not count:
+                continue
+            user = users[u]
+            days = AssignmentEngine.estimated_days(points, user.experience_level)
+            for issue in pool[len(pool) - count:]:
+                assignments.append(SprintAssignmentResponse(
+                    sprint_name=sprint_name,
+                    issue_key=issue.key,
+                    assignee_name=user.username,
+                    title=issue.title,
+                    estimated_days=days,
+                    story_points=points
+                ))
+            del pool[len(pool) - count:]
+            initial_loads[user.username] = initial_loads.get(user.username, 0) + count * points
+
+        # Issues whose class flow was split between users without a whole issue's worth for each
+        leftovers = [issue for pool in classes.values() for issue in pool]
+        assignments.extend(AssignmentEngine.assign(leftovers, users, sprint_name, initial_loads, clamp=False))
+        AssignmentEngine._shorten_makespan(assignments, users, eligible_users, deadline)
+        return assignments
+
+    @staticmethod
+    def _shorten_makespan(
+        assignments: List[SprintAssignmentResponse],
+        users: List[UserSkillAnalysis],
+        eligible_users: Dict[int, List[int]],
+        deadline: float
+    ):
+        """
+        Even out estimated days by exchanging whole issues between pairs of users, in place.
+
+        Users within one issue of the busiest are visited busiest first. An exchange hands one or two issues of a class to an eligible user and
+        takes back none, one or two of theirs of another class, and is only made if both users then end below
+        the busier one's old total, so the busiest user's days never grow. Exchanges that add no skill mismatch
+        are preferred. Stops when no user has one left, or at the solver's deadline.
+        """
+        index = {user.username: u for u, user in enumerate(users)}
+        days = [0] * len(users)
+        # held[u][(points, skill)] lists the positions in `assignments` of u's issues of that class
+        held: List[Dict[Tuple[int, Optional[str]], List[int]]] = [{} for _ in users]
+        for a, assignment in enumerate(assignments):
+            u = index[assignment.assignee_name]
+            days[u] += assignment.estimated_days
+            held[u].setdefault((assignment.story_points, AssignmentEngine.infer_skill(assignment.title)), []).append(a)
+
+        fits: Dict[Tuple[Tuple[int, Optional[str]], int], Tuple[int, int]] = {}
+
+        def fit(key: Tuple[int, Optional[str]], u: int) -> Tuple[int, int]:
+            """(skill mismatch, estimated days) of an issue of class `key` for user u"""
+            if (key, u) not in fits:
+                points, skill = key
+                user = users[u]
+                fits[(key, u)] = (
+                    int(bool(skill) and user.skill_category not in (skill, 'fullstack')),
+                    AssignmentEngine.estimated_days(points, user.experience_level)
+                )
+            return fits[(key, u)]
+
+        # Users with the same level and skill_category are interchangeable apart from their days, so an exchange
+        # only tries the least busy few of each kind
+        kinds: Dict[Tuple[str, str], List[int]] = {}
+        for u, user in enumerate(users):
+            kinds.setdefault((user.experience_level, user.skill_category), []).append(u)
+
+        def best_exchange(u: int):
+            best = None
+            partners = {
+                v for members in kinds.values()
+                for v in heapq.nsmallest(SprintConfig.BALANCE_PARTNERS, (v for v in members if v != u and days[v] < days[u]), key=days.__getitem__)
+            }
+            # For each partner v: (class, how many, mismatch and days for u, mismatch and days for v) v can hand back,
+            # the first entry being a plain move
+            offers: Dict[int, list] = {}
+            for key, mine in held[u].items():
+                mismatch_u, days_u = fit(key, u)
+                for v in eligible_users[key[0]]:
+                    if v not in partners:
+                        continue
+                    if v not in offers:
+                        offers[v] = [(None, 0, 0, 0, 0, 0)] + [
+                            (other, take, *fit(other, u), *fit(other, v)) for other, theirs in held[v].items()
+                            if u in eligible_users[other[0]] for take in range(1, min(2, len(theirs)) + 1)
+                        ]
+                    mismatch_v, days_v = fit(key, v)
+                    for give in range(1, min(2, len(mine)) + 1):
+                        for other, take, back_mismatch_u, back_days_u, back_mismatch_v, back_days_v in offers[v]:
+                            worst = max(
+                                days[u] - give * days_u + take * back_days_u,
+                                days[v] + give * days_v - take * back_days_v
+                            )
+                            if worst >= days[u]:
+                                continue
+                            added = give * (mismatch_v - mismatch_u) + take * (back_mismatch_u - back_mismatch_v) > 0
+                            rank = (added, worst)
+                            if best is None or rank < best[0]:
+                                best = (rank, v, key, give, other, take)
+            return best
+
+        def reassign(key: Tuple[int, Optional[str]], u: int, v: int):
+            a = held[u][key].pop()
+            if not held[u][key]:
+                del held[u][key]
+            held[v].setdefault(key, []).append(a)
+            moved_days = fit(key, v)[1]
+            days[u] -= assignments[a].estimated_days
+            days[v] += moved_days
+            assignments[a] = assignments[a].model_copy(update={'assignee_name': users[v].username, 'estimated_days': moved_days})
+
+        # Only users within one issue of the busiest can still change the makespan, and one with no exchange only
+        # needs another look once someone below them has changed
+        longest = max((assignment.estimated_days for assignment in assignments), default=0)
+        changed = [0] * len(users)
+        looked = [-1] * len(users)
+        step = 0
+        while time.monotonic() < deadline:
+            makespan = max(days)
+            for u in sorted(range(len(users)), key=days.__getitem__, reverse=True):
+                if days[u] <= makespan - longest:
+                    best = None
+                    break
+                if looked[u] >= max((changed[v] for v in range(len(users)) if days[v] < days[u] or v == u), default=0):
+                    continue
+                best = best_exchange(u)
+                if best:
+                    break
+                looked[u] = step
+            else:
+                best = None
+            if best is None:
+                return
+            _, v, key, give, other, take = best
+            for _ in range(give):
+                reassign(key, u, v)
+            for _ in range(take):
+                reassign(other, v, u)
+            step += 1
+            changed[u] = changed[v] = step
+
+    @staticmethod
+    def _base_days(points: int) -> int:
+        return SprintConfig.DAYS_MAPPING.get(points, 3)
+
+    @staticmethod
+    def _add_load_arcs(flow: "_MinCostFlow", node: int, sink: int, spare: float, step: int, total_days: int, user: UserSkillAnalysis):
+        """
+        Connect a user to the sink with arcs that price their load: free while it fits their spare capacity,
+        then BALANCE_PENALTY_DAYS per estimated day more for every further `step` estimated days, the same steps for
+        every user, with a last arc wide enough for the whole backlog. A negative `spare` (a user already past
+        their capacity) starts them further up the steps.
+        """
+        multiplier = AssignmentEngine._multiplier(user)
+        if spare > 0:
+            flow.add_edge(node, sink, math.ceil(spare), 0)
+        # Steps are `step` estimated days wide, so `step / multiplier` units of flow
+        overload = max(0.0, -spare) * multiplier
+        for n in range(1, SprintConfig.BALANCE_MAX_STEPS + 1):
+            width = n * step - max((n - 1) * step, overload)
+            if width > 0:
+                flow.add_edge(node, sink, math.ceil(width / multiplier), round(n * SprintConfig.BALANCE_PENALTY_DAYS * multiplier * 100))
+        flow.add_edge(node, sink, total_days, round((SprintConfig.BALANCE_MAX_STEPS + 1) * SprintConfig.BALANCE_PENALTY_DAYS * multiplier * 100))
+
+    @staticmethod
+    def _multiplier(user: UserSkillAnalysis) -> float:
+        return SprintConfig.EXPERIENCE_MULTIPLIERS.get(user.experience_level, 1.0)
+
+    @staticmethod
+    def _eligible(points: int, experience_level: str) -> bool:
+        limits = SprintConfig.STORY_POINT_LIMITS[experience_level]
+        return limits['min'] <= points <= limits['max']
+
+    @staticmethod
+    def infer_skill(title: str) -> Optional[str]:
+        words = set(re.findall(r"[a-z0-9]+", title.lower()))
+        for skill, keywords in SprintConfig.SKILL_KEYWORDS.items():
+            if words.intersection(keywords):
+                return skill
+        return None
+
+    @staticmethod
+    def _arc_cost(points: int, skill: Optional[str], user: UserSkillAnalysis) -> int:
+        """Cost per base day in hundredths of a day, kept integral for exact shortest paths"""
+        days = AssignmentEngine._base_days(points) * AssignmentEngine._multiplier(user)
+        if skill and user.skill_category not in (skill, 'fullstack'):
+            days += SprintConfig.SKILL_MISMATCH_PENALTY_DAYS
+        if not AssignmentEngine._eligible(points, user.experience_level):
+            days += SprintConfig.INELIGIBLE_PENALTY_DAYS
+        return int(round(days * 100 / AssignmentEngine._base_days(points)))
+
+    @staticmethod
+    def estimated_days(story_points: int, experience_level: str) -> int:
+        base_days = SprintConfig.DAYS_MAPPING.get(story_points, 3)
+        multiplier = SprintConfig.EXPERIENCE_MULTIPLIERS.get(experience_level, 1.0)
+        return max(1, min(int(base_days * multiplier), 15))
+
+
+class _MinCostFlow:
+    """Successive shortest paths with Dijkstra and node potentials; all arc costs must be non-negative"""
+
+    def __init__(self, n: int):
+        self.n = n
+        # Each arc is [to, residual capacity, cost, index of the reverse arc in graph[to]]
+        self.graph: List[List[list]] = [[] for _ in range(n)]
+        self._arcs: List[Tuple[int, int, int]] = []
+
+    def add_edge(self, u: int, v: int, cap: int, cost: int) -> int:
+        """Add an arc and return a handle for flow_on()"""
+        self.graph[u].append([v, cap, cost, len(self.graph[v])])
+        self.graph[v].append([u, 0, -cost, len(self.graph[u]) - 1])
+        self._arcs.append((u, len(self.graph[u]) - 1, cap))
+        return len(self._arcs) - 1
+
+    def flow_on(self, handle: int) -> int:
+        u, index, cap = self._arcs[handle]
+        return cap - self.graph[u][index][1]
+
+    def solve(self, source: int, sink: int, max_flow: int, deadline: float) -> int:
+        """Send up to max_flow units at minimum cost; raises TimeoutError once time.monotonic() passes deadline"""
+        inf = float("inf")
+        potential = [0] * self.n
+        sent = 0
+        while sent < max_flow:
+            if time.monotonic() > deadline:
+                raise TimeoutError
+
+            dist = [inf] * self.n
+            dist[source] = 0
+            prev: List[Optional[Tuple[int, int]]] = [None] * self.n
+            heap = [(0, source)]
+            while heap:
+                d, v = heapq.heappop(heap)
+                if d > dist[v]:
+                    continue
+                pv = potential[v]
+                for i, (to, cap, cost, _) in enumerate(self.graph[v]):
+                    if cap > 0:
+                        nd = d + cost + pv - potential[to]
+                        if nd < dist[to]:
+                            dist[to] = nd
+                            prev[to] = (v, i)
+                            heapq.heappush(heap, (nd, to))
+
+            if dist[sink] == inf:
+                break
+            for v in range(self.n):
+                if dist[v] < inf:
+                    potential[v] += dist[v]
+
+            push = max_flow - sent
+            v = sink
+            while v != source:
+                u, i = prev[v]
+                push = min(push, self.graph[u][i][1])
+                v = u
+            v = sink
+            while v != source:
+                u, i = prev[v]
+                arc = self.graph[u][i]
+                arc[1] -= push
+                self.graph[v][arc[3]][1] += push
+                v = u
+            sent += push
+        return sent
@@ -0,0 +1,151 @@
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from src.models.story_point_estimate import StoryPointEstimateCache
+from src.utils.config import settings
+from src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# (story_points, complexity_reasoning)
+Estimate = Tuple[int, str]
+
+
+class EstimateCache:
+    """
+    Content-addressed cache of AI story point estimates.
+
+    Keys are a SHA-256 of everything that determines the answer (model, prompt version, title,
+    description, basic points), so an unchanged issue maps to the same entry in every process.
+    An in-process LRU of ESTIMATE_CACHE_MEMORY_ENTRIES sits in front of the story_point_estimates
+    table. Entries expire ESTIMATE_CACHE_TTL_DAYS after they were estimated, and the table is trimmed to
+    ESTIMATE_CACHE_MAX_ROWS by least recent use.
+    """
+
+    CHUNK_SIZE = 1000
+
+    def __init__(self):
+        self._memory: "OrderedDict[str, Tuple[int, str, datetime]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(model: str, prompt_version: str, title: str, description: Optional[str], basic_points: int) -> str:
+        # Length-prefix each part so no two different inputs serialize to the same string
+        parts = [model, prompt_version, title or "", description or "", str(basic_points)]
+        payload = "".join(f"{len(p)}:{p}" for p in parts)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get_many(self, keys: Iterable[str], db: Session) -> Dict[str, Estimate]:
+        """Look up keys in memory, then the rest with one query per chunk; refreshes last_used_at on hits"""
+        now = datetime.utcnow()
+        expires_before = now - timedelta(days=settings.ESTIMATE_CACHE_TTL_DAYS)
+        found: Dict[str, Estimate] = {}
+        misses = []
+        for key in dict.fromkeys(keys):
+            entry = self._memory.get(key)
+            if entry and entry[2] >= expires_before:
+                self._memory.move_to_end(key)
+                found[key] = entry[:2]
+            else:
+                misses.append(key)
+
+        try:
+            for start in range(0, len(misses), self.CHUNK_SIZE):
+                stmt = select(
+                    StoryPointEstimateCache.cache_key,
+                    StoryPointEstimateCache.story_points,
+                    StoryPointEstimateCache.complexity_reasoning,
+                    StoryPointEstimateCache.created_at
+                ).where(
+                    StoryPointEstimateCache.cache_key.in_(misses[start:start + self.CHUNK_SIZE]),
+                    StoryPointEstimateCache.created_at >= expires_before
+                )
+                for key, points, reasoning, created_at in db.execute(stmt):
+                    found[key] = (points, reasoning or "")
+                    self._remember(key, points, reasoning or "", created_at)
+
+            hit_keys = list(found)
+            for start in range(0, len(hit_keys), self.CHUNK_SIZE):
+                db.execute(
+                    update(StoryPointEstimateCache)
+                    .where(StoryPointEstimateCache.cache_key.in_(hit_keys[start:start + self.CHUNK_SIZE]))
+                    .values(last_used_at=now)
+                )
+            db.commit()
+        except Exception as e:
+            # The cache is an optimization; planning proceeds with whatever memory hits we have
+            db.rollback()
+            log.warning("estimate_cache.lookup_failed", error=str(e))
+        return found
+
+    def put_many(self, entries: Dict[str, Estimate], model: str, prompt_version: str, db: Session) -> None:
+        """Store estimates with one upsert, then evict expired and least recently used rows"""
+        if not entries:
+            return
+        now = datetime.utcnow()
+        rows = [
+            {
+                "cache_key": key,
+                "model": model,
+                "prompt_version": prompt_version,
+                "story_points": points,
+                "complexity_reasoning": reasoning,
+                "created_at": now,
+                "last_used_at": now,
+            }
+            for key, (points, reasoning) in entries.items()
+        ]
+        for key, (points, reasoning) in entries.items():
+            self._remember(key, points, reasoning, now)
+
+        try:
+            dialect = db.get_bind().dialect.name
+            if dialect in ("postgresql", "sqlite"):
+                insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+                stmt = insert(StoryPointEstimateCache)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[StoryPointEstimateCache.cache_key],
+                    set_={c: stmt.excluded[c] for c in ("story_points", "complexity_reasoning", "created_at", "last_used_at")}
+                )
+                db.execute(stmt, rows)
+            else:
+                for row in rows:
+                    db.merge(StoryPointEstimateCache(**row))
+            self._evict(db, now)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            log.warning("estimate_cache.write_failed", entries=len(entries), error=str(e))
+
+    def clear_memory(self) -> None:
+        self._memory.clear()
+
+    def _remember(self, key: str, points: int, reasoning: str, created_at: datetime) -> None:
+        self._memory[key] = (points, reasoning, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > settings.ESTIMATE_CACHE_MEMORY_ENTRIES:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _evict(db: Session, now: datetime) -> None:
+        expires_before = now - timedelta(days=settings.ESTIMATE_CACHE_TTL_DAYS)
+        db.execute(delete(StoryPointEstimateCache).where(StoryPointEstimateCache.created_at < expires_before))
+
+        excess = db.execute(select(func.count()).select_from(StoryPointEstimateCache)).scalar() - settings.ESTIMATE_CACHE_MAX_ROWS
+        if excess > 0:
+            oldest = (
+                select(StoryPointEstimateCache.cache_key)
+                .order_by(StoryPointEstimateCache.last_used_at)
+                .limit(excess)
+                .scalar_subquery()
+            )
+            db.execute(delete(StoryPointEstimateCache).where(StoryPointEstimateCache.cache_key.in_(oldest)))
+
+
+estimate_cache = EstimateCache()
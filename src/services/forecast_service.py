@@ -0,0 +1,133 @@
+from datetime import date
+from typing import List, Optional
+
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.models.jira_issue import JiraIssue
+from src.models.sprint import Sprint
+from src.models.user import User
+from src.schemas.sprint_schema import SprintForecastDay, SprintForecastResponse, SprintForecastUser
+from src.services.sprint_config import SprintConfig
+from src.services.sprint_service import SprintService
+from src.services.workload_ledger import WorkloadLedger
+
+
+class ForecastService:
+    """
+    Monte Carlo forecast of the open work in a saved sprint.
+
+    Each task's duration is lognormal with its median at the planner's point estimate
+    (DAYS_MAPPING x EXPERIENCE_MULTIPLIERS, unrounded) and a spread set by the assignee's experience
+    (FORECAST_DURATION_SIGMA). A user works their tasks one after another, so their finish day is the sum
+    of their task durations; the sprint finishes when its last user does.
+    Trials are simulated as (trials x tasks) matrices in chunks of TRIAL_CHUNK rows to bound memory.
+    """
+
+    TRIAL_CHUNK = 2000
+
+    @staticmethod
+    def forecast_sprint(
+        sprint_name: str,
+        db: Session,
+        trials: int,
+        sprint_days: int = SprintConfig.SPRINT_WORKING_DAYS,
+        start_date: Optional[date] = None,
+        seed: Optional[int] = None
+    ) -> SprintForecastResponse:
+        # Only remaining work: assignments whose issue still exists and is open, as counted by the workload ledger
+        rows = db.execute(
+            select(Sprint.assignee_name, Sprint.story_points, Sprint.estimated_days)
+            .join(JiraIssue, JiraIssue.key == Sprint.issue_key)
+            .where(Sprint.sprint_name == sprint_name, WorkloadLedger.open_issue())
+        ).all()
+        if not rows:
+            raise HTTPException(status_code=404, detail=f"No open assignments found for sprint '{sprint_name}'")
+
+        # Group each user's tasks into one contiguous run (sorted here, not by the database's collation)
+        rows.sort(key=lambda r: r.assignee_name)
+        assignees = sorted({r.assignee_name for r in rows})
+        tickets = dict(db.execute(select(User.username, User.tickets_solved).where(User.username.in_(assignees))).all())
+        # Assignees without a user row (kept from Jira) are treated as junior, the neutral multiplier
+        levels = {
+            name: SprintService._get_experience_level(tickets[name] or 0) if name in tickets else 'junior'
+            for name in assignees
+        }
+
+        task_user = np.array([r.assignee_name for r in rows])
+        task_level = [levels[r.assignee_name] for r in rows]
+        median_days = np.array([
+            SprintConfig.DAYS_MAPPING.get(r.story_points, 3) * SprintConfig.EXPERIENCE_MULTIPLIERS.get(level, 1.0)
+            for r, level in zip(rows, task_level)
+        ])
+        mu = np.log(median_days).astype(np.float32)
+        sigma = np.array([SprintConfig.FORECAST_DURATION_SIGMA[level] for level in task_level], dtype=np.float32)
+        user_starts = np.flatnonzero(np.r_[True, task_user[1:] != task_user[:-1]])
+
+        user_days = ForecastService._simulate_user_days(mu, sigma, user_starts, trials, np.random.default_rng(seed))
+        finish_days = user_days.max(axis=1)
+
+        start_date = start_date or date.today()
+        horizon = max(sprint_days, int(np.ceil(np.quantile(finish_days, 0.99))))
+        working_days = np.arange(1, horizon + 1)
+        # P(finish <= d) for every working day at once from the sorted finish days
+        probabilities = np.searchsorted(np.sort(finish_days), working_days, side="right") / trials
+        # Day d ends on the d-th business day counting the start date as day 1
+        dates = np.busday_offset(np.datetime64(start_date), working_days - 1, roll="forward")
+
+        overrun = (user_days > sprint_days).mean(axis=0)
+        p50, p90 = np.quantile(user_days, [0.5, 0.9], axis=0)
+        planned_points = np.add.reduceat(np.array([r.story_points for r in rows]), user_starts)
+        planned_days = np.add.reduceat(np.array([r.estimated_days for r in rows]), user_starts)
+        task_counts = np.diff(np.r_[user_starts, len(rows)])
+
+        users: List[SprintForecastUser] = [
+            SprintForecastUser(
+                assignee_name=task_user[start],
+                experience_level=levels[task_user[start]],
+                tasks=int(task_counts[u]),
+                story_points=int(planned_points[u]),
+                planned_days=int(planned_days[u]),
+                p50_days=round(float(p50[u]), 2),
+                p90_days=round(float(p90[u]), 2),
+                overrun_probability=round(float(overrun[u]), 4)
+            ) for u, start in enumerate(user_starts)
+        ]
+        users.sort(key=lambda user: user.overrun_probability, reverse=True)
+
+        return SprintForecastResponse(
+            sprint_name=sprint_name,
+            trials=trials,
+            tasks=len(rows),
+            start_date=start_date,
+            sprint_days=sprint_days,
+            p50_days=round(float(np.quantile(finish_days, 0.5)), 2),
+            p90_days=round(float(np.quantile(finish_days, 0.9)), 2),
+            on_time_probability=round(float((finish_days <= sprint_days).mean()), 4),
+            completion_by_date=[
+                SprintForecastDay(date=d.item(), working_day=int(w), probability=round(float(p), 4))
+                for d, w, p in zip(dates, working_days, probabilities)
+            ],
+            users=users
+        )
+
+    @staticmethod
+    def _simulate_user_days(
+        mu: np.ndarray,
+        sigma: np.ndarray,
+        user_starts: np.ndarray,
+        trials: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        """(trials x users) matrix of each user's simulated working days"""
+        user_days = np.empty((trials, len(user_starts)), dtype=np.float32)
+        for first in range(0, trials, ForecastService.TRIAL_CHUNK):
+            rows = min(ForecastService.TRIAL_CHUNK, trials - first)
+            durations = rng.standard_normal((rows, len(mu)), dtype=np.float32)
+            durations *= sigma
+            durations += mu
+            np.exp(durations, out=durations)
+            user_days[first:first + rows] = np.add.reduceat(durations, user_starts, axis=1)
+        return user_days
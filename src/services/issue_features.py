@@ -0,0 +1,67 @@
+"""
+Text features behind the heuristic story point estimate.
+
+Features are computed once per issue text, persisted on jira_issues when the issue is written and
+carried on JiraIssueResponse, so planning only tokenizes issues that were never stored with them.
+Estimation then runs over whole backlogs as NumPy arrays instead of one issue at a time.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.schemas.jira_schema import JiraIssueResponse
+from src.services.sprint_config import SprintConfig
+
+FEATURE_COLUMNS = ("word_count", "description_length", "keyword_flags")
+
+
+def text_features(title: Optional[str], description: Optional[str]) -> Dict[str, int]:
+    """Feature values for one issue, as stored in the jira_issues columns of the same names"""
+    title = title or ""
+    description = description or ""
+    title_lower = title.lower()
+    flags = 0
+    for bit, word in enumerate(SprintConfig.AI_ANALYSIS_KEYWORDS):
+        if word in title_lower:
+            flags |= 1 << bit
+    return {
+        "word_count": len(title.split()) + len(description.split()),
+        "description_length": len(description),
+        "keyword_flags": flags,
+    }
+
+
+def snap_to_fibonacci(values: np.ndarray) -> np.ndarray:
+    """Vectorized SprintService._get_closest_fibonacci: nearest Fibonacci point (lower on ties), 1 for values <= 0"""
+    fibonacci = np.asarray(SprintConfig.FIBONACCI_POINTS)
+    values = np.asarray(values)
+    nearest = fibonacci[np.abs(values[:, None] - fibonacci[None, :]).argmin(axis=1)]
+    return np.where(values <= 0, 1, nearest)
+
+
+class IssueFeatures:
+    """Columnar features for a batch of issues, in the order given"""
+
+    def __init__(self, word_count: np.ndarray, description_length: np.ndarray, keyword_flags: np.ndarray):
+        self.word_count = word_count
+        self.description_length = description_length
+        self.keyword_flags = keyword_flags
+
+    @classmethod
+    def from_issues(cls, issues: List[JiraIssueResponse]) -> "IssueFeatures":
+        columns = np.empty((len(issues), len(FEATURE_COLUMNS)), dtype=np.int64)
+        for row, issue in enumerate(issues):
+            if issue.word_count is None or issue.description_length is None or issue.keyword_flags is None:
+                values = text_features(issue.title, issue.description)
+                columns[row] = (values["word_count"], values["description_length"], values["keyword_flags"])
+            else:
+                columns[row] = (issue.word_count, issue.description_length, issue.keyword_flags)
+        return cls(columns[:, 0], columns[:, 1], columns[:, 2])
+
+    def basic_story_points(self) -> np.ndarray:
+        buckets = np.asarray(SprintConfig.BASIC_POINT_BUCKETS)
+        bucket = np.searchsorted(np.asarray(SprintConfig.BASIC_POINT_THRESHOLDS), self.word_count, side="left")
+        return snap_to_fibonacci(buckets[bucket])
+
+    def needs_ai(self) -> np.ndarray:
+        return (self.description_length > SprintConfig.AI_DESCRIPTION_LENGTH) | (self.keyword_flags != 0)
@@ -0,0 +1,123 @@
+import asyncio
+import importlib.util
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+from src.utils.config import settings
+
+
+class TokenBucket:
+    """Client-side rate limiter: `rate` requests per second on average, bursts of up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class JiraClient:
+    """
+    Process-wide async client for the Jira REST API.
+    - keep-alive connection pool shared by every caller, HTTP/2 when the h2 package is installed
+    - token-bucket rate limiting in front of every request
+    - retries on 429, 5xx and transport errors with jittered exponential backoff, honouring Retry-After
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._bucket: Optional[TokenBucket] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        # Pools and locks are bound to the event loop that first used them
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=settings.JIRA_BASE_URL,
+                auth=(settings.JIRA_EMAIL, settings.JIRA_API_TOKEN),
+                headers={"Accept": "application/json"},
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=settings.JIRA_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.JIRA_MAX_CONNECTIONS
+                ),
+                timeout=settings.JIRA_TIMEOUT_SECONDS,
+            )
+            self._bucket = TokenBucket(settings.JIRA_RATE_LIMIT_PER_SECOND, settings.JIRA_RATE_LIMIT_BURST)
+            self._loop = loop
+        return self._client
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        client = self._ensure_client()
+        attempt = 0
+        while True:
+            await self._bucket.acquire()
+            try:
+                resp = await client.request(method, path, **kwargs)
+            except httpx.TransportError:
+                if attempt >= settings.JIRA_MAX_RETRIES:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                attempt += 1
+                continue
+
+            if resp.status_code in self.RETRY_STATUSES and attempt < settings.JIRA_MAX_RETRIES:
+                delay = self._retry_after(resp)
+                await asyncio.sleep(delay if delay is not None else self._backoff(attempt))
+                attempt += 1
+                continue
+
+            resp.raise_for_status()
+            return resp
+
+    async def get_json(self, path: str, params: Optional[dict] = None) -> dict:
+        resp = await self.request("GET", path, params=params)
+        return resp.json()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(settings.JIRA_BACKOFF_MAX_SECONDS, settings.JIRA_BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+    @staticmethod
+    def _retry_after(resp: httpx.Response) -> Optional[float]:
+        value = resp.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+
+jira_client = JiraClient()
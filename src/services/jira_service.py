@@ -1,88 +1,337 @@
-import requests
+import asyncio
+import base64
+import httpx
+import math
 import re
-from datetime import datetime
-from typing import List
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from fastapi import HTTPException
 from src.models.jira_issue import JiraIssue
-from src.schemas.jira_schema import JiraIssueResponse, JiraIssueCreate, JiraIssueUpdate
+from src.models.jira_sync_state import JiraSyncState
+from src.models.jira_key_sequence import JiraKeySequence
+from src.models.sprint import Sprint
+from src.schemas.jira_schema import JiraIssueResponse, JiraIssueCreate, JiraIssueUpdate, JiraIssuePage, JiraSyncSummary
+from src.services.jira_client import jira_client
+from src.services.issue_features import FEATURE_COLUMNS, text_features
+from src.services.workload_ledger import WorkloadLedger
+from src.utils.single_flight import single_flight
 from src.utils.config import settings
 
 class JiraService:
 
+    SEARCH_FIELDS = "summary,description,priority,customfield_10016,assignee,status,duedate"
+    UPSERT_COLUMNS = ("key", "project_key", "title", "description", "priority",
+                      "assignee", "status", "story_points", "due_date", "source", *FEATURE_COLUMNS)
+    SOURCE_JIRA = "jira"
+    SOURCE_LOCAL = "local"
+    UPSERT_CHUNK_SIZE = 1000
+
+    @staticmethod
+    async def fetch_and_sync_issues(project_key: str, db: Session, mode: str = "incremental") -> List[JiraIssueResponse]:
+        await JiraService.sync_issues(project_key, db, mode=mode)
+        return JiraService.get_issues_from_db(project_key, db)
+
+    @staticmethod
+    async def sync_all_issues(project_key: str, db: Session) -> JiraSyncSummary:
+        return await JiraService.sync_issues(project_key, db, mode="full")
+
+    @staticmethod
+    async def sync_issues(project_key: str, db: Session, mode: str = "incremental") -> JiraSyncSummary:
+        """
+        Sync a project from Jira into jira_issues.
+        - full: every issue in the project
+        - incremental: only issues updated since the project's watermark (falls back to full on first sync)
+        A key-only reconciliation pass that removes issues deleted in Jira runs every JIRA_RECONCILE_INTERVAL_HOURS.
+        Concurrent syncs of the same project and mode share one run; syncs of a project never overlap.
+        """
+        return await single_flight.do(
+            ("jira_sync", project_key, mode),
+            lambda: JiraService._sync_issues(project_key, db, mode),
+            lock_key=("jira_sync", project_key, "")
+        )
+
+    @staticmethod
+    async def _sync_issues(project_key: str, db: Session, mode: str) -> JiraSyncSummary:
+        state = db.get(JiraSyncState, project_key)
+        if state is None:
+            state = JiraSyncState(project_key=project_key)
+            db.add(state)
+
+        now = datetime.utcnow()
+        # Pages are fetched concurrently by offset, so the order must not change while the search is walked:
+        # ordered by updated, an issue edited mid-sync jumps to the end and shifts the others back a page.
+        # Keys never change and new issues sort last.
+        if mode == "incremental" and state.updated_watermark is not None:
+            # Relative JQL dates avoid guessing the Jira user's timezone; the overlap absorbs clock skew
+            minutes = math.ceil((now - state.updated_watermark).total_seconds() / 60) + settings.JIRA_SYNC_OVERLAP_MINUTES
+            jql = f'project={project_key} AND updated >= "-{minutes}m" ORDER BY key ASC'
+        else:
+            mode = "full"
+            jql = f"project={project_key} ORDER BY key ASC"
+
+        summary = JiraSyncSummary(project_key=project_key, mode=mode)
+        watermark = state.updated_watermark
+
+        def write_page(issues: List[dict]) -> None:
+            nonlocal watermark
+            summary.add_page(*JiraService._write_page(project_key, issues, db))
+            for it in issues:
+                updated = JiraService._parse_jira_datetime(it["fields"].get("updated"))
+                if updated and (watermark is None or updated > watermark):
+                    watermark = updated
+
+        await JiraService._search_pages(jql, JiraService.SEARCH_FIELDS + ",updated", write_page)
+
+        reconcile_due = state.last_reconciled_at is None or \
+            now - state.last_reconciled_at >= timedelta(hours=settings.JIRA_RECONCILE_INTERVAL_HOURS)
+        if reconcile_due:
+            summary.deleted = await JiraService.reconcile_deleted_issues(project_key, db)
+            state.last_reconciled_at = now
+
+        # Only advance the watermark once the whole delta has been written, and never past the start of the
+        # search: an issue edited after its page was fetched is only complete up to then
+        state.updated_watermark = min(watermark, now) if watermark is not None else None
+        state.last_synced_at = now
+        if mode == "full":
+            state.last_full_sync_at = now
+        db.commit()
+        return summary
+
     @staticmethod
-    def fetch_and_sync_issues(project_key: str, db: Session) -> List[JiraIssueResponse]:
-        url = f"{settings.JIRA_BASE_URL}/rest/api/3/search"
-        auth = (settings.JIRA_EMAIL, settings.JIRA_API_TOKEN)
-        headers = {"Accept": "application/json"}
-        params = {
-            "jql": f"project={project_key}",
-            "maxResults": 100,
-            "fields": "summary,description,priority,customfield_10016,assignee,status,duedate"
+    async def reconcile_deleted_issues(project_key: str, db: Session) -> int:
+        """
+        Compare the project's keys in Jira with jira_issues and delete synced issues that no longer exist in Jira,
+        with their sprint assignments. Issues created through this API are never deleted here.
+        """
+        remote_keys = await JiraService._search_keys(project_key)
+
+        synced_keys = {
+            k for (k,) in db.query(JiraIssue.key).filter(
+                JiraIssue.project_key == project_key, JiraIssue.source == JiraService.SOURCE_JIRA
+            )
         }
+        deleted = list(synced_keys - remote_keys)
+        JiraService._delete_issues(deleted, db)
+        db.commit()
+        return len(deleted)
+
+    @staticmethod
+    async def _search_keys(project_key: str) -> Set[str]:
+        """
+        Every issue key in a Jira project, walked by key (key > last ORDER BY key) rather than by offset.
+        Offset pages shift when issues are created or deleted during the walk, and a live key skipped that way
+        would be deleted by reconcile; a key cursor cannot skip. Pages are fetched one after another, and the walk
+        ends on an empty page because Jira may return fewer than maxResults before the end.
+        """
+        keys: Set[str] = set()
+        last = None
+        while True:
+            jql = f"project={project_key}" + (f' AND key > "{last}"' if last else "") + " ORDER BY key ASC"
+            params = {"jql": jql, "startAt": 0, "maxResults": settings.JIRA_PAGE_SIZE, "fields": "key"}
+            try:
+                page = await jira_client.get_json("/rest/api/3/search", params=params)
+            except httpx.HTTPError as e:
+                raise Exception(f"Error fetching Jira issues: {e}")
+            issues = page.get("issues", [])
+            if not issues:
+                return keys
+            keys.update(it["key"] for it in issues)
+            last = issues[-1]["key"]
+
+    @staticmethod
+    def _delete_issues(keys: List[str], db: Session) -> None:
+        """Delete issues with their sprint rows and refresh the workload they held; the caller commits"""
+        entries = WorkloadLedger.issue_entries(keys, db)
+        for chunk_start in range(0, len(keys), JiraService.UPSERT_CHUNK_SIZE):
+            chunk = keys[chunk_start:chunk_start + JiraService.UPSERT_CHUNK_SIZE]
+            db.query(Sprint).filter(Sprint.issue_key.in_(chunk)).delete(synchronize_session=False)
+            db.query(JiraIssue).filter(JiraIssue.key.in_(chunk)).delete(synchronize_session=False)
+        WorkloadLedger.refresh(entries, db)
+
+    @staticmethod
+    async def _search_pages(jql: str, fields: str, handle_page: Callable[[List[dict]], None]) -> None:
+        """
+        Walk every page of a JQL search and pass each page's issues to handle_page as it arrives.
+        Pages after the first are fetched concurrently through the shared Jira client, bounded by
+        JIRA_SYNC_CONCURRENCY; handle_page runs in a worker thread so DB writes overlap with fetching.
+        """
+        page_size = settings.JIRA_PAGE_SIZE
+        concurrency = max(1, settings.JIRA_SYNC_CONCURRENCY)
+
+        async def fetch_page(start_at: int) -> dict:
+            params = {
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": page_size,
+                "fields": fields
+            }
+            try:
+                return await jira_client.get_json("/rest/api/3/search", params=params)
+            except httpx.HTTPError as e:
+                raise Exception(f"Error fetching Jira issues: {e}")
+
+        first = await fetch_page(0)
+        total = first.get("total", 0)
+        await asyncio.to_thread(handle_page, first.get("issues", []))
 
+        offsets = iter(range(page_size, total, page_size))
+        worker_count = min(concurrency, len(range(page_size, total, page_size)))
+        if worker_count == 0:
+            return
+
+        # Bounded queue: fetchers wait while the writer is behind, so memory stays at ~concurrency pages
+        pages: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+        async def fetcher():
+            for start_at in offsets:
+                await pages.put(await fetch_page(start_at))
+
+        async def produce():
+            try:
+                await asyncio.gather(*(fetcher() for _ in range(worker_count)))
+            finally:
+                await pages.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                page = await pages.get()
+                if page is None:
+                    break
+                await asyncio.to_thread(handle_page, page.get("issues", []))
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+
+    @staticmethod
+    def _parse_jira_datetime(value: Optional[str]) -> Optional[datetime]:
+        """Parse a Jira timestamp such as 2024-01-15T10:23:45.123+0000 into naive UTC"""
+        if not value:
+            return None
         try:
-            resp = requests.get(url, headers=headers, auth=auth, params=params)
-            resp.raise_for_status()
-        except requests.RequestException as e:
-            raise Exception(f"Error fetching Jira issues: {e}")
-
-        issues = resp.json().get("issues", [])
-
-        def extract_text(adf):
-            if not adf:
-                return ""
-            parts = []
-            if isinstance(adf, dict):
-                if adf.get("type") == "text":
-                    parts.append(adf.get("text", ""))
-                for key in ["content", "marks"]:
-                    if key in adf:
-                        for child in adf[key]:
-                            parts.append(extract_text(child))
-            elif isinstance(adf, list):
-                for item in adf:
-                    parts.append(extract_text(item))
-            return " ".join(parts).strip()
-
-        for it in issues:
-            key = it["key"]
-            f = it["fields"]
-            title = f["summary"]
-            description = extract_text(f.get("description"))
-            priority = f.get("priority", {}).get("name", "Unknown")
-            assignee = f.get("assignee", {}).get("displayName") if f.get("assignee") else None
-            status = f.get("status", {}).get("name")
-            story_pts = f.get("customfield_10016")
-            due_date = None
-            if f.get("duedate"):
-                try:
-                    due_date = datetime.strptime(f["duedate"], "%Y-%m-%d").date()
-                except ValueError:
-                    due_date = None
-
-            rec = db.query(JiraIssue).filter(JiraIssue.key == key).first()
-            if rec:
-                rec.title = title
-                rec.description = description
-                rec.priority = priority
-                rec.assignee = assignee
-                rec.status = status
-                rec.story_points = story_pts
-                rec.due_date = due_date
-                rec.last_synced_at = func.now()
-            else:
-                rec = JiraIssue(
-                    key=key, project_key=project_key, title=title,
-                    description=description, priority=priority,
-                    assignee=assignee, status=status,
-                    story_points=story_pts, due_date=due_date
-                )
-                db.add(rec)
+            parsed = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z")
+        except ValueError:
+            return None
+        return parsed.astimezone(timezone.utc).replace(tzinfo=None)
 
+    @staticmethod
+    def _extract_text(adf) -> str:
+        if not adf:
+            return ""
+        if isinstance(adf, str):
+            # Webhook payloads carry descriptions as plain text rather than ADF
+            return adf
+        parts = []
+        if isinstance(adf, dict):
+            if adf.get("type") == "text":
+                parts.append(adf.get("text", ""))
+            for key in ["content", "marks"]:
+                if key in adf:
+                    for child in adf[key]:
+                        parts.append(JiraService._extract_text(child))
+        elif isinstance(adf, list):
+            for item in adf:
+                parts.append(JiraService._extract_text(item))
+        return " ".join(parts).strip()
+
+    @staticmethod
+    def _parse_issue(it: dict) -> dict:
+        """Flatten a Jira API issue into JiraIssue column values"""
+        f = it["fields"]
+        due_date = None
+        if f.get("duedate"):
+            try:
+                due_date = datetime.strptime(f["duedate"], "%Y-%m-%d").date()
+            except ValueError:
+                due_date = None
+
+        description = JiraService._extract_text(f.get("description"))
+        return {
+            "key": it["key"],
+            "title": f["summary"],
+            "description": description,
+            "priority": (f.get("priority") or {}).get("name", "Unknown"),
+            "assignee": f.get("assignee", {}).get("displayName") if f.get("assignee") else None,
+            "status": (f.get("status") or {}).get("name"),
+            "story_points": f.get("customfield_10016"),
+            "due_date": due_date,
+            "source": JiraService.SOURCE_JIRA,
+            **text_features(f["summary"], description),
+        }
+
+    @staticmethod
+    def _write_page(project_key: str, issues: List[dict], db: Session) -> Tuple[int, int]:
+        """Upsert one page of Jira issues and commit it. Returns (changed, unchanged)."""
+        rows = [dict(JiraService._parse_issue(it), project_key=project_key) for it in issues]
+        result = JiraService._bulk_upsert_issues(rows, db)
         db.commit()
-        return JiraService.get_issues_from_db(project_key, db)
+        return result
+
+    @staticmethod
+    def _bulk_upsert_issues(rows: List[dict], db: Session) -> Tuple[int, int]:
+        """
+        Set-based upsert of parsed issue rows keyed on JiraIssue.key.
+        One SELECT finds the current content of the batch, and only new or changed rows are written,
+        as a single INSERT ... ON CONFLICT (key) DO UPDATE on PostgreSQL and SQLite.
+        Returns (changed, unchanged).
+        """
+        if not rows:
+            return 0, 0
+
+        # Last occurrence of a key wins, matching the old per-issue overwrite behaviour
+        rows = list({row["key"]: row for row in rows}.values())
+        columns = [c for c in JiraService.UPSERT_COLUMNS if c in rows[0]]
+
+        existing = {}
+        for chunk_start in range(0, len(rows), JiraService.UPSERT_CHUNK_SIZE):
+            keys = [row["key"] for row in rows[chunk_start:chunk_start + JiraService.UPSERT_CHUNK_SIZE]]
+            stmt = select(*(getattr(JiraIssue, c) for c in columns)).where(JiraIssue.key.in_(keys))
+            for current in db.execute(stmt):
+                existing[current.key] = tuple(current)
+
+        changed = [row for row in rows if existing.get(row["key"]) != tuple(row[c] for c in columns)]
+        if not changed:
+            return 0, len(rows)
+
+        now = datetime.utcnow()
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+            stmt = insert(JiraIssue)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[JiraIssue.key],
+                set_={
+                    **{c: stmt.excluded[c] for c in columns if c != "key"},
+                    "updated_at": now,
+                    "last_synced_at": now,
+                }
+            )
+            db.execute(stmt, changed)
+        else:
+            # Generic fallback: still set-based, split into bulk inserts and bulk updates
+            ids = dict(db.query(JiraIssue.key, JiraIssue.id).filter(JiraIssue.key.in_([r["key"] for r in changed])).all())
+            updates = [dict(row, id=ids[row["key"]], updated_at=now, last_synced_at=now) for row in changed if row["key"] in ids]
+            inserts = [row for row in changed if row["key"] not in ids]
+            if updates:
+                db.bulk_update_mappings(JiraIssue, updates)
+            if inserts:
+                db.bulk_insert_mappings(JiraIssue, inserts)
+
+        if "status" in columns:
+            # New issues and status changes can move sprint rows into or out of the workload ledger
+            status_index = columns.index("status")
+            WorkloadLedger.refresh_issues(
+                [row["key"] for row in changed if row["key"] not in existing or existing[row["key"]][status_index] != row["status"]],
+                db
+            )
+
+        JiraService._advance_key_sequences([row for row in changed if row["key"] not in existing], db)
+        return len(changed), len(rows) - len(changed)
 
     @staticmethod
     def get_issues_from_db(project_key: str, db: Session) -> List[JiraIssueResponse]:
@@ -92,31 +341,102 @@ class JiraService:
                 id=r.id, key=r.key, title=r.title,
                 description=r.description or "", priority=r.priority,
                 assignee=r.assignee, status=r.status,
-                story_points=r.story_points, due_date=r.due_date
+                story_points=r.story_points, due_date=r.due_date,
+                word_count=r.word_count, description_length=r.description_length, keyword_flags=r.keyword_flags
             ) for r in rows
         ]
 
     @staticmethod
-    def create_issue(issue_data: JiraIssueCreate, db: Session) -> JiraIssueResponse:
-        keys = db.query(JiraIssue.key).filter(JiraIssue.project_key == issue_data.project_key).all()
-        max_no = 0
-        pat = re.compile(rf"{re.escape(issue_data.project_key)}-(\d+)$")
-        for (k,) in keys:
-            m = pat.match(k)
-            if m:
-                max_no = max(max_no, int(m.group(1)))
+    def get_issues_by_keys(keys: List[str], db: Session) -> List[JiraIssueResponse]:
+        rows = []
+        for chunk_start in range(0, len(keys), JiraService.UPSERT_CHUNK_SIZE):
+            chunk = keys[chunk_start:chunk_start + JiraService.UPSERT_CHUNK_SIZE]
+            rows.extend(db.query(JiraIssue).filter(JiraIssue.key.in_(chunk)).all())
+        return [
+            JiraIssueResponse(
+                id=r.id, key=r.key, title=r.title,
+                description=r.description or "", priority=r.priority,
+                assignee=r.assignee, status=r.status,
+                story_points=r.story_points, due_date=r.due_date,
+                word_count=r.word_count, description_length=r.description_length, keyword_flags=r.keyword_flags
+            ) for r in rows
+        ]
 
-        new_key = f"{issue_data.project_key}-{max_no+1}"
-        ass = issue_data.assignee.strip() if issue_data.assignee and issue_data.assignee.strip().lower() != "string" else None
-        sp = issue_data.story_points if issue_data.story_points not in (0, "0", "", None) else None
+    PAGE_FIELDS = ("id", "key", "title", "description", "story_points", "priority", "assignee", "status", "due_date")
 
-        rec = JiraIssue(
-            key=new_key, project_key=issue_data.project_key,
-            title=issue_data.title, description=issue_data.description,
-            priority=issue_data.priority, assignee=ass,
-            status=issue_data.status, story_points=sp,
-            due_date=issue_data.due_date
+    @staticmethod
+    def get_issues_page(
+        project_key: str,
+        db: Session,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        statuses: Optional[List[str]] = None,
+        assignee: Optional[str] = None,
+        priorities: Optional[List[str]] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        fields: Optional[List[str]] = None
+    ) -> JiraIssuePage:
+        """
+        Keyset-paginated issue listing ordered by (project_key, id).
+        The cursor is the opaque id of the last row of the previous page; `fields` limits the selected
+        columns so list views can skip large descriptions (id and key are always included).
+        """
+        if fields:
+            unknown = set(fields) - set(JiraService.PAGE_FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+            selected = [f for f in JiraService.PAGE_FIELDS if f in fields or f in ("id", "key")]
+        else:
+            selected = list(JiraService.PAGE_FIELDS)
+
+        query = select(*(getattr(JiraIssue, f) for f in selected)).where(JiraIssue.project_key == project_key)
+        if cursor:
+            query = query.where(JiraIssue.id > JiraService._decode_cursor(cursor))
+        if statuses:
+            query = query.where(JiraIssue.status.in_(statuses))
+        if assignee is not None:
+            query = query.where(JiraIssue.assignee == assignee) if assignee else query.where(JiraIssue.assignee.is_(None))
+        if priorities:
+            query = query.where(JiraIssue.priority.in_(priorities))
+        if due_from:
+            query = query.where(JiraIssue.due_date >= due_from)
+        if due_to:
+            query = query.where(JiraIssue.due_date <= due_to)
+
+        # Fetch one extra row to learn whether another page exists
+        rows = db.execute(query.order_by(JiraIssue.id).limit(limit + 1)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        items = []
+        for row in rows:
+            item = dict(row._mapping)
+            if "description" in item and item["description"] is None:
+                item["description"] = ""
+            items.append(item)
+
+        return JiraIssuePage(
+            items=items,
+            next_cursor=JiraService._encode_cursor(rows[-1].id) if has_more else None,
+            limit=limit
         )
+
+    @staticmethod
+    def _encode_cursor(last_id: int) -> str:
+        return base64.urlsafe_b64encode(str(last_id).encode()).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> int:
+        try:
+            return int(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode())
+        except (ValueError, UnicodeDecodeError):
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def create_issue(issue_data: JiraIssueCreate, db: Session) -> JiraIssueResponse:
+        number = JiraService._reserve_issue_numbers(issue_data.project_key, 1, db)
+        rec = JiraService._new_issue_record(issue_data, f"{issue_data.project_key}-{number}")
         db.add(rec)
         db.commit()
         db.refresh(rec)
@@ -128,14 +448,118 @@ class JiraService:
             story_points=rec.story_points, due_date=rec.due_date
         )
 
+    @staticmethod
+    def create_issues(issues_data: List[JiraIssueCreate], db: Session) -> List[JiraIssueResponse]:
+        """Create many issues, reserving each project's block of keys with a single statement"""
+        by_project: Dict[str, List[JiraIssueCreate]] = {}
+        for issue_data in issues_data:
+            by_project.setdefault(issue_data.project_key, []).append(issue_data)
+
+        keys: Dict[int, str] = {}
+        for project_key, project_issues in by_project.items():
+            first = JiraService._reserve_issue_numbers(project_key, len(project_issues), db)
+            for offset, issue_data in enumerate(project_issues):
+                keys[id(issue_data)] = f"{project_key}-{first + offset}"
+
+        recs = [JiraService._new_issue_record(issue_data, keys[id(issue_data)]) for issue_data in issues_data]
+        db.add_all(recs)
+        db.flush()
+        responses = [
+            JiraIssueResponse(
+                id=rec.id, key=rec.key, title=rec.title,
+                description=rec.description, priority=rec.priority,
+                assignee=rec.assignee, status=rec.status,
+                story_points=rec.story_points, due_date=rec.due_date
+            ) for rec in recs
+        ]
+        db.commit()
+        return responses
+
+    @staticmethod
+    def _new_issue_record(issue_data: JiraIssueCreate, key: str) -> JiraIssue:
+        ass = issue_data.assignee.strip() if issue_data.assignee and issue_data.assignee.strip().lower() != "string" else None
+        sp = issue_data.story_points if issue_data.story_points not in (0, "0", "", None) else None
+
+        return JiraIssue(
+            key=key, project_key=issue_data.project_key,
+            title=issue_data.title, description=issue_data.description,
+            priority=issue_data.priority, assignee=ass,
+            status=issue_data.status, story_points=sp,
+            due_date=issue_data.due_date,
+            source=JiraService.SOURCE_LOCAL,
+            **text_features(issue_data.title, issue_data.description)
+        )
+
+    @staticmethod
+    def _reserve_issue_numbers(project_key: str, count: int, db: Session) -> int:
+        """
+        Atomically reserve `count` consecutive issue numbers for a project and return the first.
+        The UPDATE ... RETURNING row-locks the project's sequence until the caller commits,
+        so concurrent creates never mint the same key.
+        """
+        stmt = (
+            update(JiraKeySequence)
+            .where(JiraKeySequence.project_key == project_key)
+            .values(last_number=JiraKeySequence.last_number + count)
+            .returning(JiraKeySequence.last_number)
+        )
+        last = db.execute(stmt).scalar()
+        if last is None:
+            JiraService._backfill_key_sequence(project_key, db)
+            last = db.execute(stmt).scalar()
+        return last - count + 1
+
+    @staticmethod
+    def _backfill_key_sequence(project_key: str, db: Session) -> None:
+        """One-time scan of a project's existing keys to seed its sequence"""
+        max_no = 0
+        pat = re.compile(rf"{re.escape(project_key)}-(\d+)$")
+        for (k,) in db.query(JiraIssue.key).filter(JiraIssue.project_key == project_key):
+            m = pat.match(k)
+            if m:
+                max_no = max(max_no, int(m.group(1)))
+
+        values = {"project_key": project_key, "last_number": max_no}
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+            # A concurrent backfill may have won the race; its row is equivalent
+            db.execute(insert(JiraKeySequence).values(**values).on_conflict_do_nothing(index_elements=["project_key"]))
+        else:
+            db.merge(JiraKeySequence(**values))
+            db.flush()
+
+    @staticmethod
+    def _advance_key_sequences(rows: List[dict], db: Session) -> None:
+        """Keep sequences ahead of keys that arrive from Jira, so local creates never collide with them"""
+        highest: Dict[str, int] = {}
+        for row in rows:
+            project_key, _, number = row["key"].rpartition("-")
+            if project_key == row["project_key"] and number.isdigit():
+                highest[project_key] = max(highest.get(project_key, 0), int(number))
+
+        for project_key, number in highest.items():
+            db.execute(
+                update(JiraKeySequence)
+                .where(JiraKeySequence.project_key == project_key, JiraKeySequence.last_number < number)
+                .values(last_number=number)
+            )
+
     @staticmethod
     def update_issue_by_key(issue_key: str, updated_data: JiraIssueUpdate, db: Session) -> JiraIssueResponse:
         rec = db.query(JiraIssue).filter(JiraIssue.key == issue_key).first()
         if not rec:
             raise HTTPException(status_code=404, detail="Issue not found")
 
-        for field, val in updated_data.dict(exclude_unset=True).items():
+        changes = updated_data.dict(exclude_unset=True)
+        for field, val in changes.items():
             setattr(rec, field, val)
+        if "title" in changes or "description" in changes:
+            for field, val in text_features(rec.title, rec.description).items():
+                setattr(rec, field, val)
+        if "status" in changes:
+            db.flush()
+            WorkloadLedger.refresh_issues([rec.key], db)
 
         db.commit()
         db.refresh(rec)
@@ -152,5 +576,5 @@ class JiraService:
         rec = db.query(JiraIssue).filter(JiraIssue.key == issue_key).first()
         if not rec:
             raise HTTPException(status_code=404, detail="Issue not found")
-        db.delete(rec)
+        JiraService._delete_issues([rec.key], db)
         db.commit()
@@ -0,0 +1,135 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from src.database.db import SessionLocal
+from src.models.jira_sync_state import JiraSyncState
+from src.schemas.jira_schema import JiraSyncStatus
+from src.services.jira_service import JiraService
+from src.utils.config import settings
+from src.utils.logger import correlation_id, get_logger, new_correlation_id
+
+log = get_logger(__name__)
+
+
+class JiraSyncScheduler:
+    """
+    Keeps active projects fresh in the background so reads never wait on Jira.
+    A project becomes active when it is read and stays active for active_ttl without reads.
+    A ticker queues every active project whose last sync is older than `interval`;
+    a fixed pool of workers drains the queue, one sync per project at a time.
+    """
+
+    def __init__(self, interval: timedelta, workers: int, active_ttl: timedelta):
+        self.interval = interval
+        self.workers = workers
+        self.active_ttl = active_ttl
+        self._active: Dict[str, datetime] = {}
+        self._last_synced: Dict[str, datetime] = {}
+        self._pending: Dict[str, str] = {}
+        self._running: Dict[str, Optional[str]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        db = SessionLocal()
+        try:
+            for state in db.query(JiraSyncState).all():
+                if state.last_synced_at:
+                    self._last_synced[state.project_key] = state.last_synced_at
+        finally:
+            db.close()
+
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._ticker()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def touch(self, project_key: str) -> None:
+        """Mark a project as read; queue a first sync if it has never been synced"""
+        self._active[project_key] = datetime.utcnow()
+        if project_key not in self._last_synced:
+            self.request_refresh(project_key)
+
+    def request_refresh(self, project_key: str, mode: str = "incremental") -> bool:
+        """Queue an out-of-band sync. Returns False if one is already queued (a full request still upgrades it)."""
+        self._active[project_key] = datetime.utcnow()
+        if project_key in self._running:
+            # Run again once the in-flight sync finishes, so changes made during it are not missed
+            queued = self._running[project_key] is None
+            if queued or mode == "full":
+                self._running[project_key] = mode
+            return queued
+        if project_key in self._pending:
+            if mode == "full":
+                self._pending[project_key] = "full"
+            return False
+        if self._queue is None:
+            return False
+        self._pending[project_key] = mode
+        self._queue.put_nowait(project_key)
+        return True
+
+    def status(self, project_key: str) -> JiraSyncStatus:
+        last_synced_at = self._last_synced.get(project_key)
+        stale_after = last_synced_at + self.interval if last_synced_at else None
+        return JiraSyncStatus(
+            project_key=project_key,
+            last_synced_at=last_synced_at,
+            stale_after=stale_after,
+            stale=stale_after is None or stale_after <= datetime.utcnow(),
+            refresh_pending=project_key in self._pending or project_key in self._running
+        )
+
+    async def _ticker(self) -> None:
+        tick = min(self.interval.total_seconds(), 60)
+        while True:
+            now = datetime.utcnow()
+            for project_key, last_read in list(self._active.items()):
+                if now - last_read > self.active_ttl:
+                    del self._active[project_key]
+                    continue
+                if project_key in self._pending or project_key in self._running:
+                    continue
+                last_synced_at = self._last_synced.get(project_key)
+                if last_synced_at is None or now - last_synced_at >= self.interval:
+                    self.request_refresh(project_key)
+            await asyncio.sleep(tick)
+
+    async def _worker(self) -> None:
+        while True:
+            project_key = await self._queue.get()
+            mode = self._pending.pop(project_key, "incremental")
+            self._running[project_key] = None
+            # Each background sync gets its own id so its records can be told apart from request traffic
+            correlation_id.set(new_correlation_id())
+            db = SessionLocal()
+            try:
+                summary = await JiraService.sync_issues(project_key, db, mode=mode)
+                self._last_synced[project_key] = datetime.utcnow()
+                log.info("jira_sync.completed", project=project_key, mode=summary.mode, fetched=summary.fetched,
+                         changed=summary.changed, unchanged=summary.unchanged, deleted=summary.deleted)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error("jira_sync.failed", project=project_key, mode=mode, error=str(e))
+            finally:
+                db.close()
+                rerun = self._running.pop(project_key, None)
+                self._queue.task_done()
+                if rerun is not None:
+                    self.request_refresh(project_key, rerun)
+
+
+jira_sync_scheduler = JiraSyncScheduler(
+    interval=timedelta(seconds=settings.JIRA_SYNC_INTERVAL_SECONDS),
+    workers=settings.JIRA_SYNC_WORKERS,
+    active_ttl=timedelta(hours=settings.JIRA_ACTIVE_PROJECT_TTL_HOURS),
+)
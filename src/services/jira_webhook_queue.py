@@ -0,0 +1,172 @@
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from src.database.db import SessionLocal
+from src.schemas.jira_schema import JiraWebhookMetrics
+from src.services.jira_service import JiraService
+from src.utils.config import settings
+from src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class JiraWebhookQueue:
+    """
+    In-memory write-behind queue for Jira webhook events.
+    Events are coalesced by issue key (the latest event for a key wins) and flushed to jira_issues
+    in batches when batch_size keys are pending or flush_interval seconds have passed.
+    The number of pending keys is bounded by max_pending; enqueue() refuses new keys beyond that.
+    When a batch fails, its events are retried one at a time so one bad event cannot hold back the rest;
+    an event that has failed max_attempts flushes is dropped and logged, and the next sync repairs the issue.
+    """
+
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+    def __init__(self, max_pending: int, batch_size: int, flush_interval: float, max_attempts: int):
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self._pending: "OrderedDict[str, Tuple[str, Optional[dict]]]" = OrderedDict()
+        # Failed writes of the pending event per key; a newer event for the key starts over
+        self._attempts: Dict[str, int] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._metrics = JiraWebhookMetrics(max_pending=max_pending)
+
+    def enqueue(self, event_type: str, issue: dict) -> bool:
+        """Queue one webhook event. Returns False when the queue is full and the event was rejected."""
+        key = issue["key"]
+        self._metrics.received += 1
+
+        if key in self._pending:
+            self._metrics.coalesced += 1
+            self._pending.move_to_end(key)
+        elif len(self._pending) >= self.max_pending:
+            self._metrics.rejected += 1
+            return False
+        self._attempts.pop(key, None)
+
+        if event_type == self.DELETE:
+            self._pending[key] = (self.DELETE, None)
+        else:
+            project_key = ((issue.get("fields") or {}).get("project") or {}).get("key") or key.rsplit("-", 1)[0]
+            self._pending[key] = (self.UPSERT, dict(JiraService._parse_issue(issue), project_key=project_key))
+
+        self._metrics.pending = len(self._pending)
+        self._metrics.high_water_mark = max(self._metrics.high_water_mark, len(self._pending))
+        if len(self._pending) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def metrics(self) -> JiraWebhookMetrics:
+        self._metrics.pending = len(self._pending)
+        return self._metrics.model_copy()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background writer and flush whatever is still pending"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                log.error("jira_webhook.flush_failed", pending=len(self._pending), error=str(e))
+
+    async def flush(self) -> None:
+        while self._pending:
+            batch: Dict[str, Tuple[str, Optional[dict]]] = {}
+            while self._pending and len(batch) < self.batch_size:
+                key, event = self._pending.popitem(last=False)
+                batch[key] = event
+            self._metrics.pending = len(self._pending)
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                self._metrics.flush_errors += 1
+                log.warning("jira_webhook.batch_failed", events=len(batch), error=str(e))
+                failed = await self._write_singly(batch)
+                if failed:
+                    # Put them back unless a newer event for the same key arrived meanwhile, and leave the
+                    # rest of the queue for the next flush rather than hammering a failing database
+                    for key, event in reversed(list(failed.items())):
+                        if key not in self._pending:
+                            self._pending[key] = event
+                            self._pending.move_to_end(key, last=False)
+                    self._metrics.pending = len(self._pending)
+                    return
+                continue
+
+            for key in batch:
+                self._attempts.pop(key, None)
+            self._metrics.flushed_batches += 1
+            self._metrics.flushed_events += len(batch)
+            self._metrics.last_flush_at = datetime.utcnow()
+
+    async def _write_singly(self, batch: Dict[str, Tuple[str, Optional[dict]]]) -> Dict[str, Tuple[str, Optional[dict]]]:
+        """Write a failed batch one event at a time. Returns the events to retry; events out of attempts are dropped."""
+        failed = {}
+        for key, event in batch.items():
+            try:
+                await asyncio.to_thread(self._write_batch, {key: event})
+            except Exception as e:
+                attempts = self._attempts.get(key, 0) + 1
+                if attempts >= self.max_attempts:
+                    self._attempts.pop(key, None)
+                    self._metrics.dropped += 1
+                    log.error("jira_webhook.event_dropped", key=key, action=event[0], attempts=attempts, error=str(e))
+                else:
+                    self._attempts[key] = attempts
+                    failed[key] = event
+                continue
+            self._attempts.pop(key, None)
+            self._metrics.flushed_events += 1
+            self._metrics.last_flush_at = datetime.utcnow()
+        return failed
+
+    @staticmethod
+    def _write_batch(batch: Dict[str, Tuple[str, Optional[dict]]]) -> None:
+        upserts: List[dict] = [row for action, row in batch.values() if action == JiraWebhookQueue.UPSERT]
+        deletes: List[str] = [key for key, (action, _) in batch.items() if action == JiraWebhookQueue.DELETE]
+
+        db = SessionLocal()
+        try:
+            JiraService._bulk_upsert_issues(upserts, db)
+            if deletes:
+                JiraService._delete_issues(deletes, db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+jira_webhook_queue = JiraWebhookQueue(
+    max_pending=settings.JIRA_WEBHOOK_MAX_PENDING,
+    batch_size=settings.JIRA_WEBHOOK_BATCH_SIZE,
+    flush_interval=settings.JIRA_WEBHOOK_FLUSH_SECONDS,
+    max_attempts=settings.JIRA_WEBHOOK_MAX_ATTEMPTS,
+)
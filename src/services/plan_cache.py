@@ -0,0 +1,53 @@
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from src.schemas.sprint_schema import SprintPlanPreview
+from src.utils.config import settings
+
+
+class PlanCache:
+    """
+    In-process cache of previewed sprint plans, keyed by plan id.
+    Entries expire `ttl` seconds after they were computed; beyond `max_entries` the oldest plan is dropped.
+    Plans live in the worker that computed them, so a commit must reach the same process as its preview.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._plans: "OrderedDict[str, Tuple[float, SprintPlanPreview]]" = OrderedDict()
+
+    def new_plan_id(self) -> str:
+        return uuid.uuid4().hex
+
+    def put(self, plan: SprintPlanPreview) -> None:
+        self._evict_expired()
+        self._plans[plan.plan_id] = (time.monotonic() + self.ttl, plan)
+        while len(self._plans) > self.max_entries:
+            self._plans.popitem(last=False)
+
+    def get(self, plan_id: str) -> Optional[SprintPlanPreview]:
+        entry = self._plans.get(plan_id)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._plans[plan_id]
+            return None
+        return entry[1]
+
+    def discard(self, plan_id: str) -> None:
+        self._plans.pop(plan_id, None)
+
+    def _evict_expired(self) -> None:
+        # Insertion order is expiry order since every entry gets the same ttl
+        now = time.monotonic()
+        while self._plans and next(iter(self._plans.values()))[0] < now:
+            self._plans.popitem(last=False)
+
+
+plan_cache = PlanCache(
+    ttl=settings.SPRINT_PLAN_CACHE_TTL_SECONDS,
+    max_entries=settings.SPRINT_PLAN_CACHE_MAX_ENTRIES
+)
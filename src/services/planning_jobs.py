@@ -0,0 +1,285 @@
+import asyncio
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from fastapi import HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.database.db import SessionLocal
+from src.models.planning_job import PlanningJob
+from src.schemas.sprint_schema import (
+    PlanningJobProgress, PlanningJobResponse, SprintAssignmentResponse, SprintCreateRequest
+)
+from src.services.sprint_service import SprintService
+from src.utils.config import settings
+from src.utils.logger import correlation_id, get_logger
+
+log = get_logger(__name__)
+
+
+class PlanningJobQueue:
+    """
+    Background queue for sprint planning jobs, persisted in planning_jobs.
+    The in-memory queue only carries job ids; a fixed pool of `workers` tasks runs at most that many plans
+    at once per process, which bounds concurrent LLM batches and database sessions. Submissions beyond
+    max_pending queued jobs are refused.
+    A running job is leased to the queue instance that claimed it (owner) until lease_expires_at. While it runs,
+    a reporter task writes its progress at most every progress_interval seconds and renews the lease, off the
+    event loop. On start and then every lease period, each queue requeues
+    running jobs whose lease has lapsed, since their process died, and picks up queued jobs; jobs other live
+    processes are running are left alone, and so are jobs already waiting or running here. Planning saves are upserts, so re-running an interrupted job is
+    safe; a job is failed once it has been started max_attempts times.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    def __init__(self, workers: int, max_pending: int, max_attempts: int, lease: timedelta, progress_interval: float):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.lease = lease
+        self.progress_interval = progress_interval
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._queue: Optional[asyncio.Queue] = None
+        # Ids in this process's queue or running in its workers, so a recovery never queues a job twice
+        self._pending: Set[str] = set()
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue()
+        self._pending.clear()
+        await self._requeue()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._recover_periodically()))
+
+    async def stop(self) -> None:
+        """Stop the workers; interrupted jobs stay running until their lease lapses and a queue requeues them"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(self, request: SprintCreateRequest, db: Session) -> PlanningJobResponse:
+        if self._queue is None:
+            raise HTTPException(status_code=503, detail="Planning job queue is not running")
+        if self._queue.qsize() >= self.max_pending:
+            raise HTTPException(status_code=429, detail=f"Too many queued planning jobs ({self.max_pending}); retry later")
+
+        job = PlanningJob(
+            id=uuid.uuid4().hex,
+            project_key=request.project_key,
+            sprint_name=request.sprint_name,
+            team_name=request.team_name,
+            strategy=request.strategy,
+            status=self.QUEUED,
+            attempts=0,
+            issues_estimated=0,
+            issues_assigned=0,
+            issues_saved=0,
+            created_at=datetime.utcnow()
+        )
+        db.add(job)
+        db.commit()
+        self._enqueue(job.id)
+        log.info(
+            "planning_job.queued",
+            job=job.id, project=job.project_key, team=job.team_name, sprint=job.sprint_name, queued=self._queue.qsize()
+        )
+        return self.to_response(job)
+
+    @staticmethod
+    def get(job_id: str, db: Session) -> PlanningJobResponse:
+        job = db.get(PlanningJob, job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Planning job '{job_id}' not found")
+        return PlanningJobQueue.to_response(job)
+
+    @staticmethod
+    def to_response(job: PlanningJob) -> PlanningJobResponse:
+        return PlanningJobResponse(
+            job_id=job.id,
+            status=job.status,
+            project_key=job.project_key,
+            sprint_name=job.sprint_name,
+            team_name=job.team_name,
+            strategy=job.strategy,
+            attempts=job.attempts,
+            progress=PlanningJobProgress(
+                estimated=job.issues_estimated, assigned=job.issues_assigned, saved=job.issues_saved
+            ),
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            error=job.error,
+            assignments=[SprintAssignmentResponse(**a) for a in job.result] if job.result is not None else None
+        )
+
+    def _enqueue(self, job_id: str) -> None:
+        if job_id not in self._pending:
+            self._pending.add(job_id)
+            self._queue.put_nowait(job_id)
+
+    async def _requeue(self) -> None:
+        for job_id in await asyncio.to_thread(self._recover):
+            self._enqueue(job_id)
+
+    def _recover(self) -> List[str]:
+        """Requeue running jobs whose lease lapsed and return every queued job's id, oldest first"""
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            expired = (PlanningJob.lease_expires_at.is_(None)) | (PlanningJob.lease_expires_at < now)
+            requeued = db.execute(
+                update(PlanningJob)
+                .where(PlanningJob.status == self.RUNNING, expired)
+                .values(status=self.QUEUED, owner=None, lease_expires_at=None)
+            ).rowcount
+            db.commit()
+            queued = db.execute(
+                select(PlanningJob.id).where(PlanningJob.status == self.QUEUED).order_by(PlanningJob.created_at)
+            ).scalars().all()
+        finally:
+            db.close()
+        if requeued:
+            log.info("planning_job.resumed", jobs=requeued)
+        return list(queued)
+
+    async def _recover_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease.total_seconds())
+            try:
+                await self._requeue()
+            except Exception as e:
+                log.error("planning_job.recover_failed", error=str(e))
+
+    async def _report(self, job_id: str, progress: Dict[str, int]) -> None:
+        """
+        While the job runs, write the counts planning has put in `progress` when they changed, and extend the
+        lease every third of the lease period. Planning only updates the dict, so it never waits on the database.
+        """
+        written: Dict[str, int] = {}
+        renewed_at = time.monotonic()
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            values = {f"issues_{stage}": count for stage, count in progress.items() if written.get(stage) != count}
+            renew = time.monotonic() - renewed_at >= self.lease.total_seconds() / 3
+            if renew:
+                values["lease_expires_at"] = datetime.utcnow() + self.lease
+            if not values:
+                continue
+            snapshot = dict(progress)
+            try:
+                held = await asyncio.to_thread(self._update, job_id, **values)
+            except Exception as e:
+                log.warning("planning_job.report_failed", job=job_id, error=str(e))
+                continue
+            written.update(snapshot)
+            if renew:
+                renewed_at = time.monotonic()
+            if not held:
+                log.warning("planning_job.lease_lost", job=job_id, owner=self.owner)
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                log.error("planning_job.worker_error", job=job_id, error=str(e))
+            finally:
+                self._pending.discard(job_id)
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        token = correlation_id.set(job_id)
+        db = SessionLocal()
+        try:
+            # Conditional claim, so a job queued twice (or by two processes) only runs once at a time
+            claimed = db.execute(
+                update(PlanningJob)
+                .where(PlanningJob.id == job_id, PlanningJob.status == self.QUEUED)
+                .values(
+                    status=self.RUNNING, attempts=PlanningJob.attempts + 1, started_at=datetime.utcnow(),
+                    owner=self.owner, lease_expires_at=datetime.utcnow() + self.lease,
+                    issues_estimated=0, issues_assigned=0, issues_saved=0, error=None
+                )
+            ).rowcount
+            db.commit()
+            if not claimed:
+                return
+            job = db.get(PlanningJob, job_id)
+            if job.attempts > self.max_attempts:
+                await self._finish(job_id, self.FAILED, error=f"Gave up after {self.max_attempts} attempts")
+                log.error("planning_job.abandoned", job=job_id, attempts=job.attempts - 1)
+                return
+
+            started = time.perf_counter()
+            progress: Dict[str, int] = {}
+            reporter = asyncio.create_task(self._report(job_id, progress))
+            try:
+                assignments = await SprintService.create_sprint_assignments(
+                    project_key=job.project_key,
+                    sprint_name=job.sprint_name,
+                    team_name=job.team_name,
+                    db=db,
+                    strategy=job.strategy,
+                    progress=progress.__setitem__
+                )
+            except Exception as e:
+                error = e.detail if isinstance(e, HTTPException) else str(e)
+                await self._finish(job_id, self.FAILED, progress, error=error)
+                log.error("planning_job.failed", job=job_id, attempt=job.attempts, error=error)
+                return
+            finally:
+                reporter.cancel()
+
+            await self._finish(job_id, self.SUCCEEDED, progress, result=[a.model_dump() for a in assignments])
+            log.info(
+                "planning_job.succeeded",
+                job=job_id, attempt=job.attempts, assignments=len(assignments),
+                duration_ms=round((time.perf_counter() - started) * 1000)
+            )
+        finally:
+            db.close()
+            correlation_id.reset(token)
+
+    def _update(self, job_id: str, **values) -> bool:
+        """
+        Write job columns in a short session of their own, independent of the planning session.
+        Only while this queue still holds the job's lease; returns False once another queue has taken it over.
+        """
+        db = SessionLocal()
+        try:
+            updated = db.execute(
+                update(PlanningJob).where(PlanningJob.id == job_id, PlanningJob.owner == self.owner).values(**values)
+            ).rowcount
+            db.commit()
+            return bool(updated)
+        finally:
+            db.close()
+
+    async def _finish(self, job_id: str, status: str, progress: Optional[Dict[str, int]] = None, **values) -> None:
+        """Record the outcome with the final progress counts"""
+        counts = {f"issues_{stage}": count for stage, count in (progress or {}).items()}
+        await asyncio.to_thread(
+            self._update, job_id, status=status, finished_at=datetime.utcnow(), lease_expires_at=None, **counts, **values
+        )
+
+
+planning_job_queue = PlanningJobQueue(
+    workers=settings.PLANNING_JOB_WORKERS,
+    max_pending=settings.PLANNING_JOB_MAX_PENDING,
+    max_attempts=settings.PLANNING_JOB_MAX_ATTEMPTS,
+    lease=timedelta(seconds=settings.PLANNING_JOB_LEASE_SECONDS),
+    progress_interval=settings.PLANNING_JOB_PROGRESS_SECONDS,
+)
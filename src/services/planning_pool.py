@@ -0,0 +1,51 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, TypeVar
+
+from src.utils.config import settings
+
+T = TypeVar("T")
+
+
+class PlanningPool:
+    """
+    Process pool for the CPU-bound stages of sprint planning (filtering, heuristic estimation, assignment),
+    so planning several teams at once is not serialized on the GIL or the event loop.
+    Created on first use; `fn` and its arguments must be picklable (module-level functions or
+    static methods, Pydantic models). With max_workers=0 work runs on the default thread pool instead.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        executor = self._get_executor()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OOM-killed); start a fresh pool on the next call instead of failing forever
+            if self._executor is executor:
+                self._executor = None
+            raise
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self.max_workers <= 0:
+            return None
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and logging threads can deadlock the child
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+planning_pool = PlanningPool(max_workers=settings.PLANNING_PROCESS_WORKERS)
@@ -0,0 +1,69 @@
+class SprintConfig:
+    """Centralized configuration for sprint planning"""
+    
+    # Status categories
+    DONE_STATUSES = {'done', 'closed', 'resolved', 'completed'}
+    IN_PROGRESS_STATUSES = {'in progress', 'inprogress', 'in-progress', 'development', 'coding'}
+    TODO_STATUSES = {'to do', 'todo', 'open', 'new', 'backlog', 'ready for development'}
+    
+    # AI estimation: bump the prompt version whenever the estimation prompts change so cached estimates are not reused
+    ESTIMATION_MODEL = 'gpt-4'
+    ESTIMATION_PROMPT_VERSION = 'v1'
+
+    # Fibonacci story points
+    FIBONACCI_POINTS = [1, 2, 3, 5, 8, 13, 21]
+    
+    # Experience thresholds (data-driven)
+    EXPERIENCE_THRESHOLDS = {
+        'senior': 40,   
+        'junior': 15,   
+        'intern': 0     
+    }
+    
+    # Story point rules by experience
+    STORY_POINT_LIMITS = {
+        'intern': {'min': 1, 'max': 3},
+        'junior': {'min': 3, 'max': 8}, 
+        'senior': {'min': 5, 'max': 21}
+    }
+    
+    # Heuristic estimate: total title + description words <= threshold maps to the bucket at the same index,
+    # anything longer to the last bucket
+    BASIC_POINT_THRESHOLDS = [5, 10, 20, 35, 50]
+    BASIC_POINT_BUCKETS = [1, 2, 3, 5, 8, 13]
+
+    # Issues sent for AI estimation: long descriptions or these words in the title.
+    # keyword_flags persisted on jira_issues are bit positions in this list, so only append to it
+    # (or clear the stored flags in a migration) when changing it.
+    AI_DESCRIPTION_LENGTH = 200
+    AI_ANALYSIS_KEYWORDS = ['integration', 'complex', 'architecture', 'migration']
+    
+    # Forecasting: a sprint's length in working days, and the lognormal spread of task durations by experience
+    SPRINT_WORKING_DAYS = 10
+    FORECAST_DURATION_SIGMA = {'senior': 0.25, 'junior': 0.35, 'intern': 0.5}
+    
+    # Story point to days mapping
+    DAYS_MAPPING = {1: 1, 2: 1, 3: 2, 5: 3, 8: 5, 13: 8, 21: 13}
+    
+    # Experience multipliers for time estimation
+    EXPERIENCE_MULTIPLIERS = {'senior': 0.8, 'junior': 1.0, 'intern': 1.3}
+    
+    # Title keywords used to infer an issue's skill category for the optimal solver
+    SKILL_KEYWORDS = {
+        'frontend': ['ui', 'frontend', 'css', 'layout', 'page', 'screen', 'button', 'form', 'dashboard', 'react'],
+        'testing': ['test', 'tests', 'qa', 'regression', 'e2e'],
+        'backend': ['api', 'backend', 'endpoint', 'database', 'migration', 'service', 'integration', 'schema'],
+    }
+    
+    # Optimal solver cost terms, in estimated days
+    SKILL_MISMATCH_PENALTY_DAYS = 2
+    INELIGIBLE_PENALTY_DAYS = 20
+
+    # Optimal solver balance term: past their capacity_score a user's work is priced in steps of
+    # 1 / BALANCE_STEPS of an even share of the backlog, each BALANCE_PENALTY_DAYS per day dearer than the last,
+    # for BALANCE_MAX_STEPS steps. Evening out the makespan afterwards tries the BALANCE_PARTNERS least busy users
+    # of each level and skill.
+    BALANCE_STEPS = 2
+    BALANCE_MAX_STEPS = 8
+    BALANCE_PENALTY_DAYS = 1
+    BALANCE_PARTNERS = 3
@@ -1,50 +1,61 @@
-from openai import OpenAI
+from openai import AsyncOpenAI
+import asyncio
 import json 
 import hashlib
-from typing import List, Tuple, Dict
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Awaitable, Callable, List, Tuple, Dict, Optional, TypeVar
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from fastapi import HTTPException
 
 from src.services.jira_service import JiraService
 from src.services.team_service import TeamService
-from src.schemas.sprint_schema import SprintAssignmentResponse, StoryPointEstimate, UserSkillAnalysis
+from src.schemas.sprint_schema import (
+    SprintAssignmentChange, SprintAssignmentResponse, SprintBatchPlanItem, SprintBatchResponse, SprintBatchTeamResult,
+    SprintPlanCommitResponse, SprintPlanPreview, SprintReplanResponse, SprintSaveSummary, SprintStreamSummary,
+    StoryPointEstimate, UserSkillAnalysis
+)
 from src.schemas.jira_schema import JiraIssueResponse
 from src.models.user import User
+from src.models.sprint import Sprint
+from src.models.jira_issue import JiraIssue
+from src.database.db import SessionLocal, engine
 from src.utils.config import settings
+from src.utils.single_flight import single_flight
+from src.services.sprint_config import SprintConfig
+from src.services.assignment_engine import AssignmentEngine
+from src.services.estimate_cache import estimate_cache
+from src.services.issue_features import IssueFeatures
+from src.services.plan_cache import plan_cache
+from src.services.planning_pool import planning_pool
+from src.services.workload_ledger import WorkloadLedger
+from src.utils.logger import get_logger
 
-openai = OpenAI(api_key=settings.OPENAI_API_KEY)
+client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+log = get_logger(__name__)
 
-class SprintConfig:
-    """Centralized configuration for sprint planning"""
-    
-    # Status categories
-    DONE_STATUSES = {'done', 'closed', 'resolved', 'completed'}
-    IN_PROGRESS_STATUSES = {'in progress', 'inprogress', 'in-progress', 'development', 'coding'}
-    TODO_STATUSES = {'to do', 'todo', 'open', 'new', 'backlog', 'ready for development'}
-    
-    # Fibonacci story points
-    FIBONACCI_POINTS = [1, 2, 3, 5, 8, 13, 21]
-    
-    # Experience thresholds (data-driven)
-    EXPERIENCE_THRESHOLDS = {
-        'senior': 40,   
-        'junior': 15,   
-        'intern': 0     
-    }
-    
-    # Story point rules by experience
-    STORY_POINT_LIMITS = {
-        'intern': {'min': 1, 'max': 3},
-        'junior': {'min': 3, 'max': 8}, 
-        'senior': {'min': 5, 'max': 21}
-    }
-    
-    # Story point to days mapping
-    DAYS_MAPPING = {1: 1, 2: 1, 3: 2, 5: 3, 8: 5, 13: 8, 21: 13}
-    
-    # Experience multipliers for time estimation
-    EXPERIENCE_MULTIPLIERS = {'senior': 0.8, 'junior': 1.0, 'intern': 1.3}
+# Called as progress(stage, count) with stage one of "estimated", "assigned", "saved"
+PlanningProgress = Callable[[str, int], None]
+# Called as emit(event, data) with the events of stream_sprint_assignments
+PlanningEmit = Callable[[str, dict], None]
+# Awaited as offload(fn, *args) to run a CPU-bound planning stage, e.g. planning_pool.run
+T = TypeVar("T")
+PlanningOffload = Callable[..., Awaitable]
+
+# Shared by every planning run in the process, so concurrent plans and batches together stay within the limit
+ai_estimation_semaphore = asyncio.Semaphore(settings.AI_ESTIMATION_CONCURRENCY)
+
+# A batch team holds a session, and on PostgreSQL a second connection for its advisory lock; running
+# no more teams than the pool keeps open leaves the overflow for requests served alongside the batch
+BATCH_CONNECTIONS_PER_TEAM = 2 if engine.dialect.name == "postgresql" else 1
+batch_team_semaphore = asyncio.Semaphore(
+    max(1, min(settings.PLANNING_BATCH_MAX_TEAMS, engine.pool.size() // BATCH_CONNECTIONS_PER_TEAM))
+)
 
 class SprintService:
     
@@ -53,85 +64,553 @@ class SprintService:
         project_key: str,
         sprint_name: str,
         team_name: str,
-        db: Session
+        db: Session,
+        strategy: str = "greedy",
+        progress: Optional[PlanningProgress] = None
     ) -> List[SprintAssignmentResponse]:
-        """Main method to create sprint assignments"""
-        try:
-            # Get data
-            jira_issues = SprintService._get_jira_issues(project_key, db)
-            team_users = TeamService.get_users_by_team(team_name, db)
-            
-            if not jira_issues:
-                raise HTTPException(status_code=404, detail="No Jira issues found")
-            if not team_users:
-                raise HTTPException(status_code=404, detail=f"No users found in team '{team_name}'")
+        """
+        Main method to create sprint assignments.
+        Identical concurrent requests share one planning run, and runs for the same project and team
+        are serialized (across workers on PostgreSQL) so their saves cannot race.
+        `progress` is called as each stage finishes; a caller that joins another's run gets no progress calls.
+        """
+        return await single_flight.do(
+            ("sprint_plan", project_key, team_name, sprint_name, strategy),
+            lambda: SprintService._create_sprint_assignments(project_key, sprint_name, team_name, db, strategy, progress),
+            lock_key=("sprint_plan", project_key, team_name)
+        )
 
-            # Process and assign
-            assignable_issues, existing_assignments = SprintService._filter_assignable_issues(jira_issues)
-            
-            # Create assignments for unassigned tickets only
-            new_assignments = []
-            if assignable_issues:
-                issues_with_points = await SprintService._assign_story_points(assignable_issues)
-                user_analyses = SprintService._analyze_team(team_users)
-                new_assignments = SprintService._create_assignments(issues_with_points, user_analyses, sprint_name)
-            
-            # Save and return ALL assignments (existing + new)
-            all_assignments = existing_assignments + new_assignments
-            await SprintService._save_to_db(all_assignments, db)
+    @staticmethod
+    async def _create_sprint_assignments(
+        project_key: str,
+        sprint_name: str,
+        team_name: str,
+        db: Session,
+        strategy: str,
+        progress: Optional[PlanningProgress] = None
+    ) -> List[SprintAssignmentResponse]:
+        try:
+            all_assignments, _, _ = await SprintService._plan_and_save(
+                project_key, sprint_name, team_name, db, strategy, progress=progress
+            )
             return all_assignments
             
         except Exception as e:
+            log.error("sprint_plan.failed", project=project_key, team=team_name, sprint=sprint_name, error=str(e))
             raise HTTPException(status_code=500, detail=f"Error creating assignments: {str(e)}")
 
     @staticmethod
-    def _get_jira_issues(project_key: str, db: Session) -> List[JiraIssueResponse]:
+    async def stream_sprint_assignments(
+        project_key: str,
+        sprint_name: str,
+        team_name: str,
+        strategy: str = "greedy"
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        create_sprint_assignments as a stream of (event, data) pairs:
+        "progress" as stages advance, "assignment" for each assignment once it is decided (preserved ones first),
+        then "summary" after the save, or "error" if planning fails.
+        The plan runs in its own task and session under the same project/team lock; it is cancelled, and
+        nothing is saved, if the consumer stops reading before the save.
+        """
+        events: asyncio.Queue = asyncio.Queue()
+
+        def emit(event: str, data: dict) -> None:
+            events.put_nowait((event, data))
+
+        async def run() -> None:
+            db = SessionLocal()
+            try:
+                # A stream is never shared with another caller, so the key is unique and only the lock applies
+                await single_flight.do(
+                    ("sprint_plan_stream", uuid.uuid4().hex),
+                    lambda: SprintService._stream_plan(project_key, sprint_name, team_name, db, strategy, emit),
+                    lock_key=("sprint_plan", project_key, team_name)
+                )
+            except Exception as e:
+                error = e.detail if isinstance(e, HTTPException) else str(e)
+                log.error("sprint_plan.failed", project=project_key, team=team_name, sprint=sprint_name, stream=True, error=error)
+                emit("error", {"detail": error})
+            finally:
+                db.close()
+                events.put_nowait(None)
+
+        task = asyncio.create_task(run())
+        try:
+            while (item := await events.get()) is not None:
+                yield item
+        finally:
+            task.cancel()
+
+    @staticmethod
+    async def _stream_plan(
+        project_key: str,
+        sprint_name: str,
+        team_name: str,
+        db: Session,
+        strategy: str,
+        emit: Callable[[str, dict], None]
+    ) -> None:
+        """_plan_and_save, emitting events between stages and a summary after the save"""
+        all_assignments, saved, duration_ms = await SprintService._plan_and_save(
+            project_key, sprint_name, team_name, db, strategy, emit=emit, stream=True
+        )
+        emit("summary", SprintStreamSummary(
+            project_key=project_key,
+            sprint_name=sprint_name,
+            team_name=team_name,
+            assignments=len(all_assignments),
+            saved=saved,
+            duration_ms=duration_ms
+        ).model_dump())
+
+    @staticmethod
+    async def preview_sprint_plan(
+        project_key: str,
+        sprint_name: str,
+        team_name: str,
+        db: Session,
+        strategy: str = "greedy"
+    ) -> SprintPlanPreview:
+        """
+        Compute a plan without writing any assignments and cache it for SPRINT_PLAN_CACHE_TTL_SECONDS.
+        Estimates still go through the estimate cache, so repeated previews of the same backlog are cheap.
+        """
+        started = time.perf_counter()
+        stats: Dict[str, int] = {}
+        assignments = await SprintService._compute_plan(project_key, sprint_name, team_name, db, strategy, stats)
+
+        plan = SprintPlanPreview(
+            plan_id=plan_cache.new_plan_id(),
+            project_key=project_key,
+            sprint_name=sprint_name,
+            team_name=team_name,
+            strategy=strategy,
+            expires_at=datetime.utcnow() + timedelta(seconds=plan_cache.ttl),
+            assignments=assignments
+        )
+        plan_cache.put(plan)
+
+        log.info(
+            "sprint_plan.previewed",
+            plan_id=plan.plan_id, project=project_key, team=team_name, sprint=sprint_name, strategy=strategy,
+            **stats, duration_ms=round((time.perf_counter() - started) * 1000)
+        )
+        return plan
+
+    @staticmethod
+    async def commit_sprint_plan(plan_id: str, db: Session) -> SprintPlanCommitResponse:
+        """Persist a previewed plan as computed, without re-estimating or re-assigning"""
+        plan = plan_cache.get(plan_id)
+        if plan is None:
+            raise HTTPException(status_code=404, detail=f"Plan '{plan_id}' not found or expired")
+
+        # Same critical section as create_sprint_assignments so a commit cannot interleave with a planning run
+        saved = await single_flight.do(
+            ("sprint_plan_commit", plan_id),
+            lambda: SprintService._save_to_db(plan.assignments, db),
+            lock_key=("sprint_plan", plan.project_key, plan.team_name)
+        )
+        plan_cache.discard(plan_id)
+
+        log.info(
+            "sprint_plan.committed",
+            plan_id=plan_id, project=plan.project_key, team=plan.team_name, sprint=plan.sprint_name,
+            assignments=len(plan.assignments),
+            inserted=saved.inserted, updated=saved.updated, reassigned=saved.reassigned, unchanged=saved.unchanged
+        )
+        return SprintPlanCommitResponse(plan_id=plan_id, assignments=len(plan.assignments), saved=saved)
+
+    @staticmethod
+    async def replan_sprint(
+        project_key: str,
+        sprint_name: str,
+        team_name: str,
+        db: Session,
+        strategy: str = "greedy"
+    ) -> SprintReplanResponse:
+        """
+        Incrementally update a saved plan: only issues created or updated in Jira since their sprint row
+        was last written are re-estimated and re-assigned, on top of the team's current sprint loads.
+        """
+        return await single_flight.do(
+            ("sprint_replan", project_key, team_name, sprint_name, strategy),
+            lambda: SprintService._replan_sprint(project_key, sprint_name, team_name, db, strategy),
+            lock_key=("sprint_plan", project_key, team_name)
+        )
+
+    @staticmethod
+    async def _replan_sprint(
+        project_key: str,
+        sprint_name: str,
+        team_name: str,
+        db: Session,
+        strategy: str
+    ) -> SprintReplanResponse:
+        started = time.perf_counter()
+        stats: Dict[str, int] = {}
+
+        # Light scan of the project against its saved rows; full issue rows are only loaded for the changes
+        planned, changed_keys, scanned = {}, [], 0
+        stmt = (
+            select(
+                JiraIssue.key, JiraIssue.updated_at.label("issue_updated_at"),
+                Sprint.sprint_name, Sprint.assignee_name, Sprint.title, Sprint.estimated_days, Sprint.story_points,
+                Sprint.created_at, Sprint.updated_at
+            )
+            .select_from(JiraIssue)
+            .outerjoin(Sprint, Sprint.issue_key == JiraIssue.key)
+            # Done issues are never saved as assignments, so unless one has a row to close out it is not a change
+            .where(JiraIssue.project_key == project_key, or_(Sprint.id.is_not(None), WorkloadLedger.open_issue()))
+        )
+        for row in db.execute(stmt):
+            scanned += 1
+            if row.sprint_name is None:
+                changed_keys.append(row.key)
+                continue
+            planned[row.key] = row
+            # Both sides in naive UTC: sprints timestamps are timezone-aware, jira_issues ones are written as UTC
+            planned_at = SprintService._naive_utc(row.updated_at or row.created_at)
+            issue_updated_at = SprintService._naive_utc(row.issue_updated_at)
+            if planned_at is None or (issue_updated_at is not None and issue_updated_at > planned_at):
+                changed_keys.append(row.key)
+
+        team_users = TeamService.get_users_by_team(team_name, db)
+        user_analyses = SprintService._analyze_team(team_users)
+        levels = {u.username: u.experience_level for u in user_analyses}
+
+        changed_issues = JiraService.get_issues_by_keys(changed_keys, db)
+        assignable_issues, existing_assignments = SprintService._filter_assignable_issues(changed_issues, sprint_name)
+        existing_assignments = SprintService._keep_stored_assignments(existing_assignments, db)
+        completed = len(changed_issues) - len(assignable_issues) - len(existing_assignments)
+
+        # Open sprint loads of the team, less whatever the changed open issues held (done ones already left the ledger)
+        open_keys = SprintService._issue_keys(assignable_issues, existing_assignments)
+        loads = WorkloadLedger.loads(sprint_name, levels, db) if open_keys else {}
+        for key in open_keys:
+            prev = planned.get(key)
+            if prev is not None and prev.sprint_name == sprint_name and prev.assignee_name in loads:
+                loads[prev.assignee_name] -= prev.story_points
+        SprintService._add_existing_loads(loads, sprint_name, existing_assignments)
+
+        kept, to_assign = [], []
+        if assignable_issues:
+            await SprintService._assign_story_points(assignable_issues, db, stats)
+            for issue in assignable_issues:
+                prev = planned.get(issue.key)
+                if (prev is not None and prev.sprint_name == sprint_name and prev.assignee_name in levels
+                        and prev.story_points == issue.story_points):
+                    # Same size, same sprint: stay with the current assignee
+                    loads[prev.assignee_name] = loads.get(prev.assignee_name, 0) + issue.story_points
+                    kept.append(SprintAssignmentResponse(
+                        sprint_name=sprint_name,
+                        issue_key=issue.key,
+                        assignee_name=prev.assignee_name,
+                        title=issue.title,
+                        estimated_days=AssignmentEngine.estimated_days(issue.story_points, levels[prev.assignee_name]),
+                        story_points=issue.story_points
+                    ))
+                else:
+                    to_assign.append(issue)
+        new_assignments = SprintService._create_assignments(to_assign, user_analyses, sprint_name, strategy, loads)
+
+        assignments = existing_assignments + kept + new_assignments
+        changes = []
+        for assignment in assignments:
+            prev = planned.get(assignment.issue_key)
+            if prev is None:
+                change = "added"
+            elif prev.assignee_name != assignment.assignee_name:
+                change = "moved"
+            elif (prev.sprint_name, prev.title, prev.estimated_days, prev.story_points) != (
+                    assignment.sprint_name, assignment.title, assignment.estimated_days, assignment.story_points):
+                change = "updated"
+            else:
+                continue
+            changes.append(SprintAssignmentChange(
+                **assignment.model_dump(),
+                change=change,
+                previous_assignee=prev.assignee_name if change == "moved" else None
+            ))
+
+        # Touch unchanged rows too so the issues count as planned after this update
+        saved = await SprintService._save_to_db(assignments, db, touch=True)
+
+        log.info(
+            "sprint_plan.replanned",
+            project=project_key, team=team_name, sprint=sprint_name, strategy=strategy,
+            issues=scanned, changed=len(changed_issues), completed=completed, assigned=len(new_assignments),
+            **stats, changes=len(changes), duration_ms=round((time.perf_counter() - started) * 1000)
+        )
+        return SprintReplanResponse(
+            project_key=project_key,
+            sprint_name=sprint_name,
+            team_name=team_name,
+            changed_issues=len(changed_issues),
+            completed_issues=completed,
+            changes=changes,
+            saved=saved
+        )
+
+    @staticmethod
+    def _issue_keys(issues: List[JiraIssueResponse], assignments: List[SprintAssignmentResponse]) -> List[str]:
+        return [issue.key for issue in issues] + [assignment.issue_key for assignment in assignments]
+
+    @staticmethod
+    def _current_loads(
+        sprint_name: str,
+        usernames: List[str],
+        assignable: List[JiraIssueResponse],
+        existing: List[SprintAssignmentResponse],
+        db: Session
+    ) -> Dict[str, float]:
+        """
+        Story points each user already holds in the sprint, read from the workload ledger, with the saved
+        rows of the issues being planned now swapped for what the new plan saves: nothing yet for the
+        assignable issues, and the existing assignments as they are re-emitted
+        """
+        loads = WorkloadLedger.loads(sprint_name, usernames, db)
+        planned_keys = SprintService._issue_keys(assignable, existing)
+        for start in range(0, len(planned_keys) if loads else 0, SprintService.SAVE_CHUNK_SIZE):
+            stmt = select(Sprint.assignee_name, Sprint.story_points).where(
+                Sprint.issue_key.in_(planned_keys[start:start + SprintService.SAVE_CHUNK_SIZE]),
+                Sprint.sprint_name == sprint_name
+            )
+            for assignee_name, points in db.execute(stmt):
+                if assignee_name in loads:
+                    loads[assignee_name] -= points
+        SprintService._add_existing_loads(loads, sprint_name, existing)
+        return loads
+
+    @staticmethod
+    def _add_existing_loads(loads: Dict[str, float], sprint_name: str, existing: List[SprintAssignmentResponse]) -> None:
+        for assignment in existing:
+            if assignment.sprint_name == sprint_name and assignment.assignee_name in loads:
+                loads[assignment.assignee_name] += assignment.story_points
+
+    @staticmethod
+    def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    @staticmethod
+    async def create_batch_assignments(plans: List[SprintBatchPlanItem]) -> SprintBatchResponse:
+        """
+        Plan several teams at once and save each plan.
+        Teams run concurrently, up to the DB pool size: the CPU-bound stages go to the planning process
+        pool and LLM calls share the event loop, so wall time tracks the slowest team rather than the sum.
+        Each team uses its own session and the same project/team lock as create_sprint_assignments; a
+        failing team does not affect the others.
+        """
+        async def plan(item: SprintBatchPlanItem) -> SprintBatchTeamResult:
+            async with batch_team_semaphore:
+                return await SprintService._plan_batch_item(item)
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(plan(item) for item in plans))
+        failed = sum(result.status == "failed" for result in results)
+        log.info(
+            "sprint_plan.batch_completed",
+            teams=len(results), failed=failed, duration_ms=round((time.perf_counter() - started) * 1000)
+        )
+        return SprintBatchResponse(succeeded=len(results) - failed, failed=failed, results=results)
+
+    @staticmethod
+    async def _plan_batch_item(item: SprintBatchPlanItem) -> SprintBatchTeamResult:
+        db = SessionLocal()
+        try:
+            assignments, saved = await single_flight.do(
+                ("sprint_plan_batch", item.project_key, item.team_name, item.sprint_name, item.strategy),
+                lambda: SprintService._plan_in_pool(item, db),
+                lock_key=("sprint_plan", item.project_key, item.team_name)
+            )
+            return SprintBatchTeamResult(
+                project_key=item.project_key, sprint_name=item.sprint_name, team_name=item.team_name,
+                status="ok", assignments=assignments, saved=saved
+            )
+        except Exception as e:
+            error = e.detail if isinstance(e, HTTPException) else str(e)
+            log.error("sprint_plan.failed", project=item.project_key, team=item.team_name, sprint=item.sprint_name, error=error)
+            return SprintBatchTeamResult(
+                project_key=item.project_key, sprint_name=item.sprint_name, team_name=item.team_name,
+                status="failed", error=error
+            )
+        finally:
+            db.close()
+
+    @staticmethod
+    async def _plan_in_pool(
+        item: SprintBatchPlanItem,
+        db: Session
+    ) -> Tuple[List[SprintAssignmentResponse], SprintSaveSummary]:
+        """_plan_and_save with filtering, basic estimation and assignment run in the process pool"""
+        all_assignments, saved, _ = await SprintService._plan_and_save(
+            item.project_key, item.sprint_name, item.team_name, db, item.strategy, offload=planning_pool.run, batch=True
+        )
+        return all_assignments, saved
+
+    @staticmethod
+    async def _load_plan_inputs(project_key: str, team_name: str, db: Session) -> Tuple[List[JiraIssueResponse], List[User]]:
+        """The project's issues and the team's users, or 404 when either is empty"""
+        jira_issues = await SprintService._get_jira_issues(project_key, db)
+        team_users = TeamService.get_users_by_team(team_name, db)
+        if not jira_issues:
+            raise HTTPException(status_code=404, detail="No Jira issues found")
+        if not team_users:
+            raise HTTPException(status_code=404, detail=f"No users found in team '{team_name}'")
+        return jira_issues, team_users
+
+    @staticmethod
+    def _prepare_issues(
+        issues: List[JiraIssueResponse],
+        sprint_name: str
+    ) -> Tuple[List[JiraIssueResponse], List[SprintAssignmentResponse], List[Tuple[JiraIssueResponse, int]]]:
+        """Filter and basic-estimate in one picklable call; the AI candidates reference the returned assignable issues"""
+        assignable, existing = SprintService._filter_assignable_issues(issues, sprint_name)
+        return assignable, existing, SprintService._basic_story_points(assignable)
+
+    @staticmethod
+    async def _plan_and_save(
+        project_key: str,
+        sprint_name: str,
+        team_name: str,
+        db: Session,
+        strategy: str,
+        progress: Optional[PlanningProgress] = None,
+        emit: Optional[PlanningEmit] = None,
+        offload: Optional[PlanningOffload] = None,
+        **log_fields
+    ) -> Tuple[List[SprintAssignmentResponse], SprintSaveSummary, int]:
+        """_compute_plan, then save the plan; returns the assignments, the save summary and the duration in ms"""
+        started = time.perf_counter()
+        stats: Dict[str, int] = {}
+        all_assignments = await SprintService._compute_plan(
+            project_key, sprint_name, team_name, db, strategy, stats, progress, emit, offload
+        )
+        saved = await SprintService._save_to_db(all_assignments, db)
+        if progress:
+            progress("saved", saved.inserted + saved.updated + saved.unchanged)
+
+        duration_ms = round((time.perf_counter() - started) * 1000)
+        log.info(
+            "sprint_plan.completed",
+            project=project_key, team=team_name, sprint=sprint_name, strategy=strategy, **log_fields,
+            **stats,
+            inserted=saved.inserted, updated=saved.updated, reassigned=saved.reassigned, unchanged=saved.unchanged,
+            duration_ms=duration_ms
+        )
+        return all_assignments, saved, duration_ms
+
+    @staticmethod
+    async def _compute_plan(
+        project_key: str,
+        sprint_name: str,
+        team_name: str,
+        db: Session,
+        strategy: str,
+        stats: Dict[str, int],
+        progress: Optional[PlanningProgress] = None,
+        emit: Optional[PlanningEmit] = None,
+        offload: Optional[PlanningOffload] = None
+    ) -> List[SprintAssignmentResponse]:
+        """
+        Estimate and assign in memory; returns existing + new assignments and fills `stats`.
+        `progress` hears each stage's running count; `emit` also gets a "loaded" summary and every assignment once
+        it is decided (existing ones first); `offload` runs the CPU-bound stages, inline by default.
+        """
+        offload = offload or SprintService._run_inline
+        # Get data
+        jira_issues, team_users = await SprintService._load_plan_inputs(project_key, team_name, db)
+
+        # Process: filter, and basic estimates for every assignable issue
+        assignable_issues, existing_assignments, ai_issues = await offload(SprintService._prepare_issues, jira_issues, sprint_name)
+        existing_assignments = SprintService._keep_stored_assignments(existing_assignments, db)
+
+        def report(stage: str, count: int) -> None:
+            if progress:
+                progress(stage, count)
+            if emit:
+                emit("progress", {"stage": stage, "count": count, "total": len(assignable_issues)})
+
+        if emit:
+            emit("progress", {
+                "stage": "loaded", "issues": len(jira_issues), "team_size": len(team_users),
+                "existing": len(existing_assignments), "assignable": len(assignable_issues)
+            })
+            for assignment in existing_assignments:
+                emit("assignment", dict(assignment.model_dump(), existing=True))
+
+        # Create assignments for unassigned tickets only
+        new_assignments = []
+        if assignable_issues:
+            basic_only = len(assignable_issues) - len(ai_issues)
+            report("estimated", basic_only)
+            await SprintService._refine_story_points(
+                ai_issues, db, stats, lambda stage, count: report(stage, basic_only + count)
+            )
+            user_analyses = SprintService._analyze_team(team_users)
+            loads = SprintService._current_loads(
+                sprint_name, [u.username for u in user_analyses], assignable_issues, existing_assignments, db
+            )
+            new_assignments = await offload(
+                SprintService._create_assignments, assignable_issues, user_analyses, sprint_name, strategy, loads
+            )
+            if emit:
+                for assignment in new_assignments:
+                    emit("assignment", dict(assignment.model_dump(), existing=False))
+        report("assigned", len(new_assignments))
+
+        stats.update(
+            issues=len(jira_issues), team_size=len(team_users),
+            existing=len(existing_assignments), assignable=len(assignable_issues), assigned=len(new_assignments)
+        )
+        return existing_assignments + new_assignments
+
+    @staticmethod
+    async def _run_inline(fn: Callable[..., T], *args) -> T:
+        return fn(*args)
+
+    @staticmethod
+    async def _get_jira_issues(project_key: str, db: Session) -> List[JiraIssueResponse]:
         """Get Jira issues from DB or API"""
         issues = JiraService.get_issues_from_db(project_key, db)
         if not issues:
-            issues = JiraService.fetch_all_issues(project_key)
-            if issues:
-                JiraService.sync_issues_to_db(project_key, db)
+            issues = await JiraService.fetch_and_sync_issues(project_key, db)
         return issues or []
 
     @staticmethod
-    def _filter_assignable_issues(issues: List[JiraIssueResponse]) -> Tuple[List[JiraIssueResponse], List[SprintAssignmentResponse]]:
+    def _filter_assignable_issues(
+        issues: List[JiraIssueResponse],
+        sprint_name: str
+    ) -> Tuple[List[JiraIssueResponse], List[SprintAssignmentResponse]]:
         """
         FIXED LOGIC: Filter issues into assignable and existing assignments
-        - Preserve ALL tickets that have assignees (regardless of status)
+        - Preserve ALL tickets that have assignees (regardless of status), as assignments in `sprint_name`
+          until _keep_stored_assignments puts saved ones back in their own sprint
         - Only assign tickets that have NO assignee
         """
         assignable = []
         existing = []
         
-        print(f"\n Filtering {len(issues)} issues...")
-        
         for issue in issues:
             status = issue.status.lower().strip() if issue.status else 'unknown'
             has_assignee = SprintService._has_assignee(issue)
-            assignee_name = getattr(issue, 'assignee', 'None')
-            
-            # Debug logging
-            print(f"   {issue.key}: status='{status}', assignee='{assignee_name}', has_assignee={has_assignee}")
             
             # Skip completed work
             if status in SprintConfig.DONE_STATUSES:
-                print(f"   → SKIPPED (Done status)")
+                log.debug_sampled("sprint_plan.issue_filtered", issue=issue.key, status=status, outcome="skipped_done")
                 continue
             
             # FIXED: Preserve ANY ticket that has an assignee (regardless of status)
             if has_assignee:
-                existing_assignment = SprintService._create_existing_assignment(issue)
+                existing_assignment = SprintService._create_existing_assignment(issue, sprint_name)
                 existing.append(existing_assignment)
-                print(f"   → EXISTING assignment preserved (assigned to {assignee_name})")
+                log.debug_sampled("sprint_plan.issue_filtered", issue=issue.key, status=status, outcome="existing", assignee=issue.assignee)
             else:
                 # Only assign tickets that have NO assignee
                 assignable.append(issue)
-                print(f"   → ASSIGNABLE (no current assignee)")
-        
-        print(f"\n Filtering Results:")
-        print(f"   Existing assignments (preserved): {len(existing)}")
-        print(f"   Assignable issues (unassigned): {len(assignable)}")
+                log.debug_sampled("sprint_plan.issue_filtered", issue=issue.key, status=status, outcome="assignable")
         
         return assignable, existing
 
@@ -162,7 +641,7 @@ class SprintService:
         return False
 
     @staticmethod
-    def _create_existing_assignment(issue: JiraIssueResponse) -> SprintAssignmentResponse:
+    def _create_existing_assignment(issue: JiraIssueResponse, sprint_name: str) -> SprintAssignmentResponse:
         """Create assignment for existing assigned issue"""
         # Use existing story points or calculate basic ones
         if hasattr(issue, 'story_points') and issue.story_points:
@@ -180,7 +659,7 @@ class SprintService:
             assignee_name = str(assignee) if assignee else 'Unknown'
         
         return SprintAssignmentResponse(
-            sprint_name="Current Sprint",  # You might want to make this dynamic
+            sprint_name=sprint_name,
             issue_key=issue.key,
             assignee_name=assignee_name,
             title=issue.title,
@@ -189,49 +668,186 @@ class SprintService:
         )
 
     @staticmethod
-    async def _assign_story_points(issues: List[JiraIssueResponse]) -> List[JiraIssueResponse]:
-        """Assign story points using data-driven approach with AI enhancement"""
-        print(f"\n Assigning story points to {len(issues)} issues...")
-        
-        for issue in issues:
-            # Data-driven basic assignment
-            basic_points = SprintService._calculate_basic_story_points(issue)
+    def _keep_stored_assignments(existing: List[SprintAssignmentResponse], db: Session) -> List[SprintAssignmentResponse]:
+        """
+        Re-emit already saved existing assignments in the sprint they were saved in, with their saved estimate while
+        Jira still has the same assignee, so planning another sprint never moves their load out of their own
+        """
+        keys = [assignment.issue_key for assignment in existing]
+        stored = {}
+        for start in range(0, len(keys), SprintService.SAVE_CHUNK_SIZE):
+            stmt = select(
+                Sprint.issue_key, Sprint.sprint_name, Sprint.assignee_name, Sprint.estimated_days, Sprint.story_points
+            ).where(Sprint.issue_key.in_(keys[start:start + SprintService.SAVE_CHUNK_SIZE]))
+            stored.update((row.issue_key, row) for row in db.execute(stmt))
+
+        kept = []
+        for assignment in existing:
+            row = stored.get(assignment.issue_key)
+            if row is None:
+                kept.append(assignment)
+            elif row.assignee_name == assignment.assignee_name:
+                kept.append(assignment.model_copy(update={
+                    "sprint_name": row.sprint_name, "estimated_days": row.estimated_days, "story_points": row.story_points
+                }))
+            else:
+                kept.append(assignment.model_copy(update={"sprint_name": row.sprint_name}))
+        return kept
+
+    @staticmethod
+    async def _assign_story_points(
+        issues: List[JiraIssueResponse],
+        db: Session,
+        stats: Optional[Dict[str, int]] = None,
+        progress: Optional[PlanningProgress] = None
+    ) -> List[JiraIssueResponse]:
+        """
+        Assign story points using data-driven approach with AI enhancement.
+        Counts of each outcome are added to `stats` when given; `progress` receives the running count of
+        issues whose estimate is final.
+        """
+        ai_issues = SprintService._basic_story_points(issues)
+        basic_only = len(issues) - len(ai_issues)
+        if progress:
+            progress("estimated", basic_only)
+        await SprintService._refine_story_points(
+            ai_issues, db, stats,
+            (lambda stage, count: progress(stage, basic_only + count)) if progress else None
+        )
+        return issues
+
+    @staticmethod
+    def _basic_story_points(issues: List[JiraIssueResponse]) -> List[Tuple[JiraIssueResponse, int]]:
+        """
+        Set the data-driven estimate on every issue and return the (issue, basic points) pairs that need AI.
+        Bucketing runs over the whole batch at once on the issues' stored text features.
+        """
+        if not issues:
+            return []
+        features = IssueFeatures.from_issues(issues)
+        ai_issues = []
+        for issue, basic_points, needs_ai in zip(issues, features.basic_story_points().tolist(), features.needs_ai().tolist()):
+            issue.story_points = basic_points
             
             # AI enhancement for complex cases only
-            if SprintService._needs_ai_analysis(issue):
-                try:
-                    estimate = await SprintService._ai_estimate_story_points(issue, basic_points)
-                    issue.story_points = estimate.estimated_story_points
-                    print(f"   {issue.key}: AI estimated {issue.story_points} points")
-                except Exception as e:
-                    issue.story_points = basic_points  # Fallback to basic
-                    print(f"   {issue.key}: AI failed, using basic {basic_points} points")
+            if needs_ai:
+                ai_issues.append((issue, basic_points))
             else:
-                issue.story_points = basic_points
-                print(f"   {issue.key}: Basic estimation {basic_points} points")
-                
-        return issues
+                log.debug_sampled("story_points.estimated", issue=issue.key, points=basic_points, source="basic")
+        return ai_issues
+
+    @staticmethod
+    async def _refine_story_points(
+        ai_issues: List[Tuple[JiraIssueResponse, int]],
+        db: Session,
+        stats: Optional[Dict[str, int]] = None,
+        progress: Optional[PlanningProgress] = None
+    ) -> None:
+        """
+        Replace basic estimates with AI estimates.
+        AI estimates run concurrently (at most AI_ESTIMATION_CONCURRENCY in flight across the process, each
+        bounded by AI_ESTIMATION_TIMEOUT_SECONDS); any that fail or time out keep the basic estimate.
+        In batch mode issues are packed into multi-issue requests first and only the ones a batch
+        did not return a valid estimate for are re-queued as single-issue requests.
+        AI estimates are cached by content (see EstimateCache), so an unchanged issue is only sent once.
+        `progress` is called with the running count of issues settled (from cache, AI, or basic fallback),
+        each time another percent of them has settled and once all have.
+        """
+        stats = stats if stats is not None else {}
+        settled = reported = 0
+        step = max(1, len(ai_issues) // 100)
+
+        def advance(count: int) -> None:
+            nonlocal settled, reported
+            settled += count
+            if progress and count and (settled - reported >= step or settled == len(ai_issues)):
+                reported = settled
+                progress("estimated", settled)
+
+        async def estimate(issue: JiraIssueResponse, basic_points: int) -> StoryPointEstimate:
+            try:
+                async with ai_estimation_semaphore:
+                    return await asyncio.wait_for(
+                        SprintService._ai_estimate_story_points(issue, basic_points),
+                        timeout=settings.AI_ESTIMATION_TIMEOUT_SECONDS
+                    )
+            finally:
+                advance(1)
+
+        async def estimate_batch(batch: List[Tuple[JiraIssueResponse, int]]) -> Dict[str, StoryPointEstimate]:
+            async with ai_estimation_semaphore:
+                estimates = await asyncio.wait_for(
+                    SprintService._ai_estimate_story_points_batch(batch),
+                    timeout=settings.AI_ESTIMATION_TIMEOUT_SECONDS
+                )
+            # Issues the batch left out are counted when their single-issue retry finishes
+            advance(sum(issue.key in estimates for issue, _ in batch))
+            return estimates
+
+        cache_keys = {issue.key: SprintService._estimate_cache_key(issue, basic_points) for issue, basic_points in ai_issues}
+        cached = estimate_cache.get_many(cache_keys.values(), db) if ai_issues else {}
+        fresh: Dict[str, Tuple[int, str]] = {}
+        uncached = []
+        for issue, basic_points in ai_issues:
+            hit = cached.get(cache_keys[issue.key])
+            if hit:
+                issue.story_points = hit[0]
+                log.debug_sampled("story_points.estimated", issue=issue.key, points=issue.story_points, source="cache")
+            else:
+                uncached.append((issue, basic_points))
+        ai_issues = uncached
+        advance(len(cache_keys) - len(ai_issues))
+        stats["ai_candidates"] = len(cache_keys)
+        stats["estimate_cache_hits"] = len(cache_keys) - len(ai_issues)
+        stats["ai_requests"] = 0
+
+        if settings.AI_ESTIMATION_MODE == "batch" and len(ai_issues) > 1:
+            batches = SprintService._pack_estimation_batches(ai_issues)
+            batch_results = await asyncio.gather(*(estimate_batch(batch) for batch in batches), return_exceptions=True)
+            stats["ai_requests"] += len(batches)
+
+            requeued = []
+            for batch, result in zip(batches, batch_results):
+                estimates = {} if isinstance(result, BaseException) else result
+                for issue, basic_points in batch:
+                    if issue.key in estimates:
+                        issue.story_points = estimates[issue.key].estimated_story_points
+                        fresh[cache_keys[issue.key]] = (issue.story_points, estimates[issue.key].complexity_reasoning)
+                        log.debug_sampled("story_points.estimated", issue=issue.key, points=issue.story_points, source="ai_batch")
+                    else:
+                        requeued.append((issue, basic_points))
+            stats["ai_batch_requeued"] = len(requeued)
+            ai_issues = requeued
+
+        results = await asyncio.gather(
+            *(estimate(issue, basic_points) for issue, basic_points in ai_issues),
+            return_exceptions=True
+        )
+        stats["ai_requests"] += len(ai_issues)
+        stats["ai_failed"] = 0
+        for (issue, basic_points), result in zip(ai_issues, results):
+            if isinstance(result, BaseException):
+                stats["ai_failed"] += 1
+                log.debug_sampled("story_points.estimated", issue=issue.key, points=basic_points, source="basic_fallback",
+                                  error=type(result).__name__)
+            else:
+                issue.story_points = result.estimated_story_points
+                fresh[cache_keys[issue.key]] = (issue.story_points, result.complexity_reasoning)
+                log.debug_sampled("story_points.estimated", issue=issue.key, points=issue.story_points, source="ai")
+
+        estimate_cache.put_many(fresh, SprintConfig.ESTIMATION_MODEL, SprintConfig.ESTIMATION_PROMPT_VERSION, db)
 
     @staticmethod
     def _calculate_basic_story_points(issue: JiraIssueResponse) -> int:
-        """Data-driven story point calculation"""
-        title_length = len(issue.title.split())
-        desc_length = len((issue.description or "").split())
-        total_length = title_length + desc_length
+        """Data-driven story point calculation for a single issue; batches go through IssueFeatures"""
+        total_length = len(issue.title.split()) + len((issue.description or "").split())
         
         # Simple length-based rules
-        if total_length <= 5:
-            points = 1
-        elif total_length <= 10:
-            points = 2
-        elif total_length <= 20:
-            points = 3
-        elif total_length <= 35:
-            points = 5
-        elif total_length <= 50:
-            points = 8
-        else:
-            points = 13
+        points = SprintConfig.BASIC_POINT_BUCKETS[-1]
+        for threshold, bucket in zip(SprintConfig.BASIC_POINT_THRESHOLDS, SprintConfig.BASIC_POINT_BUCKETS):
+            if total_length <= threshold:
+                points = bucket
+                break
             
         return SprintService._get_closest_fibonacci(points)
 
@@ -242,13 +858,13 @@ class SprintService:
         desc_length = len(issue.description or "")
         title_lower = issue.title.lower()
         
-        return (desc_length > 200 or 
-                any(word in title_lower for word in ["integration", "complex", "architecture", "migration"]))
+        return (desc_length > SprintConfig.AI_DESCRIPTION_LENGTH or 
+                any(word in title_lower for word in SprintConfig.AI_ANALYSIS_KEYWORDS))
 
     @staticmethod
     async def _ai_estimate_story_points(issue: JiraIssueResponse, basic_points: int) -> StoryPointEstimate:
         """AI-enhanced story point estimation"""
-        seed = abs(hash(f"{issue.title}{issue.description or ''}")) % 10000
+        seed = SprintService._estimate_seed(SprintService._estimate_cache_key(issue, basic_points))
         
         prompt = f"""
 Analyze this task and refine the story point estimate.
@@ -263,8 +879,8 @@ Consider: complexity, unknowns, integration points.
 Return JSON: {{"estimated_story_points": <number>, "complexity_reasoning": "<brief reason>"}}
 """
 
-        response = openai.chat.completions.create(
-            model="gpt-4",
+        response = await client.chat.completions.create(
+            model=SprintConfig.ESTIMATION_MODEL,
             messages=[
                 {"role": "system", "content": "You are a software estimation expert. Use only Fibonacci numbers for story points."},
                 {"role": "user", "content": prompt}
@@ -273,7 +889,7 @@ Return JSON: {{"estimated_story_points": <number>, "complexity_reasoning": "<bri
             seed=seed
         )
         
-        result = json.loads(response.choices[0].message.content)
+        result = SprintService._parse_json_content(response.choices[0].message.content)
         points = SprintService._get_closest_fibonacci(int(result["estimated_story_points"]))
         
         return StoryPointEstimate(
@@ -283,6 +899,110 @@ Return JSON: {{"estimated_story_points": <number>, "complexity_reasoning": "<bri
             complexity_reasoning=result["complexity_reasoning"]
         )
 
+    @staticmethod
+    def _estimate_cache_key(issue: JiraIssueResponse, basic_points: int) -> str:
+        return estimate_cache.make_key(
+            SprintConfig.ESTIMATION_MODEL, SprintConfig.ESTIMATION_PROMPT_VERSION,
+            issue.title, issue.description, basic_points
+        )
+
+    @staticmethod
+    def _estimate_seed(digest: str) -> int:
+        """Stable across processes, unlike hash(), which is salted per interpreter"""
+        return int(digest[:8], 16) % 10000
+
+    @staticmethod
+    def _pack_estimation_batches(
+        ai_issues: List[Tuple[JiraIssueResponse, int]]
+    ) -> List[List[Tuple[JiraIssueResponse, int]]]:
+        """
+        Pack issues in order into batches of at most AI_BATCH_MAX_ISSUES whose prompt text stays within
+        AI_BATCH_TOKEN_BUDGET (estimated at ~4 characters per token). An issue larger than the budget
+        gets a batch of its own.
+        """
+        batches, current, current_tokens = [], [], 0
+        for issue, basic_points in ai_issues:
+            tokens = len(SprintService._batch_item_text(issue, basic_points)) // 4 + 1
+            if current and (len(current) >= settings.AI_BATCH_MAX_ISSUES
+                            or current_tokens + tokens > settings.AI_BATCH_TOKEN_BUDGET):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append((issue, basic_points))
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
+
+    @staticmethod
+    def _batch_item_text(issue: JiraIssueResponse, basic_points: int) -> str:
+        return f"""
+Issue Key: {issue.key}
+Task: {issue.title}
+Description: {issue.description or "No description"}
+Basic Estimate: {basic_points}
+"""
+
+    @staticmethod
+    async def _ai_estimate_story_points_batch(
+        batch: List[Tuple[JiraIssueResponse, int]]
+    ) -> Dict[str, StoryPointEstimate]:
+        """
+        Estimate several issues in one request. Returns estimates keyed by issue key for the items that
+        came back valid; keys missing from the result are left for the caller to retry individually.
+        """
+        issues_by_key = {issue.key: issue for issue, _ in batch}
+        seed = SprintService._estimate_seed(hashlib.sha256("".join(
+            SprintService._estimate_cache_key(issue, basic_points) for issue, basic_points in batch
+        ).encode()).hexdigest())
+
+        prompt = f"""
+Analyze each task below and refine its story point estimate.
+{"".join(SprintService._batch_item_text(issue, basic_points) for issue, basic_points in batch)}
+Use only Fibonacci numbers: {SprintConfig.FIBONACCI_POINTS}
+Consider: complexity, unknowns, integration points.
+
+Return a JSON array with one object per task, in any order:
+[{{"issue_key": "<key>", "estimated_story_points": <number>, "complexity_reasoning": "<brief reason>"}}]
+"""
+
+        response = await client.chat.completions.create(
+            model=SprintConfig.ESTIMATION_MODEL,
+            messages=[
+                {"role": "system", "content": "You are a software estimation expert. Use only Fibonacci numbers for story points."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.0,
+            seed=seed
+        )
+
+        result = SprintService._parse_json_content(response.choices[0].message.content)
+        if not isinstance(result, list):
+            raise ValueError("Batch estimate response is not a JSON array")
+
+        estimates = {}
+        for item in result:
+            # Validate per item so one malformed entry does not discard the rest of the batch
+            try:
+                issue = issues_by_key[item["issue_key"]]
+                points = SprintService._get_closest_fibonacci(int(item["estimated_story_points"]))
+                estimates[issue.key] = StoryPointEstimate(
+                    issue_key=issue.key,
+                    title=issue.title,
+                    estimated_story_points=points,
+                    complexity_reasoning=str(item["complexity_reasoning"])
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return estimates
+
+    @staticmethod
+    def _parse_json_content(content: str):
+        """Parse a model reply as JSON, tolerating a surrounding ```json fence"""
+        content = (content or "").strip()
+        if content.startswith("```"):
+            content = content.split("\n", 1)[-1].rsplit("```", 1)[0]
+        return json.loads(content)
+
     @staticmethod
     def _analyze_team(users: List[User]) -> List[UserSkillAnalysis]:
         """Analyze team using data-driven approach"""
@@ -333,106 +1053,35 @@ Return JSON: {{"estimated_story_points": <number>, "complexity_reasoning": "<bri
     def _create_assignments(
         issues: List[JiraIssueResponse],
         users: List[UserSkillAnalysis],
-        sprint_name: str
+        sprint_name: str,
+        strategy: str = "greedy",
+        initial_loads: Optional[Dict[str, float]] = None
     ) -> List[SprintAssignmentResponse]:
-        """Create assignments ensuring STRICT round-robin distribution - no user gets 2 tickets until all have 1"""
+        """
+        Create load-balanced assignments on top of `initial_loads` (username -> story points already held).
+        greedy: each issue goes to the eligible user with the most remaining capacity
+        optimal: min-cost flow over issues x users, falling back to greedy past ASSIGNMENT_TIME_BUDGET_SECONDS
+        """
         
         if not users or not issues:
-            print("  No users or issues to assign")
             return []
         
-        print(f"\n Creating assignments for {len(issues)} unassigned issues among {len(users)} users...")
-        
-        # Sort users by experience level and capacity for consistent ordering
-        sorted_users = sorted(users, key=lambda u: (
-            {'senior': 3, 'junior': 2, 'intern': 1}[u.experience_level],
-            u.capacity_score
-        ), reverse=True)
-        
-        # Sort issues by story points (complex first)
-        sorted_issues = sorted(issues, key=lambda i: int(i.story_points or 3), reverse=True)
-        
-        assignments = []
-        user_index = 0  # Simple round-robin index
-        
-        def can_user_handle_points(user, story_points):
-            """Check if user can handle the story points"""
-            limits = SprintConfig.STORY_POINT_LIMITS[user.experience_level]
-            return limits['min'] <= story_points <= limits['max']
-        
-        def adjust_story_points_for_user(user, original_points):
-            """Adjust story points to fit user's capability"""
-            limits = SprintConfig.STORY_POINT_LIMITS[user.experience_level]
-            return max(limits['min'], min(limits['max'], original_points))
-        
-        def assign_issue_to_user(issue, user, adjusted_points=None):
-            """Create assignment with proper point adjustment"""
-            story_points = adjusted_points if adjusted_points else int(issue.story_points or 3)
-            
-            base_days = SprintConfig.DAYS_MAPPING.get(story_points, 3)
-            multiplier = SprintConfig.EXPERIENCE_MULTIPLIERS.get(user.experience_level, 1.0)
-            estimated_days = max(1, min(int(base_days * multiplier), 15))
-            
-            assignments.append(SprintAssignmentResponse(
-                sprint_name=sprint_name,
-                issue_key=issue.key,
-                assignee_name=user.username,
-                title=issue.title,
-                estimated_days=estimated_days,
-                story_points=story_points
-            ))
-            
-            print(f" Assigned {issue.key} ({story_points} pts) to {user.username}")
-        
-        # STRICT Round-Robin Assignment
-        for issue in sorted_issues:
-            original_points = int(issue.story_points or 3)
-            assigned = False
-            attempts = 0
-            
-            # Try to find a user who can handle this issue, starting from current index
-            while attempts < len(sorted_users) and not assigned:
-                current_user = sorted_users[user_index]
-                
-                if can_user_handle_points(current_user, original_points):
-                    # User can handle original points
-                    assign_issue_to_user(issue, current_user, original_points)
-                    assigned = True
-                else:
-                    # Adjust points to fit user's capability
-                    adjusted_points = adjust_story_points_for_user(current_user, original_points)
-                    assign_issue_to_user(issue, current_user, adjusted_points)
-                    print(f"  Adjusted {issue.key} from {original_points} to {adjusted_points} points for {current_user.username}")
-                    assigned = True
-                
-                # Move to next user for next issue (round-robin)
-                user_index = (user_index + 1) % len(sorted_users)
-                attempts += 1
-            
-            if not assigned:
-                # This should never happen, but safety fallback
-                fallback_user = sorted_users[user_index]
-                adjusted_points = adjust_story_points_for_user(fallback_user, original_points)
-                assign_issue_to_user(issue, fallback_user, adjusted_points)
-                user_index = (user_index + 1) % len(sorted_users)
-                print(f" Fallback assignment: {issue.key} to {fallback_user.username}")
-        
-        # Calculate final distribution
-        user_assignment_count = {}
-        for assignment in assignments:
-            user_assignment_count[assignment.assignee_name] = user_assignment_count.get(assignment.assignee_name, 0) + 1
-        
-        print(f"\n Final NEW Assignment Distribution:")
-        for user in sorted_users:
-            count = user_assignment_count.get(user.username, 0)
-            print(f"   {user.username} ({user.experience_level}): {count} new tickets")
+        if strategy == "optimal":
+            assignments = AssignmentEngine.assign_optimal(
+                issues, users, sprint_name, settings.ASSIGNMENT_TIME_BUDGET_SECONDS, initial_loads
+            )
+        else:
+            assignments = AssignmentEngine.assign(issues, users, sprint_name, initial_loads)
         
-        print(f"\nSummary:")
-        print(f"   New assignments: {len(assignments)}")
-        print(f"   Team size: {len(sorted_users)}")
-        if user_assignment_count:
-            print(f"   Min assignments per user: {min(user_assignment_count.values())}")
-            print(f"   Max assignments per user: {max(user_assignment_count.values())}")
+        # Final distribution, only worth computing when someone reads it
+        if assignments and log.isEnabledFor(logging.DEBUG):
+            user_points = {}
+            for assignment in assignments:
+                user_points[assignment.assignee_name] = user_points.get(assignment.assignee_name, 0) + assignment.story_points
+            log.debug(
+                "sprint_plan.assigned", strategy=strategy, assignments=len(assignments), team_size=len(users),
+                min_user_points=min(user_points.get(u.username, 0) for u in users), max_user_points=max(user_points.values())
+            )
         
         return assignments
 
@@ -466,95 +1115,88 @@ Return JSON: {{"estimated_story_points": <number>, "complexity_reasoning": "<bri
         
         return groups
 
+    SAVE_COLUMNS = ("sprint_name", "assignee_name", "title", "estimated_days", "story_points")
+    SAVE_CHUNK_SIZE = 1000
+
     @staticmethod
-    async def _save_to_db(assignments: List[SprintAssignmentResponse], db: Session):
-        """Save assignments to database with overwrite logic - UPDATE by issue_key only"""
+    async def _save_to_db(
+        assignments: List[SprintAssignmentResponse],
+        db: Session,
+        touch: bool = False
+    ) -> SprintSaveSummary:
+        """
+        Save assignments keyed on the unique sprints.issue_key, in one transaction.
+        One SELECT per chunk reads the current rows; only new or changed assignments are written,
+        as a single INSERT ... ON CONFLICT (issue_key) DO UPDATE on PostgreSQL and SQLite.
+        With touch=True unchanged rows are rewritten as well so their updated_at advances.
+        The workload ledger is updated in the same transaction.
+        """
+        summary = SprintSaveSummary()
         if not assignments:
-            print(" No assignments to save")
-            return
+            return summary
             
         try:
-            saved_count = 0
-            updated_count = 0
-            
-            for assignment in assignments:
-                # Check if assignment exists for this issue_key (regardless of sprint_name)
-                existing = db.execute(text("""
-                    SELECT id, assignee_name, sprint_name FROM sprints 
-                    WHERE issue_key = :issue_key
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                """), {
-                    "issue_key": assignment.issue_key
-                }).fetchone()
-                
-                if existing:
-                    existing_id, existing_assignee, existing_sprint = existing
-                    
-                    # Always UPDATE the existing record with new assignment details
-                    db.execute(text("""
-                        UPDATE sprints SET
-                            sprint_name = :sprint_name,
-                            assignee_name = :assignee_name,
-                            title = :title,
-                            estimated_days = :estimated_days,
-                            story_points = :story_points,
-                            updated_at = NOW()
-                        WHERE id = :id
-                    """), {
-                        "sprint_name": assignment.sprint_name,
-                        "assignee_name": assignment.assignee_name,
-                        "title": assignment.title,
-                        "estimated_days": assignment.estimated_days,
-                        "story_points": assignment.story_points,
-                        "id": existing_id
-                    })
-                    updated_count += 1
-                    
-                    if existing_assignee != assignment.assignee_name:
-                        print(f"    {assignment.issue_key}: REASSIGNED from {existing_assignee} → {assignment.assignee_name}")
-                    else:
-                        print(f"    {assignment.issue_key}: Updated details (same assignee: {assignment.assignee_name})")
-                    
-                    # Optional: Delete any other duplicate entries for this issue_key
-                    db.execute(text("""
-                        DELETE FROM sprints 
-                        WHERE issue_key = :issue_key AND id != :keep_id
-                    """), {
-                        "issue_key": assignment.issue_key,
-                        "keep_id": existing_id
-                    })
-                    
+            # Last assignment for an issue wins, as with the old per-row overwrite
+            rows = list({a.issue_key: a.model_dump(include={"issue_key", *SprintService.SAVE_COLUMNS}) for a in assignments}.values())
+            keys = [row["issue_key"] for row in rows]
+
+            existing = {}
+            for chunk_start in range(0, len(keys), SprintService.SAVE_CHUNK_SIZE):
+                stmt = select(Sprint.issue_key, *(getattr(Sprint, c) for c in SprintService.SAVE_COLUMNS)).where(
+                    Sprint.issue_key.in_(keys[chunk_start:chunk_start + SprintService.SAVE_CHUNK_SIZE])
+                )
+                for current in db.execute(stmt):
+                    existing[current.issue_key] = dict(current._mapping)
+
+            changed = []
+            for row in rows:
+                current = existing.get(row["issue_key"])
+                if current is None:
+                    summary.inserted += 1
+                elif current != row:
+                    summary.updated += 1
+                    summary.reassigned += current["assignee_name"] != row["assignee_name"]
                 else:
-                    # INSERT new assignment only if no existing record found
-                    db.execute(text("""
-                        INSERT INTO sprints (
-                            sprint_name, issue_key, assignee_name, title, 
-                            estimated_days, story_points, created_at
-                        ) VALUES (
-                            :sprint_name, :issue_key, :assignee_name, :title,
-                            :estimated_days, :story_points, NOW()
-                        )
-                    """), {
-                        "sprint_name": assignment.sprint_name,
-                        "issue_key": assignment.issue_key,
-                        "assignee_name": assignment.assignee_name,
-                        "title": assignment.title,
-                        "estimated_days": assignment.estimated_days,
-                        "story_points": assignment.story_points
-                    })
-                    saved_count += 1
-                    print(f"   ➕ {assignment.issue_key}: NEW assignment to {assignment.assignee_name}")
-            
+                    summary.unchanged += 1
+                    if not touch:
+                        continue
+                changed.append(row)
+
+            if changed:
+                # Stamped from Python in UTC, like jira_issues, so replan compares both at the same precision
+                now = datetime.now(timezone.utc)
+                written = [dict(row, updated_at=now) for row in changed]
+                dialect = db.get_bind().dialect.name
+                if dialect in ("postgresql", "sqlite"):
+                    insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+                    stmt = insert(Sprint)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[Sprint.issue_key],
+                        set_={c: stmt.excluded[c] for c in (*SprintService.SAVE_COLUMNS, "updated_at")}
+                    )
+                    db.execute(stmt, written)
+                else:
+                    ids = dict(db.query(Sprint.issue_key, Sprint.id).filter(Sprint.issue_key.in_([r["issue_key"] for r in changed])).all())
+                    updates = [dict(row, id=ids[row["issue_key"]]) for row in written if row["issue_key"] in ids]
+                    inserts = [row for row in written if row["issue_key"] not in ids]
+                    if updates:
+                        db.bulk_update_mappings(Sprint, updates)
+                    if inserts:
+                        db.bulk_insert_mappings(Sprint, inserts)
+
+                # Entries the rows left (reassignments, sprint moves) and the ones they joined
+                WorkloadLedger.refresh(
+                    {(existing[r["issue_key"]]["sprint_name"], existing[r["issue_key"]]["assignee_name"]) for r in changed if r["issue_key"] in existing}
+                    | {(r["sprint_name"], r["assignee_name"]) for r in changed},
+                    db
+                )
+
             db.commit()
-            print(f"\n Database Summary:")
-            print(f"   New assignments: {saved_count}")
-            print(f"   Updated/Reassigned: {updated_count}")
-            print(f"   Total processed: {saved_count + updated_count}")
+            return summary
             
         except Exception as e:
             db.rollback()
-            print(f"Error saving assignments: {str(e)}")
+            log.error("sprint_plan.save_failed", assignments=len(assignments), error=str(e))
             raise
 
     @staticmethod
@@ -0,0 +1,203 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import DateTime, delete, func, literal, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from src.database.db import SessionLocal
+from src.models.jira_issue import JiraIssue
+from src.models.sprint import Sprint
+from src.models.user_workload import UserWorkload
+from src.services.sprint_config import SprintConfig
+from src.utils.config import settings
+from src.utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# (sprint_name, username)
+Entry = Tuple[str, str]
+
+
+class WorkloadLedger:
+    """
+    Open workload per (sprint, assignee), materialized in user_workloads.
+
+    A sprints row counts toward its assignee's load while its issue exists in jira_issues and is not in
+    DONE_STATUSES. Writers never apply deltas: after changing sprint rows or issues they call refresh() for
+    the entries they touched, which recomputes those entries from the source rows in the same transaction.
+    Refreshing is idempotent, and on PostgreSQL the entries are locked first, so concurrent writers serialize
+    and each recomputes from committed state. rebuild() recomputes everything; LedgerRebuilder runs it
+    periodically as a backstop.
+    """
+
+    CHUNK_SIZE = 500
+    COUNTERS = ("story_points", "estimated_days", "open_issues")
+
+    @staticmethod
+    def open_issue():
+        """SQL condition on JiraIssue for work that still counts (the issue is not done)"""
+        return func.lower(func.trim(JiraIssue.status)).not_in(sorted(SprintConfig.DONE_STATUSES))
+
+    @staticmethod
+    def loads(sprint_name: str, usernames: Iterable[str], db: Session) -> Dict[str, float]:
+        """Open story points per username in a sprint; users without open work are omitted"""
+        names = list(dict.fromkeys(usernames))
+        loads = {}
+        for start in range(0, len(names), WorkloadLedger.CHUNK_SIZE):
+            stmt = select(UserWorkload.username, UserWorkload.story_points).where(
+                UserWorkload.sprint_name == sprint_name,
+                UserWorkload.username.in_(names[start:start + WorkloadLedger.CHUNK_SIZE])
+            )
+            for username, points in db.execute(stmt):
+                if points:
+                    loads[username] = float(points)
+        return loads
+
+    @staticmethod
+    def get_sprint(sprint_name: str, db: Session) -> List[UserWorkload]:
+        return db.execute(
+            select(UserWorkload)
+            .where(UserWorkload.sprint_name == sprint_name, UserWorkload.open_issues > 0)
+            .order_by(UserWorkload.story_points.desc(), UserWorkload.username)
+        ).scalars().all()
+
+    @staticmethod
+    def issue_entries(keys: Iterable[str], db: Session) -> Set[Entry]:
+        """Ledger entries holding the sprint rows of these issues; read before deleting the rows"""
+        keys = list(keys)
+        entries = set()
+        for start in range(0, len(keys), WorkloadLedger.CHUNK_SIZE):
+            stmt = select(Sprint.sprint_name, Sprint.assignee_name).where(
+                Sprint.issue_key.in_(keys[start:start + WorkloadLedger.CHUNK_SIZE])
+            ).distinct()
+            entries.update(tuple(row) for row in db.execute(stmt))
+        return entries
+
+    @staticmethod
+    def refresh_issues(keys: Iterable[str], db: Session) -> None:
+        """Refresh the entries holding these issues' sprint rows, after the issues changed"""
+        WorkloadLedger.refresh(WorkloadLedger.issue_entries(keys, db), db)
+
+    @staticmethod
+    def refresh(entries: Iterable[Entry], db: Session) -> None:
+        """Recompute `entries` from sprints and jira_issues; the caller commits"""
+        entries = sorted({entry for entry in entries if entry[0] and entry[1]})
+        dialect = db.get_bind().dialect.name
+        now = datetime.utcnow()
+        for start in range(0, len(entries), WorkloadLedger.CHUNK_SIZE):
+            chunk = entries[start:start + WorkloadLedger.CHUNK_SIZE]
+            if dialect == "postgresql":
+                # Create missing entries so every one can be locked, then lock them in key order
+                db.execute(
+                    postgresql_insert(UserWorkload).on_conflict_do_nothing(
+                        index_elements=[UserWorkload.sprint_name, UserWorkload.username]
+                    ),
+                    [WorkloadLedger._row(entry, (0, 0, 0), now) for entry in chunk]
+                )
+                db.execute(
+                    select(UserWorkload.sprint_name)
+                    .where(tuple_(UserWorkload.sprint_name, UserWorkload.username).in_(chunk))
+                    .order_by(UserWorkload.sprint_name, UserWorkload.username)
+                    .with_for_update()
+                )
+
+            totals = (
+                select(
+                    Sprint.sprint_name, Sprint.assignee_name,
+                    func.sum(Sprint.story_points), func.sum(Sprint.estimated_days), func.count()
+                )
+                .join(JiraIssue, JiraIssue.key == Sprint.issue_key)
+                .where(tuple_(Sprint.sprint_name, Sprint.assignee_name).in_(chunk), WorkloadLedger.open_issue())
+                .group_by(Sprint.sprint_name, Sprint.assignee_name)
+            )
+            counters = {(s, u): (p or 0, d or 0, n) for s, u, p, d, n in db.execute(totals)}
+            rows = [WorkloadLedger._row(entry, counters.get(entry, (0, 0, 0)), now) for entry in chunk]
+
+            if dialect in ("postgresql", "sqlite"):
+                insert = postgresql_insert if dialect == "postgresql" else sqlite_insert
+                stmt = insert(UserWorkload)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[UserWorkload.sprint_name, UserWorkload.username],
+                    set_={c: stmt.excluded[c] for c in (*WorkloadLedger.COUNTERS, "updated_at")}
+                )
+                db.execute(stmt, rows)
+            else:
+                for row in rows:
+                    db.merge(UserWorkload(**row))
+
+    @staticmethod
+    def rebuild(db) -> None:
+        """Recompute every entry from sprints joined to jira_issues; takes a Session or a Connection"""
+        dialect = db.get_bind().dialect.name if isinstance(db, Session) else db.dialect.name
+        if dialect == "postgresql":
+            # Block refreshes (row locks and writes) but not reads until the rebuild commits
+            db.execute(text("LOCK TABLE user_workloads IN EXCLUSIVE MODE"))
+        totals = (
+            select(
+                Sprint.sprint_name,
+                Sprint.assignee_name,
+                func.sum(Sprint.story_points),
+                func.sum(Sprint.estimated_days),
+                func.count(),
+                literal(datetime.utcnow(), DateTime)
+            )
+            .join(JiraIssue, JiraIssue.key == Sprint.issue_key)
+            .where(WorkloadLedger.open_issue())
+            .group_by(Sprint.sprint_name, Sprint.assignee_name)
+        )
+        db.execute(delete(UserWorkload))
+        db.execute(UserWorkload.__table__.insert().from_select(
+            ["sprint_name", "username", *WorkloadLedger.COUNTERS, "updated_at"], totals
+        ))
+
+    @staticmethod
+    def _row(entry: Entry, counters: Tuple[int, int, int], now: datetime) -> dict:
+        return {"sprint_name": entry[0], "username": entry[1], **dict(zip(WorkloadLedger.COUNTERS, counters)), "updated_at": now}
+
+
+class LedgerRebuilder:
+    """Rebuilds the workload ledger every `interval`, repairing anything a write path missed"""
+
+    def __init__(self, interval: timedelta):
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if self._task is None and self.interval.total_seconds() > 0:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval.total_seconds())
+            try:
+                await asyncio.to_thread(self.rebuild_now)
+            except Exception as e:
+                log.error("workload_ledger.rebuild_failed", error=str(e))
+
+    @staticmethod
+    def rebuild_now() -> None:
+        db = SessionLocal()
+        try:
+            WorkloadLedger.rebuild(db)
+            db.commit()
+            log.info("workload_ledger.rebuilt")
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+ledger_rebuilder = LedgerRebuilder(interval=timedelta(minutes=settings.WORKLOAD_LEDGER_REBUILD_MINUTES))
@@ -17,13 +17,62 @@ class Settings:
     JIRA_BASE_URL = os.getenv('JIRA_URL', '').strip()  
     JIRA_EMAIL = os.getenv('JIRA_EMAIL', '').strip()
     JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN', '').strip()
+    JIRA_PAGE_SIZE = int(os.getenv('JIRA_PAGE_SIZE', '100'))
+    JIRA_SYNC_CONCURRENCY = int(os.getenv('JIRA_SYNC_CONCURRENCY', '8'))
+    JIRA_TIMEOUT_SECONDS = float(os.getenv('JIRA_TIMEOUT_SECONDS', '30'))
+    JIRA_MAX_CONNECTIONS = int(os.getenv('JIRA_MAX_CONNECTIONS', '20'))
+    JIRA_MAX_RETRIES = int(os.getenv('JIRA_MAX_RETRIES', '5'))
+    JIRA_BACKOFF_BASE_SECONDS = float(os.getenv('JIRA_BACKOFF_BASE_SECONDS', '0.5'))
+    JIRA_BACKOFF_MAX_SECONDS = float(os.getenv('JIRA_BACKOFF_MAX_SECONDS', '30'))
+    JIRA_RATE_LIMIT_PER_SECOND = float(os.getenv('JIRA_RATE_LIMIT_PER_SECOND', '10'))
+    JIRA_RATE_LIMIT_BURST = int(os.getenv('JIRA_RATE_LIMIT_BURST', '20'))
+    JIRA_SYNC_OVERLAP_MINUTES = int(os.getenv('JIRA_SYNC_OVERLAP_MINUTES', '5'))
+    JIRA_RECONCILE_INTERVAL_HOURS = float(os.getenv('JIRA_RECONCILE_INTERVAL_HOURS', '24'))
+    JIRA_SYNC_INTERVAL_SECONDS = int(os.getenv('JIRA_SYNC_INTERVAL_SECONDS', '300'))
+    JIRA_SYNC_WORKERS = int(os.getenv('JIRA_SYNC_WORKERS', '4'))
+    JIRA_ACTIVE_PROJECT_TTL_HOURS = float(os.getenv('JIRA_ACTIVE_PROJECT_TTL_HOURS', '24'))
+    JIRA_WEBHOOK_SECRET = os.getenv('JIRA_WEBHOOK_SECRET', '').strip()
+    JIRA_WEBHOOK_MAX_PENDING = int(os.getenv('JIRA_WEBHOOK_MAX_PENDING', '10000'))
+    JIRA_WEBHOOK_BATCH_SIZE = int(os.getenv('JIRA_WEBHOOK_BATCH_SIZE', '500'))
+    JIRA_WEBHOOK_FLUSH_SECONDS = float(os.getenv('JIRA_WEBHOOK_FLUSH_SECONDS', '2'))
+    JIRA_WEBHOOK_MAX_ATTEMPTS = int(os.getenv('JIRA_WEBHOOK_MAX_ATTEMPTS', '5'))
+
+    # Concurrency Configuration
+    SINGLE_FLIGHT_LOCK_TIMEOUT_SECONDS = float(os.getenv('SINGLE_FLIGHT_LOCK_TIMEOUT_SECONDS', '600'))
+
+    # Sprint Planning Configuration
+    ASSIGNMENT_TIME_BUDGET_SECONDS = float(os.getenv('ASSIGNMENT_TIME_BUDGET_SECONDS', '2'))
+    SPRINT_PLAN_CACHE_TTL_SECONDS = float(os.getenv('SPRINT_PLAN_CACHE_TTL_SECONDS', '1800'))
+    SPRINT_PLAN_CACHE_MAX_ENTRIES = int(os.getenv('SPRINT_PLAN_CACHE_MAX_ENTRIES', '200'))
+    PLANNING_PROCESS_WORKERS = int(os.getenv('PLANNING_PROCESS_WORKERS', str(min(4, os.cpu_count() or 1))))
+    PLANNING_BATCH_MAX_TEAMS = int(os.getenv('PLANNING_BATCH_MAX_TEAMS', '20'))
+    PLANNING_JOB_WORKERS = int(os.getenv('PLANNING_JOB_WORKERS', '2'))  # planning jobs run at once per process
+    PLANNING_JOB_MAX_PENDING = int(os.getenv('PLANNING_JOB_MAX_PENDING', '100'))
+    PLANNING_JOB_MAX_ATTEMPTS = int(os.getenv('PLANNING_JOB_MAX_ATTEMPTS', '3'))
+    PLANNING_JOB_LEASE_SECONDS = float(os.getenv('PLANNING_JOB_LEASE_SECONDS', '60'))  # renewed every third of it
+    PLANNING_JOB_PROGRESS_SECONDS = float(os.getenv('PLANNING_JOB_PROGRESS_SECONDS', '1'))  # progress writes at most this often
+    WORKLOAD_LEDGER_REBUILD_MINUTES = float(os.getenv('WORKLOAD_LEDGER_REBUILD_MINUTES', '60'))  # 0 disables
+    FORECAST_DEFAULT_TRIALS = int(os.getenv('FORECAST_DEFAULT_TRIALS', '10000'))
+    FORECAST_MAX_TRIALS = int(os.getenv('FORECAST_MAX_TRIALS', '100000'))
 
     # OpenAI Configuration 
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '').strip()
+    AI_ESTIMATION_CONCURRENCY = int(os.getenv('AI_ESTIMATION_CONCURRENCY', '8'))
+    AI_ESTIMATION_TIMEOUT_SECONDS = float(os.getenv('AI_ESTIMATION_TIMEOUT_SECONDS', '30'))
+    AI_ESTIMATION_MODE = os.getenv('AI_ESTIMATION_MODE', 'batch').strip().lower()  # 'batch' or 'single'
+    AI_BATCH_MAX_ISSUES = int(os.getenv('AI_BATCH_MAX_ISSUES', '20'))
+    AI_BATCH_TOKEN_BUDGET = int(os.getenv('AI_BATCH_TOKEN_BUDGET', '6000'))
+    ESTIMATE_CACHE_TTL_DAYS = int(os.getenv('ESTIMATE_CACHE_TTL_DAYS', '90'))
+    ESTIMATE_CACHE_MAX_ROWS = int(os.getenv('ESTIMATE_CACHE_MAX_ROWS', '200000'))
+    ESTIMATE_CACHE_MEMORY_ENTRIES = int(os.getenv('ESTIMATE_CACHE_MEMORY_ENTRIES', '10000'))
 
     # App Configuration
     FRONTEND_URL = os.getenv('FRONTEND_URL', '').strip()
 
+    # Logging Configuration
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').strip().upper()
+    LOG_DEBUG_SAMPLE_RATE = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', '0.01'))  # share of per-issue DEBUG records kept
+
 # Instantiate global settings object
 settings = Settings()
 
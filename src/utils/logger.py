@@ -0,0 +1,115 @@
+"""
+Structured logging.
+
+Records are rendered as `time level logger event key=value ...` and always carry the correlation id of
+the request that produced them. Handlers never run on the caller's thread: loggers write to an
+in-memory queue and a QueueListener thread formats and writes the records.
+
+    log = get_logger(__name__)
+    log.info("sprint_plan.completed", project="PROJ", issues=120)
+    log.debug_sampled("story_points.estimated", issue="PROJ-7", points=5)
+"""
+import logging
+import queue
+import random
+import sys
+import uuid
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from src.utils.config import settings
+
+correlation_id: ContextVar[str] = ContextVar("correlation_id", default="-")
+
+_RESERVED_KWARGS = {"exc_info", "stack_info", "stacklevel", "extra"}
+_listener: Optional[QueueListener] = None
+
+
+def new_correlation_id() -> str:
+    return uuid.uuid4().hex
+
+
+class StructuredLogger(logging.LoggerAdapter):
+    """Logger whose keyword arguments become key=value fields on the record"""
+
+    def process(self, msg, kwargs):
+        fields = {k: kwargs.pop(k) for k in list(kwargs) if k not in _RESERVED_KWARGS}
+        kwargs.setdefault("extra", {})["fields"] = fields
+        return msg, kwargs
+
+    def debug_sampled(self, msg, rate: Optional[float] = None, **kwargs) -> None:
+        """DEBUG record kept with probability `rate` (LOG_DEBUG_SAMPLE_RATE by default), for per-item detail"""
+        if self.isEnabledFor(logging.DEBUG) and random.random() < (settings.LOG_DEBUG_SAMPLE_RATE if rate is None else rate):
+            self.log(logging.DEBUG, msg, sampled=True, **kwargs)
+
+
+class CorrelationIdFilter(logging.Filter):
+    """Stamps records with the current correlation id; runs on the caller's thread, where the context lives"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id.get()
+        return True
+
+
+class KeyValueFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        parts = [
+            self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            record.levelname,
+            record.name,
+            record.getMessage(),
+            f"correlation_id={getattr(record, 'correlation_id', '-')}",
+        ]
+        for key, value in getattr(record, "fields", {}).items():
+            parts.append(f"{key}={self._value(value)}")
+        line = " ".join(parts)
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+    @staticmethod
+    def _value(value) -> str:
+        text = str(value)
+        if not text or any(c in text for c in ' "=\n'):
+            return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        return text
+
+
+def get_logger(name: str) -> StructuredLogger:
+    return StructuredLogger(logging.getLogger(name), {})
+
+
+def setup_logging() -> None:
+    """Route the `src` logger hierarchy through a queue to stdout; safe to call more than once"""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(CorrelationIdFilter())
+
+    root = logging.getLogger("src")
+    root.setLevel(settings.LOG_LEVEL)
+    root.addHandler(queue_handler)
+    root.propagate = False
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(KeyValueFormatter())
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    root = logging.getLogger("src")
+    for handler in [h for h in root.handlers if isinstance(h, QueueHandler)]:
+        root.removeHandler(handler)
+    root.propagate = True
+    _listener = None
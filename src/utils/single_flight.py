@@ -0,0 +1,115 @@
+import asyncio
+import hashlib
+import time
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from sqlalchemy import text
+
+from src.database.db import engine
+from src.utils.config import settings
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one in-flight computation.
+    The first caller (the leader) runs the function; callers arriving while it runs await the leader's
+    result or exception instead of starting their own.
+
+    The leader holds a lock on `lock_key` (defaults to the key) for the duration: an asyncio.Lock within
+    this process and, on PostgreSQL, a session-level advisory lock so other worker processes serialize too.
+    A lock_key coarser than the key lets non-identical calls share a critical section without sharing results.
+    A lock is dropped once no caller holds or waits for it, so unique keys do not accumulate.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[str, ...], asyncio.Future] = {}
+        self._locks: Dict[Tuple[str, ...], asyncio.Lock] = {}
+        # Callers holding or waiting for each lock
+        self._lock_users: Dict[Tuple[str, ...], int] = {}
+
+    async def do(
+        self,
+        key: Tuple[str, ...],
+        fn: Callable[[], Awaitable[T]],
+        lock_key: Optional[Tuple[str, ...]] = None
+    ) -> T:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            async with self._lock(lock_key or key):
+                result = await fn()
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a leader-only failure does not log "exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
+
+    @asynccontextmanager
+    async def _lock(self, lock_key: Tuple[str, ...]):
+        lock = self._locks.setdefault(lock_key, asyncio.Lock())
+        self._lock_users[lock_key] = self._lock_users.get(lock_key, 0) + 1
+        try:
+            async with lock:
+                async with advisory_lock(lock_key):
+                    yield
+        finally:
+            self._lock_users[lock_key] -= 1
+            if not self._lock_users[lock_key]:
+                del self._lock_users[lock_key]
+                del self._locks[lock_key]
+
+
+def advisory_lock_id(lock_key: Tuple[str, ...]) -> int:
+    """Stable signed 64-bit id for pg_advisory_lock; Python's hash() is salted per process"""
+    digest = hashlib.sha256("\x1f".join(lock_key).encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+@asynccontextmanager
+async def advisory_lock(lock_key: Tuple[str, ...]):
+    """
+    Hold a PostgreSQL session-level advisory lock on a dedicated connection; a no-op on other databases.
+    Polls pg_try_advisory_lock, and every database call runs in a worker thread, so neither waiting for the
+    lock nor for a pool connection blocks the event loop.
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+
+    lock_id = advisory_lock_id(lock_key)
+    conn = await asyncio.to_thread(engine.connect)
+    try:
+        deadline = time.monotonic() + settings.SINGLE_FLIGHT_LOCK_TIMEOUT_SECONDS
+        delay = 0.05
+        while not await asyncio.to_thread(_run_lock_statement, conn, "SELECT pg_try_advisory_lock(:id)", lock_id):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Timed out waiting for lock {':'.join(lock_key)}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        try:
+            yield
+        finally:
+            await asyncio.to_thread(_run_lock_statement, conn, "SELECT pg_advisory_unlock(:id)", lock_id)
+    finally:
+        await asyncio.to_thread(conn.close)
+
+
+def _run_lock_statement(conn, statement: str, lock_id: int) -> bool:
+    result = conn.execute(text(statement), {"id": lock_id}).scalar()
+    conn.commit()
+    return bool(result)
+
+
+single_flight = SingleFlight()
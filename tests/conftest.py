@@ -0,0 +1,57 @@
+"""
+Shared fixtures. Tests run against a throwaway SQLite database, so the settings are pointed at it before
+anything under src is imported.
+"""
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+os.environ.setdefault("OPENAI_API_KEY", "test")
+
+import pytest
+
+from src.database.db import Base, SessionLocal, create_tables, engine
+from src.models import JiraIssue, Sprint, Team, User
+
+create_tables()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+        with engine.begin() as conn:
+            for table in reversed(Base.metadata.sorted_tables):
+                conn.execute(table.delete())
+
+
+def add_issue(
+    db, key: str, status: str = "To Do", source: str = "jira", project_key: str = "P", assignee: str = None
+) -> JiraIssue:
+    issue = JiraIssue(key=key, project_key=project_key, title=f"Issue {key}", status=status, source=source, assignee=assignee)
+    db.add(issue)
+    return issue
+
+
+def add_assignment(db, key: str, assignee: str, sprint_name: str = "S1", story_points: int = 3) -> Sprint:
+    row = Sprint(
+        sprint_name=sprint_name, issue_key=key, assignee_name=assignee, title=f"Issue {key}",
+        estimated_days=2, story_points=story_points
+    )
+    db.add(row)
+    return row
+
+
+def add_team(db, name: str, tickets_solved=(50, 20, 5)) -> list:
+    """A team with one user per tickets_solved value (senior, junior and intern by default)"""
+    db.add(Team(name=name))
+    users = [
+        User(email=f"{name}{n}@example.com", username=f"{name}{n}", hashed_password="x", role="backend developer",
+             tickets_solved=tickets, team=name)
+        for n, tickets in enumerate(tickets_solved)
+    ]
+    db.add_all(users)
+    return users
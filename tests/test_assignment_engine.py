@@ -0,0 +1,115 @@
+import random
+from collections import Counter, defaultdict
+
+from src.schemas.jira_schema import JiraIssueResponse
+from src.schemas.sprint_schema import UserSkillAnalysis
+from src.services.assignment_engine import AssignmentEngine
+from src.services.sprint_config import SprintConfig
+
+
+def make_user(n: int, level: str, skill: str = "backend", capacity: float = 50.0) -> UserSkillAnalysis:
+    return UserSkillAnalysis(
+        user_id=n, username=f"{level}{n}", role=f"{skill} developer", team="t", tickets_solved=0,
+        skill_category=skill, experience_level=level, capacity_score=capacity
+    )
+
+
+def make_issues(points, title: str = "Add API endpoint"):
+    return [
+        JiraIssueResponse(key=f"T-{n}", title=title, description="", status="To Do", due_date=None, story_points=p)
+        for n, p in enumerate(points)
+    ]
+
+
+def test_greedy_assigns_each_issue_once_within_limits():
+    users = [make_user(0, "senior"), make_user(1, "junior"), make_user(2, "intern")]
+    issues = make_issues([1, 2, 3, 5, 8, 13, 21, 3, 1])
+
+    assignments = AssignmentEngine.assign(issues, users, "S1")
+
+    assert sorted(a.issue_key for a in assignments) == sorted(i.key for i in issues)
+    levels = {u.username: u.experience_level for u in users}
+    for a in assignments:
+        limits = SprintConfig.STORY_POINT_LIMITS[levels[a.assignee_name]]
+        assert limits["min"] <= a.story_points <= limits["max"]
+
+
+def test_greedy_clamps_when_nobody_is_eligible():
+    issues = make_issues([21])
+    assignments = AssignmentEngine.assign(issues, [make_user(0, "intern")], "S1")
+    assert assignments[0].story_points == SprintConfig.STORY_POINT_LIMITS["intern"]["max"]
+
+
+def test_greedy_initial_loads_steer_work_away_from_busy_users():
+    users = [make_user(0, "junior"), make_user(1, "junior")]
+    assignments = AssignmentEngine.assign(make_issues([3]), users, "S1", initial_loads={"junior0": 40})
+    assert assignments[0].assignee_name == "junior1"
+
+
+def test_optimal_never_clamps_story_points():
+    users = [make_user(0, "senior"), make_user(1, "junior"), make_user(2, "junior"), make_user(3, "intern")]
+    points = [21, 21, 13, 8, 5, 3, 2, 1] * 5
+    issues = make_issues(points)
+
+    assignments = AssignmentEngine.assign_optimal(issues, users, "S1", time_budget=5)
+
+    assert Counter(a.story_points for a in assignments) == Counter(points)
+    assert {a.assignee_name for a in assignments if a.story_points == 21} == {"senior0"}
+
+
+def test_optimal_keeps_points_when_nobody_is_eligible():
+    users = [make_user(0, "intern"), make_user(1, "intern")]
+    issues = make_issues([21, 13, 1])
+
+    assignments = AssignmentEngine.assign_optimal(issues, users, "S1", time_budget=5)
+
+    assert sorted(a.story_points for a in assignments) == [1, 13, 21]
+
+
+def test_optimal_assigns_every_issue_once_and_prefers_matching_skills():
+    users = [make_user(0, "junior", "frontend"), make_user(1, "junior", "backend")]
+    issues = make_issues([3] * 4, title="Build login UI") + [
+        JiraIssueResponse(key=f"B-{n}", title="Add API endpoint", description="", status="To Do", due_date=None, story_points=3)
+        for n in range(4)
+    ]
+
+    assignments = AssignmentEngine.assign_optimal(issues, users, "S1", time_budget=5)
+
+    assert sorted(a.issue_key for a in assignments) == sorted(i.key for i in issues)
+    owner = {a.issue_key: a.assignee_name for a in assignments}
+    assert all(owner[f"T-{n}"] == "junior0" for n in range(4))
+    assert all(owner[f"B-{n}"] == "junior1" for n in range(4))
+
+
+def test_optimal_makespan_is_no_worse_than_greedy():
+    rng = random.Random(7)
+    skills = ["frontend", "backend", "fullstack", "testing"]
+    titles = ["Build login UI", "Add API endpoint", "Write integration tests", "Refactor frontend state"]
+    users = [
+        make_user(n, level, rng.choice(skills), capacity=rng.choice([10.0, 40.0, 100.0]))
+        for n, level in enumerate(["senior"] * 4 + ["junior"] * 4 + ["intern"] * 6)
+    ]
+    issues = [
+        JiraIssueResponse(key=f"T-{n}", title=rng.choice(titles), description="", status="To Do", due_date=None,
+                          story_points=rng.choice(SprintConfig.FIBONACCI_POINTS))
+        for n in range(600)
+    ]
+
+    def makespan(assignments):
+        days = defaultdict(int)
+        for a in assignments:
+            days[a.assignee_name] += a.estimated_days
+        return max(days.values())
+
+    greedy = AssignmentEngine.assign(issues, users, "S1")
+    optimal = AssignmentEngine.assign_optimal(issues, users, "S1", time_budget=5)
+
+    assert sorted(a.issue_key for a in optimal) == sorted(i.key for i in issues)
+    assert makespan(optimal) <= makespan(greedy)
+
+
+def test_infer_skill_from_title():
+    assert AssignmentEngine.infer_skill("Fix dashboard layout") == "frontend"
+    assert AssignmentEngine.infer_skill("Write regression tests") == "testing"
+    assert AssignmentEngine.infer_skill("Add API endpoint") == "backend"
+    assert AssignmentEngine.infer_skill("Misc chores") is None
@@ -0,0 +1,34 @@
+import asyncio
+
+from src.schemas.sprint_schema import SprintBatchPlanItem, SprintBatchTeamResult
+from src.services import sprint_service
+from src.services.sprint_service import SprintService
+
+
+def test_batch_team_limit_fits_the_db_pool():
+    pool_size = sprint_service.engine.pool.size()
+    assert sprint_service.batch_team_semaphore._value == pool_size // sprint_service.BATCH_CONNECTIONS_PER_TEAM
+
+
+def test_batch_runs_at_most_the_semaphore_limit_of_teams_at_once(monkeypatch):
+    running, peak = [0], [0]
+
+    async def plan_item(item):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        return SprintBatchTeamResult(
+            project_key=item.project_key, sprint_name=item.sprint_name, team_name=item.team_name, status="ok"
+        )
+
+    async def run():
+        monkeypatch.setattr(sprint_service, "batch_team_semaphore", asyncio.Semaphore(2))
+        plans = [SprintBatchPlanItem(project_key="P", sprint_name="S1", team_name=f"team{n}") for n in range(7)]
+        return await SprintService.create_batch_assignments(plans)
+
+    monkeypatch.setattr(SprintService, "_plan_batch_item", staticmethod(plan_item))
+    result = asyncio.run(run())
+
+    assert (result.succeeded, result.failed) == (7, 0)
+    assert peak[0] == 2
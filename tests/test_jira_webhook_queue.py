@@ -0,0 +1,105 @@
+import asyncio
+import hashlib
+import hmac
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.routes import jira as jira_routes
+from src.models import JiraIssue, Sprint, UserWorkload
+from src.services.jira_webhook_queue import JiraWebhookQueue
+from src.services.workload_ledger import WorkloadLedger
+from tests.conftest import add_assignment, add_issue
+
+
+def webhook_issue(key: str, summary="Add API endpoint", status="To Do") -> dict:
+    return {"key": key, "fields": {"summary": summary, "status": {"name": status}, "project": {"key": "P"}}}
+
+
+def make_queue(**overrides) -> JiraWebhookQueue:
+    options = dict(max_pending=100, batch_size=10, flush_interval=60, max_attempts=3)
+    options.update(overrides)
+    return JiraWebhookQueue(**options)
+
+
+def test_flush_writes_coalesced_events(db):
+    queue = make_queue()
+    queue.enqueue(queue.UPSERT, webhook_issue("P-1", summary="first"))
+    queue.enqueue(queue.UPSERT, webhook_issue("P-1", summary="second"))
+    queue.enqueue(queue.UPSERT, webhook_issue("P-2"))
+
+    asyncio.run(queue.flush())
+
+    titles = dict(db.query(JiraIssue.key, JiraIssue.title))
+    assert titles == {"P-1": "second", "P-2": "Add API endpoint"}
+    assert db.query(JiraIssue.source).distinct().all() == [("jira",)]
+    metrics = queue.metrics()
+    assert (metrics.pending, metrics.coalesced, metrics.flushed_events) == (0, 1, 2)
+
+
+def test_poison_event_does_not_wedge_the_queue(db):
+    queue = make_queue()
+    queue.enqueue(queue.UPSERT, webhook_issue("P-1"))
+    queue.enqueue(queue.UPSERT, webhook_issue("P-2", summary=None))  # title is NOT NULL
+    queue.enqueue(queue.UPSERT, webhook_issue("P-3"))
+
+    asyncio.run(queue.flush())
+    # The good events are written on the first flush; the poison one waits at the head of the queue
+    assert sorted(k for (k,) in db.query(JiraIssue.key)) == ["P-1", "P-3"]
+    assert queue.metrics().pending == 1
+
+    queue.enqueue(queue.UPSERT, webhook_issue("P-4"))
+    for _ in range(queue.max_attempts):
+        asyncio.run(queue.flush())
+
+    metrics = queue.metrics()
+    assert (metrics.pending, metrics.dropped) == (0, 1)
+    assert sorted(k for (k,) in db.query(JiraIssue.key)) == ["P-1", "P-3", "P-4"]
+
+
+def test_newer_event_resets_attempts_of_a_failing_key(db):
+    queue = make_queue(max_attempts=2)
+    queue.enqueue(queue.UPSERT, webhook_issue("P-1", summary=None))
+    asyncio.run(queue.flush())
+    queue.enqueue(queue.UPSERT, webhook_issue("P-1", summary="fixed"))
+
+    asyncio.run(queue.flush())
+
+    assert queue.metrics().dropped == 0
+    assert db.query(JiraIssue.title).filter(JiraIssue.key == "P-1").scalar() == "fixed"
+
+
+def test_delete_event_removes_issue_and_its_assignment(db):
+    add_issue(db, "P-1")
+    add_issue(db, "P-2")
+    add_assignment(db, "P-1", "dev")
+    add_assignment(db, "P-2", "dev")
+    db.flush()
+    WorkloadLedger.rebuild(db)
+    db.commit()
+
+    queue = make_queue()
+    queue.enqueue(queue.DELETE, {"key": "P-1"})
+    asyncio.run(queue.flush())
+
+    db.expire_all()
+    assert [k for (k,) in db.query(JiraIssue.key)] == ["P-2"]
+    assert [k for (k,) in db.query(Sprint.issue_key)] == ["P-2"]
+    assert db.get(UserWorkload, ("S1", "dev")).open_issues == 1
+
+
+def test_webhook_route_fails_closed_without_a_secret(monkeypatch):
+    app = FastAPI()
+    app.include_router(jira_routes.router)
+    client = TestClient(app)
+    body = json.dumps({"webhookEvent": "jira:issue_deleted", "issue": {"key": "P-1"}}).encode()
+    monkeypatch.setattr(jira_routes.jira_webhook_queue, "enqueue", lambda event_type, issue: True)
+
+    monkeypatch.setattr(jira_routes.settings, "JIRA_WEBHOOK_SECRET", "")
+    assert client.post("/jira/webhook", content=body).status_code == 503
+
+    monkeypatch.setattr(jira_routes.settings, "JIRA_WEBHOOK_SECRET", "s3cret")
+    assert client.post("/jira/webhook", content=body, headers={"X-Hub-Signature": "sha256=bad"}).status_code == 401
+    signature = "sha256=" + hmac.new(b"s3cret", body, hashlib.sha256).hexdigest()
+    assert client.post("/jira/webhook", content=body, headers={"X-Hub-Signature": signature}).status_code == 202
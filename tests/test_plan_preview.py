@@ -0,0 +1,93 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+
+from src.models import Sprint, UserWorkload
+from src.schemas.sprint_schema import SprintPlanPreview
+from src.services import plan_cache as plan_cache_module
+from src.services.plan_cache import PlanCache, plan_cache
+from src.services.sprint_service import SprintService
+from tests.conftest import add_issue, add_team
+
+
+def seed(db):
+    add_team(db, "alpha")
+    for n in range(6):
+        add_issue(db, f"P-{n}")
+    db.commit()
+
+
+def preview(db):
+    return asyncio.run(SprintService.preview_sprint_plan(project_key="P", sprint_name="S1", team_name="alpha", db=db))
+
+
+def commit(plan_id, db):
+    return asyncio.run(SprintService.commit_sprint_plan(plan_id, db))
+
+
+def count(db, model) -> int:
+    return db.scalar(select(func.count()).select_from(model))
+
+
+def test_preview_writes_nothing(db):
+    seed(db)
+
+    plan = preview(db)
+
+    assert len(plan.assignments) == 6
+    assert (count(db, Sprint), count(db, UserWorkload)) == (0, 0)
+
+
+def test_commit_persists_exactly_the_previewed_plan(db):
+    seed(db)
+    plan = preview(db)
+
+    result = commit(plan.plan_id, db)
+
+    assert result.assignments == len(plan.assignments)
+    rows = db.execute(select(Sprint)).scalars().all()
+    saved = {(r.sprint_name, r.issue_key, r.assignee_name, r.story_points, r.estimated_days) for r in rows}
+    previewed = {(a.sprint_name, a.issue_key, a.assignee_name, a.story_points, a.estimated_days) for a in plan.assignments}
+    assert saved == previewed
+    # A plan commits once
+    with pytest.raises(HTTPException) as error:
+        commit(plan.plan_id, db)
+    assert error.value.status_code == 404
+
+
+def test_commit_unknown_plan_is_404(db):
+    with pytest.raises(HTTPException) as error:
+        commit("no-such-plan", db)
+    assert error.value.status_code == 404
+
+
+def test_commit_expired_plan_is_404(db, monkeypatch):
+    seed(db)
+    monkeypatch.setattr(plan_cache, "ttl", -1)
+    plan = preview(db)
+
+    with pytest.raises(HTTPException) as error:
+        commit(plan.plan_id, db)
+
+    assert error.value.status_code == 404
+    assert count(db, Sprint) == 0
+
+
+def test_plan_cache_expires_entries_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(plan_cache_module.time, "monotonic", lambda: now[0])
+    cache = PlanCache(ttl=60, max_entries=10)
+    plan = SprintPlanPreview(
+        plan_id=cache.new_plan_id(), project_key="P", sprint_name="S1", team_name="alpha", strategy="greedy",
+        expires_at=datetime.utcnow(), assignments=[]
+    )
+    cache.put(plan)
+
+    now[0] += 59
+    assert cache.get(plan.plan_id) is plan
+    now[0] += 2
+    assert cache.get(plan.plan_id) is None
+
@@ -0,0 +1,52 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from src.schemas.sprint_schema import SprintCreateRequest
+from src.services.planning_jobs import PlanningJobQueue
+
+
+def make_queue(max_pending: int) -> PlanningJobQueue:
+    return PlanningJobQueue(
+        workers=1, max_pending=max_pending, max_attempts=3, lease=timedelta(seconds=60), progress_interval=1
+    )
+
+
+def submit(queue: PlanningJobQueue, db, n: int):
+    return queue.submit(SprintCreateRequest(project_key="P", sprint_name=f"S{n}", team_name="alpha"), db)
+
+
+def test_recovery_does_not_queue_a_job_twice(db):
+    async def scenario():
+        # No workers: jobs stay queued, as they would behind a busy pool
+        queue = make_queue(max_pending=3)
+        queue._queue = asyncio.Queue()
+        for n in range(3):
+            submit(queue, db, n)
+
+        await queue._requeue()
+        await queue._requeue()
+
+        assert queue._queue.qsize() == 3
+        with pytest.raises(HTTPException) as error:
+            submit(queue, db, 3)
+        assert error.value.status_code == 429
+
+    asyncio.run(scenario())
+
+
+def test_recovery_leaves_room_for_new_jobs_below_max_pending(db):
+    async def scenario():
+        queue = make_queue(max_pending=3)
+        queue._queue = asyncio.Queue()
+        submit(queue, db, 0)
+        submit(queue, db, 1)
+
+        await queue._requeue()
+
+        assert submit(queue, db, 2).status == PlanningJobQueue.QUEUED
+        assert queue._queue.qsize() == 3
+
+    asyncio.run(scenario())
@@ -0,0 +1,62 @@
+"""
+EXPLAIN-based regression check for the hot query paths: each must use an index on seeded tables rather than
+fall back to a full table scan.
+"""
+import pytest
+from sqlalchemy import text
+
+HOT_QUERIES = {
+    "issues by project": ("SELECT * FROM jira_issues WHERE project_key = :p ORDER BY id", {"p": "P7"}),
+    "issues page": ("SELECT id, key FROM jira_issues WHERE project_key = :p AND id > :c ORDER BY id LIMIT 100",
+                    {"p": "P7", "c": 500}),
+    "issues by project and status": ("SELECT id FROM jira_issues WHERE project_key = :p AND status = :s",
+                                     {"p": "P7", "s": "In Progress"}),
+    "issue by key": ("SELECT id FROM jira_issues WHERE key = :k", {"k": "P7-70"}),
+    "sprint row by issue": ("SELECT id FROM sprints WHERE issue_key = :k", {"k": "P7-70"}),
+    "sprint load by assignee": ("SELECT SUM(story_points) FROM sprints WHERE sprint_name = :s AND assignee_name = :a",
+                                {"s": "Sprint 3", "a": "user7"}),
+    "ledger loads by sprint": ("SELECT username, story_points FROM user_workloads WHERE sprint_name = :s",
+                               {"s": "Sprint 3"}),
+    "users by team": ("SELECT id FROM users WHERE team = :t", {"t": "team7"}),
+}
+
+ROWS = 5000
+
+
+@pytest.fixture
+def seeded(db):
+    projects, statuses = 50, ["To Do", "In Progress", "Done", "Blocked"]
+    db.execute(text("INSERT INTO teams (name) VALUES " + ", ".join(f"('team{t}')" for t in range(100))))
+    db.execute(
+        text("INSERT INTO users (email, username, hashed_password, role, tickets_solved, team) "
+             "VALUES (:e, :u, 'x', 'developer', 0, :t)"),
+        [{"e": f"user{n}@example.com", "u": f"user{n}", "t": f"team{n % 100}"} for n in range(ROWS)]
+    )
+    db.execute(
+        text("INSERT INTO jira_issues (key, project_key, title, status) VALUES (:k, :p, 'title', :s)"),
+        [{"k": f"P{n % projects}-{n}", "p": f"P{n % projects}", "s": statuses[n % 4]} for n in range(ROWS)]
+    )
+    db.execute(
+        text("INSERT INTO sprints (sprint_name, issue_key, assignee_name, title, estimated_days, story_points) "
+             "VALUES (:s, :k, :a, 'title', 3, 5)"),
+        [{"s": f"Sprint {n % 20}", "k": f"P{n % projects}-{n}", "a": f"user{n % 500}"} for n in range(ROWS)]
+    )
+    db.execute(
+        text("INSERT INTO user_workloads (sprint_name, username, story_points, estimated_days, open_issues, updated_at) "
+             "VALUES (:s, :u, 5, 3, 1, CURRENT_TIMESTAMP)"),
+        [{"s": f"Sprint {n % 20}", "u": f"user{n}"} for n in range(ROWS)]
+    )
+    db.execute(text("ANALYZE"))
+    db.commit()
+    return db
+
+
+def full_scans(db, sql: str, params: dict) -> list:
+    details = [row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params)]
+    return [d for d in details if d.startswith("SCAN") and "USING" not in d]
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_an_index(seeded, name):
+    sql, params = HOT_QUERIES[name]
+    assert full_scans(seeded, sql, params) == []
@@ -0,0 +1,108 @@
+import asyncio
+import re
+
+import pytest
+
+from src.models import JiraIssue, Sprint, UserWorkload
+from src.services import jira_service
+from src.services.jira_service import JiraService
+from src.services.workload_ledger import WorkloadLedger
+from tests.conftest import add_assignment, add_issue
+
+
+class FakeJira:
+    """Answers /search like Jira: project filter, optional key > cursor, key order, startAt/maxResults paging"""
+
+    def __init__(self):
+        self.keys = []
+        self.on_page = None
+        self.pages = 0
+
+    async def get_json(self, path, params=None):
+        match = re.search(r'key > "(\w+)-(\d+)"', params["jql"])
+        after = int(match.group(2)) if match else 0
+        matching = sorted((k for k in self.keys if int(k.rsplit("-", 1)[1]) > after), key=lambda k: int(k.rsplit("-", 1)[1]))
+        start = params.get("startAt", 0)
+        page = matching[start:start + params["maxResults"]]
+        self.pages += 1
+        if self.on_page:
+            self.on_page(self.pages)
+        return {"total": len(matching), "issues": [{"key": key} for key in page]}
+
+
+@pytest.fixture
+def jira(monkeypatch):
+    fake = FakeJira()
+    monkeypatch.setattr(jira_service.jira_client, "get_json", fake.get_json)
+    monkeypatch.setattr(jira_service.settings, "JIRA_PAGE_SIZE", 10)
+    return fake
+
+
+def test_reconcile_deletes_only_synced_issues_missing_from_jira(db, jira):
+    add_issue(db, "P-1")
+    add_issue(db, "P-2")
+    add_issue(db, "P-3", source="local")
+    add_issue(db, "P-4", source=None)
+    add_issue(db, "Q-1", project_key="Q")
+    db.commit()
+    jira.keys.append("P-1")
+
+    deleted = asyncio.run(JiraService.reconcile_deleted_issues("P", db))
+
+    assert deleted == 1
+    assert sorted(k for (k,) in db.query(JiraIssue.key)) == ["P-1", "P-3", "P-4", "Q-1"]
+
+
+def test_reconcile_removes_dependent_rows_in_the_same_transaction(db, jira):
+    for key in ("P-1", "P-2", "P-3"):
+        add_issue(db, key)
+        add_assignment(db, key, "dev", story_points=5)
+    db.flush()
+    WorkloadLedger.rebuild(db)
+    db.commit()
+    jira.keys.extend(["P-1", "P-3"])
+
+    asyncio.run(JiraService.reconcile_deleted_issues("P", db))
+
+    db.expire_all()
+    assert sorted(k for (k,) in db.query(Sprint.issue_key)) == ["P-1", "P-3"]
+    workload = db.get(UserWorkload, ("S1", "dev"))
+    assert (workload.story_points, workload.open_issues) == (10, 2)
+
+
+def test_reconcile_keeps_everything_jira_still_lists(db, jira):
+    add_issue(db, "P-1")
+    add_assignment(db, "P-1", "dev")
+    db.commit()
+    jira.keys.append("P-1")
+
+    assert asyncio.run(JiraService.reconcile_deleted_issues("P", db)) == 0
+    assert db.query(Sprint).count() == 1
+
+
+def test_sync_marks_issues_as_coming_from_jira(db):
+    rows = [dict(JiraService._parse_issue({"key": "P-9", "fields": {"summary": "Add API endpoint", "status": {"name": "To Do"}}}), project_key="P")]
+
+    JiraService._bulk_upsert_issues(rows, db)
+    db.commit()
+
+    assert db.query(JiraIssue.source).filter(JiraIssue.key == "P-9").scalar() == JiraService.SOURCE_JIRA
+
+
+def test_reconcile_keeps_live_keys_when_pages_shift_during_the_walk(db, jira):
+    keys = [f"P-{n}" for n in range(1, 26)]
+    for key in keys:
+        add_issue(db, key)
+    db.commit()
+    jira.keys.extend(keys)
+
+    def delete_in_jira(page):
+        # P-3 is deleted after the first page is served; offset paging would now skip P-11
+        if page == 1:
+            jira.keys.remove("P-3")
+
+    jira.on_page = delete_in_jira
+
+    # P-3 was seen before it went, so the next reconcile removes it; nothing live may be lost meanwhile
+    assert asyncio.run(JiraService.reconcile_deleted_issues("P", db)) == 0
+    assert {k for (k,) in db.query(JiraIssue.key)} == set(keys)
@@ -0,0 +1,60 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from src.models import Sprint, UserWorkload
+from src.services.sprint_service import SprintService
+from src.services.workload_ledger import WorkloadLedger
+from tests.conftest import add_assignment, add_issue, add_team
+
+
+def plan(db, **overrides):
+    request = dict(project_key="P", sprint_name="S1", team_name="alpha", db=db)
+    request.update(overrides)
+    return asyncio.run(SprintService.create_sprint_assignments(**request))
+
+
+def replan(db):
+    return asyncio.run(SprintService.replan_sprint(project_key="P", sprint_name="S1", team_name="alpha", db=db))
+
+
+def test_replan_without_jira_changes_is_empty(db):
+    add_team(db, "alpha")
+    for n in range(5):
+        add_issue(db, f"P-{n}", status="Done")
+    for n in range(5, 8):
+        add_issue(db, f"P-{n}")
+    db.commit()
+    plan(db)
+
+    for _ in range(2):
+        result = replan(db)
+        assert (result.changed_issues, result.completed_issues, result.changes) == (0, 0, [])
+
+
+def ledger(db):
+    return {(r.sprint_name, r.username): (r.story_points, r.estimated_days, r.open_issues) for r in db.scalars(select(UserWorkload))}
+
+
+def test_replan_leaves_existing_assignments_in_their_sprint(db):
+    add_team(db, "alpha")
+    # Assigned in Jira and already planned into an earlier sprint
+    held = add_issue(db, "P-0", assignee="alpha0")
+    add_assignment(db, "P-0", "alpha0", sprint_name="S0", story_points=5)
+    for n in range(1, 4):
+        add_issue(db, f"P-{n}")
+    db.flush()
+    WorkloadLedger.rebuild(db)
+    db.commit()
+    before = ledger(db)
+
+    plan(db)
+    held.updated_at = datetime.utcnow() + timedelta(minutes=1)
+    db.commit()
+    result = replan(db)
+
+    after = ledger(db)
+    assert {k: v for k, v in after.items() if k[0] == "S0"} == before
+    assert (db.scalars(select(Sprint).where(Sprint.issue_key == "P-0")).one().sprint_name, result.changes) == ("S0", [])
+    assert {k[0] for k in after} == {"S0", "S1"}